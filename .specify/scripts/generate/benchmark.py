@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark the PDF and PPTX generators on synthetic 00_meta documents.
+
+Each case runs the real generator script in a fresh process (so peak RSS is
+per case and includes imports and font loading) and records wall time, peak
+RSS and total output size. Results are written as JSON; pass a previous
+result file with --compare to flag regressions between releases.
+
+    python3 .specify/scripts/generate/benchmark.py --out bench.json
+    python3 .specify/scripts/generate/benchmark.py --quick --compare bench.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+GENERATORS = {
+    'pdf': SCRIPT_DIR / 'generate-00_meta-pdf.py',
+    'pptx': SCRIPT_DIR / 'generate-00_meta-pptx.py',
+}
+
+# (case, sizes): bullets and table rows are single documents, projects is a
+# --batch run over that many copies of a normal-sized 00_meta
+SIZES = {
+    'bullets': [10, 100, 1000, 5000],
+    'table-rows': [10, 100, 1000, 10000],
+    'projects': [1, 10, 100, 500],
+}
+QUICK_SIZES = {
+    'bullets': [10, 500],
+    'table-rows': [10, 500],
+    'projects': [1, 20],
+}
+
+STATUSES = ['規劃中', '進行中', '已完成', '延遲']
+LEVELS = ['高', '中', '低']
+
+def synth_meta(index=1, bullets=8, table_rows=5):
+    """A 00_meta document shaped like the template, scaled by bullets/table_rows"""
+    lines = [
+        "# 00_meta - 專案基本資料", "",
+        "**建立日期**: 2025-11-14",
+        "**最後更新**: 2025-11-14",
+        "**文件版本**: 1.0.0", "",
+        "## 專案總覽", "",
+        "### 專案識別資訊", "",
+        f"- **專案代號**: BENCH-{index:04d}",
+        f"- **專案名稱**: 效能測試專案 {index}",
+        "- **專案英文名稱**: Benchmark Project",
+        "- **發起單位**: 資訊處",
+        "- **專案類型**: 新系統開發", "",
+        "### 關鍵時程", "",
+        "| 里程碑 | 預定日期 | 狀態 | 備註 |",
+        "|--------|----------|------|------|",
+    ]
+    for i in range(table_rows):
+        lines.append(f"| 里程碑 {i + 1} | 2026-{i % 12 + 1:02d}-15 | {STATUSES[i % 4]} | "
+                     f"第 {i + 1} 項交付物，含 UAT 驗收與上線準備 (deliverable {i + 1}) |")
+    lines += ["", "## 專案背景", "", "### 問題陳述", ""]
+    for i in range(bullets):
+        lines.append(f"- 問題 {i + 1}：跨系統資料分散，人工彙整耗時且容易遺漏關鍵資訊 (issue {i + 1})")
+    lines += [
+        "", "## 風險與假設", "", "### 高階風險", "",
+        "| 風險 ID | 風險描述 | 機率 | 影響 | 應對策略 |",
+        "|---------|----------|------|------|----------|",
+        f"| R001 | 資料品質不佳導致模型準確度低 | {LEVELS[index % 3]} | 高 | 前期進行資料品質評估 |",
+        "| R002 | 跨系統資料整合複雜度高於預期 | 中 | 中 | 提前進行 POC |",
+        "", "## 優先順序與依賴", "", "### 專案優先級", "",
+        f"- **優先等級**: P{index % 3}",
+        "- **優先級理由**: 監理要求", "",
+    ]
+    return "\n".join(lines) + "\n"
+
+def build_inputs(workdir, case, size):
+    """Write the inputs for one case; return the generator arguments"""
+    if case == 'projects':
+        root = workdir / 'project'
+        for i in range(1, size + 1):
+            meta = root / f"{i:03d}-BENCH" / 'meta' / '00_meta.md'
+            meta.parent.mkdir(parents=True, exist_ok=True)
+            meta.write_text(synth_meta(i), encoding='utf-8')
+        return ['--batch', str(root)]
+    source = workdir / 'meta' / '00_meta.md'
+    source.parent.mkdir(parents=True, exist_ok=True)
+    kwargs = {'bullets': size} if case == 'bullets' else {'table_rows': size}
+    source.write_text(synth_meta(**kwargs), encoding='utf-8')
+    return [str(source)]
+
+def output_bytes(workdir, fmt):
+    return sum(p.stat().st_size for p in workdir.rglob(f'*.{fmt}'))
+
+def run_case(fmt, case, size, jobs=1, repeat=1):
+    """Run one generator case in a child process; min time, max RSS over repeats"""
+    best = None
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory(prefix='docgen-bench-') as tmp:
+            workdir = Path(tmp)
+            args = build_inputs(workdir, case, size)
+            env = dict(os.environ, DOCGEN_CACHE_DIR=str(workdir / 'cache'))
+            cmd = [sys.executable, str(GENERATORS[fmt]), *args, '--force', '--jobs', str(jobs)]
+            start = time.perf_counter()
+            proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, env=env)
+            _, status, usage = os.wait4(proc.pid, 0)
+            seconds = time.perf_counter() - start
+            stderr = proc.stderr.read().decode(errors='replace')
+            proc.stderr.close()
+            if os.waitstatus_to_exitcode(status) != 0:
+                raise RuntimeError(f"{fmt}/{case}/{size} failed:\n{stderr}")
+            # ru_maxrss is KiB on Linux, bytes on macOS
+            rss_kb = usage.ru_maxrss // 1024 if sys.platform == 'darwin' else usage.ru_maxrss
+            result = {
+                'name': f'{fmt}/{case}/{size}',
+                'format': fmt,
+                'case': case,
+                'size': size,
+                'seconds': round(seconds, 4),
+                'peak_rss_kb': rss_kb,
+                'output_bytes': output_bytes(workdir, fmt),
+            }
+        if best is None:
+            best = result
+        else:
+            best['seconds'] = min(best['seconds'], result['seconds'])
+            best['peak_rss_kb'] = max(best['peak_rss_kb'], result['peak_rss_kb'])
+    return best
+
+def environment():
+    info = {'python': platform.python_version(), 'platform': platform.platform(), 'cpus': os.cpu_count()}
+    for module in ('reportlab', 'pptx'):
+        try:
+            info[module] = getattr(__import__(module), '__version__', None) or __import__(module).Version
+        except ImportError:
+            info[module] = None
+    return info
+
+def compare(results, baseline_path, threshold):
+    """Print per-case changes against a baseline; return the regressed names"""
+    baseline = {r['name']: r for r in json.loads(Path(baseline_path).read_text(encoding='utf-8'))['results']}
+    regressions = []
+    print(f"\n{'case':<28}{'time':>10}{'rss':>10}{'size':>10}")
+    for r in results:
+        old = baseline.get(r['name'])
+        if not old:
+            print(f"{r['name']:<28}{'(new)':>10}")
+            continue
+        deltas = [(r[k] - old[k]) / old[k] * 100 if old[k] else 0.0
+                  for k in ('seconds', 'peak_rss_kb', 'output_bytes')]
+        flag = ' REGRESSION' if max(deltas) > threshold else ''
+        if flag:
+            regressions.append(r['name'])
+        print(f"{r['name']:<28}" + ''.join(f"{d:>+9.1f}%" for d in deltas) + flag)
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the PDF/PPTX generators on synthetic input")
+    parser.add_argument("--formats", default="pdf,pptx", help="Comma separated: pdf, pptx (default: both)")
+    parser.add_argument("--cases", default=",".join(SIZES), help=f"Comma separated: {', '.join(SIZES)}")
+    parser.add_argument("--quick", action="store_true", help="Small sizes only (smoke test)")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per case; keeps the fastest (default: 1)")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="--jobs passed to batch cases (default: 1)")
+    parser.add_argument("--out", metavar="PATH", help="Write JSON results to PATH")
+    parser.add_argument("--compare", metavar="BASELINE", help="Compare with a previous --out file")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="Percent increase counted as a regression (default: 10)")
+    args = parser.parse_args(argv)
+
+    formats = [f for f in args.formats.split(',') if f]
+    cases = [c for c in args.cases.split(',') if c]
+    for name in formats:
+        if name not in GENERATORS:
+            parser.error(f"unknown format: {name}")
+    for name in cases:
+        if name not in SIZES:
+            parser.error(f"unknown case: {name}")
+    sizes = QUICK_SIZES if args.quick else SIZES
+
+    results = []
+    for fmt in formats:
+        for case in cases:
+            for size in sizes[case]:
+                jobs = args.jobs if case == 'projects' else 1
+                result = run_case(fmt, case, size, jobs=jobs, repeat=args.repeat)
+                results.append(result)
+                print(f"{result['name']:<28}{result['seconds']:>9.2f}s"
+                      f"{result['peak_rss_kb'] / 1024:>9.1f} MB{result['output_bytes'] / 1024:>10.1f} KB",
+                      flush=True)
+
+    if args.out:
+        Path(args.out).write_text(
+            json.dumps({'environment': environment(), 'results': results}, ensure_ascii=False, indent=2),
+            encoding='utf-8',
+        )
+    if args.compare:
+        return 1 if compare(results, args.compare, args.threshold) else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""Bank Profile document generator: Markdown spec -> PDF / PPTX / DOCX / HTML.
+
+The Markdown parser turns a ``project/###-NAME/*/NN_*.md`` file into a
+document model following the ``.specify/templates`` section layout; the
+backends render that model::
+
+    from docgen import parse_file, render_pdf, render_pptx
+
+    doc = parse_file('project/001-NAME/meta/00_meta.md')
+    render_pdf(doc, 'out.pdf')
+    render_pptx(doc, 'out.pptx')
+
+``render_pdf``/``render_pptx``/``render_docx``/``render_html`` are resolved
+on first access, so importing the package does not import reportlab,
+python-pptx or python-docx. The ``generate-00_meta-{pdf,pptx}.py`` scripts
+are thin wrappers around ``docgen.cli``.
+"""
+
+from importlib import import_module
+
+from .model import BulletList, CodeBlock, Document, ListItem, Paragraph, Section, Table
+from .modelcache import load_document
+from .parser import parse_file, parse_markdown, strip_inline
+from .projects import DOC_TYPES, find_documents, find_projects
+
+__all__ = [
+    'BulletList',
+    'CodeBlock',
+    'Document',
+    'ListItem',
+    'Paragraph',
+    'Section',
+    'Table',
+    'load_document',
+    'parse_file',
+    'parse_markdown',
+    'strip_inline',
+    'DOC_TYPES',
+    'find_documents',
+    'find_projects',
+    'render_pdf',
+    'render_pptx',
+    'render_docx',
+    'render_html',
+]
+
+_BACKEND_FUNCTIONS = {
+    'render_pdf': 'pdfrender',
+    'render_pptx': 'pptxrender',
+    'render_docx': 'docxrender',
+    'render_html': 'htmlrender',
+}
+
+
+def __getattr__(name):
+    module = _BACKEND_FUNCTIONS.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    return getattr(import_module(f'.{module}', __name__), name)
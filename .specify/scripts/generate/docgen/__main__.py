@@ -0,0 +1,7 @@
+"""``python3 -m docgen {pdf,pptx} …`` (run from .specify/scripts/generate)."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
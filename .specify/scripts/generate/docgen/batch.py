@@ -0,0 +1,293 @@
+"""Batch driver shared by the generator scripts.
+
+Collects (source, output) jobs from the command line, renders them serially
+or over a process pool (``--jobs N``), and prints a report in job order so
+the output is the same regardless of which worker finished first.
+``run_formats`` does the same for several formats in one pass.
+"""
+
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from . import profiling
+from .buildcache import BuildManifest
+from .output import STDOUT
+from .projects import PROJECT_ROOT, default_output, export_path, find_documents, parse_doc_types
+
+
+@dataclass
+class JobResult:
+    source: str
+    output: str
+    seconds: float = 0.0
+    error: str = ''
+    warnings: list = field(default_factory=list)
+    profile: dict = None  # --profile: per-phase spans, see profiling.finish_job()
+
+    @property
+    def ok(self):
+        return not self.error
+
+
+# Warnings raised by the render function for the job currently running in
+# this process (see warn()); collected into JobResult.warnings.
+_job_warnings = []
+
+
+def warn(message):
+    """Record a non-fatal problem with the current job's output.
+
+    The output is still written, but it is not recorded as up to date in
+    the build manifest, so the next run renders it again.
+    """
+    _job_warnings.append(message)
+
+
+def add_batch_arguments(parser):
+    """Register the common source/--batch/--docs/--jobs options."""
+    parser.add_argument("sources", nargs="*", help="Markdown documents to render")
+    parser.add_argument("-o", "--output", help="Output path, or - for stdout (single source only)")
+    parser.add_argument(
+        "--batch", nargs="?", const=str(PROJECT_ROOT), metavar="PROJECT_ROOT",
+        help="Render every project under PROJECT_ROOT (default: project/) in one run"
+    )
+    parser.add_argument(
+        "--docs", default="00_meta",
+        help="Document types for --batch, comma separated or 'all' (default: 00_meta)"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None, metavar="N",
+        help="Render N documents (or formats of one document) in parallel "
+             "(0 = one per CPU core; default: 1, or one per requested format)"
+    )
+    parser.add_argument("--report", metavar="PATH", help="Write a JSON result report to PATH")
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Rebuild every output even if its inputs are unchanged since the last run"
+    )
+    parser.add_argument(
+        "--profile", nargs="?", const="docgen-profile", metavar="DIR",
+        help="Record per-phase and per-section timings, memory and output size into DIR "
+             "(default: docgen-profile/) as JSON and Chrome trace events; combine with --force "
+             "to profile up-to-date documents too"
+    )
+
+
+def collect_jobs(parser, args, ext, allow_empty=False):
+    """Turn parsed arguments into an ordered list of (source, output) paths.
+
+    Finding nothing is a usage error unless ``allow_empty`` (``--watch``
+    keeps running while the last project is renamed or removed).
+    """
+    if args.output and len(args.sources) != 1:
+        parser.error("--output requires exactly one source")
+    if args.jobs < 0:
+        parser.error("--jobs must be >= 0")
+    if args.output == STDOUT and args.batch:
+        parser.error("--output - (stdout) cannot be combined with --batch")
+    jobs = [(Path(src), Path(args.output) if args.output else default_output(src, ext))
+            for src in args.sources]
+    if args.batch:
+        try:
+            doc_types = parse_doc_types(args.docs)
+        except ValueError as e:
+            parser.error(str(e))
+        jobs += [(source, export_path(project_dir, doc_type, ext))
+                 for project_dir, doc_type, source in find_documents(args.batch, doc_types)]
+    if not jobs and not allow_empty:
+        parser.error("nothing to render: pass source files or --batch")
+    return jobs
+
+
+def _run_one(render, source, output):
+    _job_warnings.clear()
+    token = profiling.start_job(source)
+    start = time.perf_counter()
+    try:
+        render(source, output)
+    except Exception as e:
+        return JobResult(str(source), str(output), time.perf_counter() - start, f"{type(e).__name__}: {e}",
+                         profile=profiling.finish_job(token, output))
+    return JobResult(str(source), str(output), time.perf_counter() - start, warnings=list(_job_warnings),
+                     profile=profiling.finish_job(token, output))
+
+
+def run_jobs(jobs, render, workers=1, initializer=None, prepare=None):
+    """Render every (source, output) job and return results in job order.
+
+    ``render(source, output)`` must be a module-level function so it can be
+    sent to worker processes; a list gives one per job. ``initializer`` runs
+    once per worker (or once in-process when serial) to do the expensive
+    warm-up: font registration, style construction, backend imports. With a
+    pool, ``prepare(source)`` runs in this process just before a source's
+    jobs are queued.
+    """
+    renders = render if isinstance(render, list) else [render] * len(jobs)
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, len(jobs))
+    if workers <= 1:
+        if initializer:
+            initializer()
+        return [_run_one(render, source, output) for render, (source, output) in zip(renders, jobs)]
+
+    def sources():
+        # A generator, so workers start on the first sources while later ones are prepared
+        previous = None
+        for source, _ in jobs:
+            if prepare and source != previous:
+                prepare(source)
+            previous = source
+            yield source
+
+    # Small chunks keep the pool balanced when document sizes vary a lot
+    chunksize = max(1, len(jobs) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer) as pool:
+        return list(pool.map(
+            _run_one,
+            renders,
+            sources(),
+            [output for _, output in jobs],
+            chunksize=chunksize,
+        ))
+
+
+def report_data(results, skipped=()):
+    """The ``--report`` JSON of one format."""
+    return {
+        "total": len(results),
+        "failed": sum(1 for r in results if not r.ok),
+        "skipped": len(skipped),
+        "results": [{k: v for k, v in asdict(r).items() if k != "profile"} for r in results],
+        "up_to_date": [{"source": str(s), "output": str(o)} for s, o in skipped],
+    }
+
+
+def write_report(report_path, data):
+    Path(report_path).write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def report(results, label, report_path=None, skipped=()):
+    """Print per-job lines and a summary; return the process exit code."""
+    for result in results:
+        if result.ok:
+            # Keep stdout clean when the document itself went there (-o -)
+            print(f"{label} generated successfully: {result.output}",
+                  file=sys.stderr if result.output == STDOUT else sys.stdout)
+            for message in result.warnings:
+                print(f"Warning: {result.source}: {message}", file=sys.stderr)
+        else:
+            print(f"Error: failed to render {result.source}: {result.error}", file=sys.stderr)
+
+    failures = sum(1 for r in results if not r.ok)
+    if len(results) > 1 or skipped:
+        print(f"Rendered {len(results) - failures}/{len(results)} documents"
+              + (f", {len(skipped)} up to date" if skipped else ""))
+
+    if report_path:
+        write_report(report_path, report_data(results, skipped))
+    return 1 if failures else 0
+
+
+def run_batch(parser, args, ext, render, label, generator_key, initializer=None, jobs=None):
+    """Collect jobs, skip unchanged outputs, render the rest and report.
+
+    ``generator_key`` comes from ``buildcache.generator_fingerprint`` and
+    covers everything besides the source that affects the output. ``jobs``
+    overrides the (source, output) list taken from the command line.
+    """
+    if jobs is None:
+        jobs = collect_jobs(parser, args, ext)
+    if args.profile:
+        # Set before the pool starts so workers inherit it
+        os.environ[profiling.ENV_VAR] = args.profile
+    manifest = BuildManifest(ext, generator_key)
+    stale, fresh = manifest.partition(jobs, force=args.force)
+
+    results = run_jobs(stale, render, workers=args.jobs, initializer=initializer) if stale else []
+
+    manifest.record(results)
+    manifest.prune()
+    manifest.save()
+    status = report(results, label, args.report, skipped=fresh)
+    if args.profile:
+        profiling.write_reports(results, ext, args.profile)
+    return status
+
+
+@dataclass(frozen=True)
+class InitAll:
+    """Picklable per-worker initializer that runs several (one per format)."""
+    initializers: tuple
+
+    def __call__(self):
+        for initializer in self.initializers:
+            if initializer:
+                initializer()
+
+
+def preload(source):
+    """Parse a document and render its diagrams into the shared caches."""
+    from .mermaid import render_diagrams
+    from .modelcache import load_document
+    try:
+        render_diagrams(load_document(source).code_blocks('mermaid'))
+    except (OSError, UnicodeDecodeError):
+        pass  # the format writers report it
+
+
+def run_formats(parser, args, targets):
+    """``run_batch`` for several formats in one pass.
+
+    ``targets`` is a list of (backend, generator_key, render, initializer)
+    tuples, one per format. The stale outputs of a document are queued
+    together, so its format writers run side by side on different workers,
+    every one of which is warmed up for all the formats. With a pool the
+    document is parsed and its diagrams rendered once, here, before its
+    writers are queued; the writers then read the parse cache
+    (``docgen/modelcache.py``) and the diagram cache instead of racing to
+    fill them. Serially, the in-memory parse cache serves every writer after
+    the first. Manifests and profiles stay per format; ``--report`` writes
+    one file with a key per format (``{"pdf": {...}, "pptx": {...}}``) and
+    ``-o`` gets each format's extension.
+    """
+    if args.profile:
+        os.environ[profiling.ENV_VAR] = args.profile
+    plans = []
+    for backend, key, render, _ in targets:
+        manifest = BuildManifest(backend.ext, key)
+        jobs = collect_jobs(parser, args, backend.ext)
+        if args.output:
+            jobs = [(source, output.with_suffix(f'.{backend.ext}')) for source, output in jobs]  # -o doc -> doc.pdf, doc.pptx, ...
+        stale, fresh = manifest.partition(jobs, force=args.force)
+        plans.append((backend, manifest, stale, fresh, render))
+
+    order = {}
+    units = []  # (document index, format index, source, output)
+    for index, (_, _, stale, _, _) in enumerate(plans):
+        for source, output in stale:
+            units.append((order.setdefault(source, len(order)), index, source, output))
+    units.sort(key=lambda unit: unit[:2])
+    results = run_jobs([(source, output) for _, _, source, output in units],
+                       [plans[index][4] for _, index, _, _ in units],
+                       workers=args.jobs, initializer=InitAll(tuple(t[3] for t in targets)),
+                       prepare=preload) if units else []
+
+    status = 0
+    reports = {}
+    for index, (backend, manifest, _, fresh, _) in enumerate(plans):
+        format_results = [result for unit, result in zip(units, results) if unit[1] == index]
+        manifest.record(format_results)
+        manifest.prune()
+        manifest.save()
+        status |= report(format_results, backend.label, skipped=fresh)
+        reports[backend.ext] = report_data(format_results, fresh)
+        if args.profile:
+            profiling.write_reports(format_results, backend.ext, args.profile)
+    if args.report:
+        write_report(args.report, reports)
+    return status
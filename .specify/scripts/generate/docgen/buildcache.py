@@ -0,0 +1,124 @@
+"""Content-hash build manifest for incremental PDF/PPTX regeneration.
+
+Every output file is recorded with a key hashed from everything that can
+change its bytes: the source Markdown, the generator script (style constants,
+``ParagraphStyle`` definitions, layout code), the ``docgen`` package, the
+rendering library version and the font files in use. A later run skips any
+output whose key is unchanged and whose file still exists.
+
+Manifests live in ``<CACHE_DIR>/<format>-manifest.json`` (``.temp/docgen`` by
+default), one per format so the PDF and PPTX generators can run at the same
+time.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from .projects import CACHE_DIR
+
+MANIFEST_DIR = CACHE_DIR
+MANIFEST_VERSION = 1
+PACKAGE_DIR = Path(__file__).resolve().parent
+
+
+def _file_digest(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _stat_token(path):
+    """Cheap identity for large binary inputs (fonts) without reading them."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return f'{path}:missing'
+    return f'{path}:{st.st_size}:{st.st_mtime_ns}'
+
+
+def generator_fingerprint(script, extra=(), stat_files=()):
+    """Hash of the generator itself.
+
+    ``script`` is the generator's ``__file__``; ``extra`` are strings such as
+    library versions; ``stat_files`` are large files (fonts) identified by
+    path, size and mtime instead of content.
+    """
+    h = hashlib.sha256()
+    h.update(f'manifest-v{MANIFEST_VERSION}\0'.encode())
+    for path in [Path(script)] + sorted(PACKAGE_DIR.glob('*.py')):
+        h.update(path.name.encode() + b'\0' + _file_digest(path).encode() + b'\0')
+    for item in extra:
+        h.update(str(item).encode() + b'\0')
+    for path in stat_files:
+        h.update(_stat_token(path).encode() + b'\0')
+    return h.hexdigest()
+
+
+class BuildManifest:
+    """Output path -> {key, source} records for one output format."""
+
+    def __init__(self, fmt, generator_key, path=None):
+        self.path = Path(path) if path else MANIFEST_DIR / f'{fmt}-manifest.json'
+        self.generator_key = generator_key
+        self.entries = {}
+        self._pending = {}
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            if data.get('version') == MANIFEST_VERSION:
+                self.entries = data.get('entries', {})
+        except (OSError, ValueError):
+            pass
+
+    def key(self, source):
+        h = hashlib.sha256(self.generator_key.encode())
+        h.update(_file_digest(source).encode())
+        return h.hexdigest()
+
+    def partition(self, jobs, force=False):
+        """Split jobs into (stale, up_to_date) and remember the keys of stale ones."""
+        self._pending = {}
+        stale, fresh = [], []
+        for source, output in jobs:
+            try:
+                key = self.key(source)
+            except OSError:
+                stale.append((source, output))  # let the render report the error
+                continue
+            entry = self.entries.get(os.path.abspath(output))
+            if not force and entry and entry.get('key') == key and Path(output).exists():
+                fresh.append((source, output))
+            else:
+                self._pending[os.path.abspath(output)] = (os.path.abspath(source), key)
+                stale.append((source, output))
+        return stale, fresh
+
+    def record(self, results):
+        """Store keys for cleanly rendered outputs; forget failed or incomplete ones."""
+        for result in results:
+            output = os.path.abspath(result.output)
+            pending = self._pending.get(output)
+            if pending is None:
+                continue
+            if result.ok and not result.warnings:
+                self.entries[output] = {'source': pending[0], 'key': pending[1]}
+            else:
+                self.entries.pop(output, None)
+
+    def prune(self):
+        """Drop entries whose source or output no longer exists (deleted projects)."""
+        gone = [out for out, entry in self.entries.items()
+                if not Path(entry['source']).exists() or not Path(out).exists()]
+        for out in gone:
+            del self.entries[out]
+        return len(gone)
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(f'.tmp{os.getpid()}')
+        tmp.write_text(json.dumps({'version': MANIFEST_VERSION, 'entries': self.entries},
+                                  ensure_ascii=False, indent=1, sort_keys=True), encoding='utf-8')
+        os.replace(tmp, self.path)
@@ -0,0 +1,167 @@
+"""Command line front end shared by the generator scripts.
+
+Only the backend a run actually renders with is imported, and only once
+there is something to render: ``--help``, argument errors and runs where
+every output is up to date never load reportlab, python-pptx or
+python-docx. Worker processes import the backend themselves on their first
+job.
+
+Several formats in one run (``python3 -m docgen pdf,pptx,docx,html``) are
+rendered in one pass (``batch.run_formats``): each document is loaded once
+and its format writers run side by side in a pool whose workers have every
+requested backend warmed up.
+"""
+
+import argparse
+import os
+import sys
+from dataclasses import dataclass
+from importlib import import_module
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+from .batch import add_batch_arguments, run_batch, run_formats
+from .buildcache import PACKAGE_DIR, generator_fingerprint
+from .mermaid import join_run, new_run
+from .output import STDOUT
+from .pdfparallel import ENV_VAR as SECTION_JOBS_ENV
+from .reproducible import ENV_VAR as REPRODUCIBLE_ENV, fingerprint as reproducible_fingerprint
+
+
+@dataclass(frozen=True)
+class Backend:
+    ext: str
+    label: str
+    module: str          # docgen submodule with render() and init_worker()
+    distribution: str    # library whose version is part of the build key (None: stdlib only)
+
+
+BACKENDS = {
+    'pdf': Backend('pdf', 'PDF document', 'pdfrender', 'reportlab'),
+    'pptx': Backend('pptx', 'PPTX presentation', 'pptxrender', 'python-pptx'),
+    'docx': Backend('docx', 'DOCX document', 'docxrender', 'python-docx'),
+    'html': Backend('html', 'HTML page', 'htmlrender', None),
+}
+
+
+@dataclass(frozen=True)
+class LazyRender:
+    """Picklable ``render(source, output)`` that imports its backend on first use."""
+    module: str
+
+    def __call__(self, source, output):
+        return import_module(f'{__package__}.{self.module}').render(source, output)
+
+
+@dataclass(frozen=True)
+class LazyInit:
+    """Picklable per-worker initializer: the backend's init_worker(), in the parent's Mermaid run."""
+    module: str
+    mermaid_run: str = None
+
+    def __call__(self):
+        if self.mermaid_run:
+            join_run(self.mermaid_run)  # a failed diagram is not retried by every worker
+        import_module(f'{__package__}.{self.module}').init_worker()
+
+
+def _library_version(distribution):
+    try:
+        return version(distribution)
+    except PackageNotFoundError:
+        return 'missing'
+
+
+def is_available(backend):
+    """True when the backend's library is installed."""
+    return backend.distribution is None or _library_version(backend.distribution) != 'missing'
+
+
+def generator_key(backend):
+    """Build-manifest key for a backend, computed without importing it."""
+    extra = [reproducible_fingerprint()]
+    if backend.distribution:
+        extra.append(_library_version(backend.distribution))
+    stat_files = []
+    if backend.ext == 'pdf':
+        from .fonts import font_files
+        stat_files = font_files()
+    return generator_fingerprint(PACKAGE_DIR / f'{backend.module}.py', extra=extra, stat_files=stat_files)
+
+
+def parse_formats(value):
+    """'pdf', 'pptx', 'docx', 'html' or a comma-separated combination -> list of format names."""
+    formats = [f.strip() for f in value.split(',') if f.strip()]
+    unknown = [f for f in formats if f not in BACKENDS]
+    if unknown or not formats:
+        raise argparse.ArgumentTypeError(
+            f"unknown format: {', '.join(unknown) or value!r} (choose from {', '.join(sorted(BACKENDS))})")
+    return list(dict.fromkeys(formats))
+
+
+def build_parser(fmt=None):
+    if fmt:
+        parser = argparse.ArgumentParser(
+            description=f"Render Bank Profile Markdown documents (00_meta … 90_audit) as {fmt.upper()}"
+        )
+    else:
+        parser = argparse.ArgumentParser(
+            prog='docgen', description="Render Bank Profile Markdown documents as PDF, PPTX, DOCX and/or HTML"
+        )
+        parser.add_argument("format", type=parse_formats,
+                            help="Output format(s): pdf, pptx, docx, html or a combination such as pdf,pptx,docx")
+    add_batch_arguments(parser)
+    if fmt in (None, 'pdf'):
+        parser.add_argument(
+            "--section-jobs", type=int, default=None, metavar="N",
+            help="PDF: build each '##' section of a document in its own process and merge them "
+                 "(needs pypdf; 0 = one per CPU core)"
+        )
+    parser.add_argument(
+        "--reproducible", action="store_true",
+        help="Byte-identical output for identical input: fixed timestamps (SOURCE_DATE_EPOCH, "
+             "default 2000-01-01), content-derived PDF IDs, normalized PPTX/DOCX zips"
+    )
+    parser.add_argument(
+        "--watch", action="store_true",
+        help="Stay running and re-render documents whenever their source changes"
+    )
+    parser.add_argument(
+        "--debounce", type=float, default=0.2, metavar="SECONDS",
+        help="With --watch: wait until files are quiet this long before rendering (default: 0.2)"
+    )
+    return parser
+
+
+def main(argv=None, fmt=None):
+    """Entry point; ``fmt`` fixes the format for the per-format scripts."""
+    parser = build_parser(fmt)
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+    backends = [BACKENDS[name] for name in ([fmt] if fmt else args.format)]
+    for backend in backends:
+        if not is_available(backend):
+            parser.error(f"{backend.ext} output needs {backend.distribution} (pip install {backend.distribution})")
+    if args.output == STDOUT and (len(backends) > 1 or args.watch):
+        parser.error("--output - (stdout) takes a single format and cannot be used with --watch")
+    section_jobs = getattr(args, 'section_jobs', None)
+    if section_jobs is not None:
+        if args.jobs not in (None, 1) and section_jobs != 1:
+            parser.error("use either --jobs (documents in parallel) or --section-jobs (sections in parallel)")
+        os.environ[SECTION_JOBS_ENV] = str(section_jobs)
+    if args.jobs is None:
+        # Several formats: one worker per format writer, as far as the cores go
+        args.jobs = 1 if section_jobs not in (None, 1) else min(len(backends), os.cpu_count() or 1)
+    if args.reproducible:
+        os.environ[REPRODUCIBLE_ENV] = '1'  # inherited by worker processes
+    run = new_run()  # Mermaid failures are shared by the workers of this run
+    targets = [(backend, generator_key(backend), LazyRender(backend.module), LazyInit(backend.module, run))
+               for backend in backends]
+
+    if args.watch:
+        from .watch import watch
+        return watch(parser, args, targets, debounce=args.debounce)
+
+    if len(targets) > 1:
+        return run_formats(parser, args, targets)
+    backend, key, render, initializer = targets[0]
+    return run_batch(parser, args, backend.ext, render, backend.label, key, initializer=initializer)
@@ -0,0 +1,253 @@
+"""DOCX backend: document model -> Word document (python-docx).
+
+``render_docx(doc, out)`` is the library entry point; ``render(source,
+output)`` and ``init_worker()`` are what the batch driver runs per job and
+per worker process. The layout follows the PDF: a title page, each ``##``
+section on a new page, "**key**: value" lists as two-column tables and
+Mermaid diagrams as pictures from the shared diagram cache. Colours and
+sizes come from ``docgen/theme.py`` and the East Asian font is the one the
+PDF embeds (``docgen/fonts.py``).
+
+python-docx supplies the package (styles, relationships, pictures), but the
+body is written as WordprocessingML text and parsed in one go: its
+per-paragraph and per-cell API resolves styles and table grids on every
+call and takes tens of seconds on a table with ten thousand rows.
+
+python-docx is optional (``pip install python-docx``) and imported here
+only, so PDF/PPTX runs never load it.
+"""
+
+import io
+import re
+from xml.sax.saxutils import escape
+
+from docx import Document as WordDocument
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.opc.oxml import serialize_part_xml
+from docx.oxml import parse_xml
+from docx.oxml.ns import qn
+from docx.shared import Inches, Pt, RGBColor
+from lxml import etree
+
+from .fonts import font_family
+from .mermaid import fit, image_size, render_diagrams
+from .model import BulletList, CodeBlock, Paragraph, Table
+from .modelcache import load_document
+from .output import open_output
+from .parser import strip_inline
+from .profiling import end_section, phase, section as profile_section
+from .reproducible import save_package
+from .theme import DOCUMENT_FONT_SIZES, PALETTE, heading_style
+
+BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+
+TWIPS_PER_INCH = 1440
+PAGE_MARGIN = Inches(1)
+CONTENT_WIDTH = Inches(6.27)    # A4 less the margins
+DIAGRAM_MAX_HEIGHT = Inches(8)
+KEY_COLUMN = 0.3                # share of the width for the key column of key/value tables
+CODE_FONT = 'Consolas'
+
+# Style ids (and names) in python-docx's default template
+STYLE_IDS = {'title': 'Title', 'h1': 'Heading1', 'h2': 'Heading2', 'h3': 'Heading3'}
+STYLE_NAMES = {'Title': 'Title', 'Heading1': 'Heading 1', 'Heading2': 'Heading 2', 'Heading3': 'Heading 3'}
+LIST_STYLES = {(False, 0): 'ListBullet', (False, 1): 'ListBullet2',
+               (True, 0): 'ListNumber', (True, 1): 'ListNumber2'}
+
+PAGE_BREAK = '<w:p><w:r><w:br w:type="page"/></w:r></w:p>'
+EMPTY_PARAGRAPH = '<w:p/>'
+
+_template = None  # styled empty document (bytes), set by init_worker()
+
+
+def _set_font(style, size, color='text', bold=None):
+    font = style.font
+    font.size = Pt(size)
+    font.color.rgb = RGBColor.from_string(PALETTE[color])
+    if bold is not None:
+        font.bold = bold
+    font.name = font_family()
+    # East Asian text uses its own font slot; without it Word picks a Latin font
+    style.element.get_or_add_rPr().get_or_add_rFonts().set(qn('w:eastAsia'), font_family())
+
+
+def build_template():
+    """Empty A4 document with the theme's styles, serialized once per process."""
+    word = WordDocument()
+    section = word.sections[0]
+    section.page_width, section.page_height = Inches(8.27), Inches(11.69)
+    section.left_margin = section.right_margin = PAGE_MARGIN
+    section.top_margin = section.bottom_margin = PAGE_MARGIN
+
+    styles = word.styles
+    _set_font(styles['Normal'], DOCUMENT_FONT_SIZES['body'])
+    _set_font(styles['Title'], DOCUMENT_FONT_SIZES['title'], 'primary', bold=True)
+    styles['Title'].paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    for name, color in (('h1', 'primary'), ('h2', 'secondary'), ('h3', 'accent')):
+        _set_font(styles[STYLE_NAMES[STYLE_IDS[name]]], DOCUMENT_FONT_SIZES[name], color, bold=True)
+    buffer = io.BytesIO()
+    word.save(buffer)
+    return buffer.getvalue()
+
+
+def init_worker():
+    """Per-process warm-up: the styled template is built once, not per document."""
+    global _template
+    with phase('template'):
+        _template = build_template()
+
+
+def runs_xml(text, bold=False, run_props=''):
+    """<w:r> elements for inline Markdown: "**bold**" spans bold, line breaks kept."""
+    runs = []
+    for n, part in enumerate(BOLD_RE.split(text)):
+        props = run_props + ('<w:b/>' if bold or n % 2 else '')
+        props = f'<w:rPr>{props}</w:rPr>' if props else ''
+        lines = strip_inline(part).split('\n')
+        for m, line in enumerate(lines):
+            brk = '<w:br/>' if m < len(lines) - 1 else ''
+            if line or brk:
+                runs.append(f'<w:r>{props}<w:t xml:space="preserve">{escape(line)}</w:t>{brk}</w:r>')
+    return ''.join(runs)
+
+
+def paragraph_xml(text, style=None, bold=False, align=None, run_props=''):
+    """One <w:p>, optionally with a paragraph style id and alignment."""
+    props = (f'<w:pStyle w:val="{style}"/>' if style else '') + (f'<w:jc w:val="{align}"/>' if align else '')
+    return f'<w:p>{f"<w:pPr>{props}</w:pPr>" if props else ""}{runs_xml(text, bold, run_props)}</w:p>'
+
+
+def _cell_xml(text, width, shaded=False):
+    shading = f'<w:shd w:val="clear" w:color="auto" w:fill="{PALETTE["header_fill"]}"/>' if shaded else ''
+    return (f'<w:tc><w:tcPr><w:tcW w:w="{width}" w:type="dxa"/>{shading}</w:tcPr>'
+            f'{paragraph_xml(text, bold=shaded)}</w:tc>')
+
+
+def table_xml(headers, rows, key_column=False):
+    """Grid table; a non-blank header row is shaded and repeats on every page."""
+    ncols = max([len(headers)] + [len(row) for row in rows])
+    total = int(CONTENT_WIDTH.inches * TWIPS_PER_INCH)
+    if key_column and ncols == 2:
+        widths = [int(total * KEY_COLUMN), total - int(total * KEY_COLUMN)]
+    else:
+        widths = [total // ncols] * ncols
+
+    def row_xml(cells, header=False):
+        cells = list(cells) + [''] * (ncols - len(cells))
+        props = '<w:trPr><w:tblHeader/></w:trPr>' if header else ''
+        return f'<w:tr>{props}' + ''.join(
+            _cell_xml(text, width, shaded=header or (key_column and n == 0))
+            for n, (text, width) in enumerate(zip(cells, widths))) + '</w:tr>'
+
+    parts = ['<w:tbl><w:tblPr><w:tblStyle w:val="TableGrid"/><w:tblW w:w="0" w:type="auto"/>'
+             '<w:tblLook w:val="04A0" w:firstRow="1" w:lastRow="0" w:firstColumn="1" w:lastColumn="0" '
+             'w:noHBand="0" w:noVBand="1"/></w:tblPr><w:tblGrid>',
+             ''.join(f'<w:gridCol w:w="{width}"/>' for width in widths), '</w:tblGrid>']
+    if any(cell.strip() for cell in headers):
+        parts.append(row_xml(headers, header=True))
+    parts.extend(row_xml(row) for row in rows)
+    parts.append('</w:tbl>')
+    return ''.join(parts)
+
+
+def block_xml(block):
+    """WordprocessingML for one document block (diagrams are added separately)."""
+    if isinstance(block, Paragraph):
+        if block.is_label():
+            return paragraph_xml(strip_inline(block.text).rstrip(':：').strip(), STYLE_IDS['h3'])
+        return paragraph_xml(block.text)
+
+    if isinstance(block, BulletList):
+        rows = block.key_value_rows()
+        if rows:
+            return table_xml(['', ''], rows, key_column=True) + EMPTY_PARAGRAPH
+        return ''.join(paragraph_xml(item.text, LIST_STYLES[item.ordered, min(item.level, 1)])
+                       for item in block.items)
+
+    if isinstance(block, Table):
+        return table_xml(block.headers, block.rows) + EMPTY_PARAGRAPH
+
+    if isinstance(block, CodeBlock) and block.language != 'mermaid':
+        props = (f'<w:rFonts w:ascii="{CODE_FONT}" w:hAnsi="{CODE_FONT}"/>'
+                 f'<w:sz w:val="{DOCUMENT_FONT_SIZES["code"] * 2}"/>')  # half-points
+        return paragraph_xml(block.source.rstrip('\n'), run_props=props)
+    return ''
+
+
+class BodyWriter:
+    """Collects a document body as WordprocessingML text and parses it once.
+
+    Elements parsed separately and moved into the document tree cost time
+    that grows faster than their size (lxml re-homes every node), so the
+    whole ``document.xml`` is rebuilt in one parse instead.
+    """
+
+    def __init__(self, word):
+        self.part = word.part
+        self.chunks = []
+
+    def add(self, xml):
+        if xml:
+            self.chunks.append(xml)
+
+    def add_diagram(self, path):
+        """Mermaid PNG scaled down to the text width (never enlarged)."""
+        width, height = fit(image_size(path), CONTENT_WIDTH.pt, DIAGRAM_MAX_HEIGHT.pt, max_scale=1)
+        inline = self.part.new_pic_inline(str(path), Pt(width), Pt(height))  # adds the image part
+        self.chunks.append(f'<w:p><w:r><w:drawing>{etree.tostring(inline, encoding="unicode")}</w:drawing></w:r></w:p>')
+
+    def finish(self):
+        """The python-docx Document with the collected body (before the template's section properties)."""
+        xml = serialize_part_xml(self.part.element)
+        cut = xml.rindex(b'<w:sectPr')
+        self.part._element = parse_xml(xml[:cut] + ''.join(self.chunks).encode('utf-8') + xml[cut:])
+        self.chunks = []
+        return self.part.document
+
+
+def build_document(doc):
+    """Build the Word document for a parsed Document."""
+    if _template is None:
+        init_worker()
+    with phase('diagrams'):
+        diagrams = render_diagrams(doc.code_blocks('mermaid'))
+
+    body = BodyWriter(WordDocument(io.BytesIO(_template)))
+    body.add(paragraph_xml(strip_inline(doc.lookup('專案名稱')) or doc.subtitle or doc.title, STYLE_IDS['title']))
+    body.add(paragraph_xml(f"{doc.subtitle} ({doc.doc_type})" if doc.subtitle else doc.doc_type, STYLE_IDS['title']))
+    info = [f"**{key}:** {doc.meta[key]}" for key in ('建立日期', '文件版本') if doc.meta.get(key)]
+    if info:
+        body.add(paragraph_xml(' | '.join(info), align='center'))
+
+    for section in doc.sections:
+        profile_section(section.title or doc.title)
+        if section.level == 2:
+            body.add(PAGE_BREAK)
+        if section.title:
+            body.add(paragraph_xml(section.title, STYLE_IDS[heading_style(section.level)]))
+        for block in section.blocks:
+            if isinstance(block, CodeBlock) and block.language == 'mermaid':
+                if diagrams.get(block.source):
+                    body.add_diagram(diagrams[block.source])
+                # Diagrams that could not be rendered are left out
+            else:
+                body.add(block_xml(block))
+    end_section()
+    with phase('parse-xml'):
+        return body.finish()
+
+
+def render_docx(doc, out):
+    """Render a parsed Document as DOCX to out: a path (replaced atomically), '-' for stdout or a binary stream."""
+    with phase('build'):
+        word = build_document(doc)
+    with phase('save'), open_output(out) as target:
+        save_package(word, target)
+    return out
+
+
+def render(source, output):
+    """Parse one Markdown document and save it as DOCX (batch job entry point)."""
+    with phase('parse'):
+        model = load_document(source)
+    return render_docx(model, output)
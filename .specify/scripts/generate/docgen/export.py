@@ -0,0 +1,190 @@
+"""Export every project's milestone, risk and glossary tables as data files.
+
+    python3 -m docgen.export                      # -> project/export/data/{milestones,risks,terms}.csv (+ .parquet)
+    python3 -m docgen.export --format parquet --root /path/to/project -o /tmp/data
+
+For 監理申報資料匯出 (regulatory reporting), compliance needs the tables of
+the 00_meta documents as rows, not as PDF text. The rows are the ones
+``docgen/metadata.py`` reads from the same ``Table`` blocks the PDF and PPTX
+backends lay out, so nothing is rendered:
+
+- ``milestones``: 里程碑, 預定日期 (ISO), 狀態, 備註;
+- ``risks``: R001 … with 描述, 機率, 影響, 風險等級, 應對策略, 負責人;
+- ``terms``: 名詞, 全名, 說明.
+
+Every row starts with the project directory, its 專案代號 and the row's
+position in its table. One pass over the projects feeds all three tables;
+rows are buffered and written ``--batch-rows`` at a time (``writerows`` for
+CSV, one columnar record batch per write for Parquet), and each file
+replaces the previous export only once complete (``docgen/output.py``).
+
+CSV is UTF-8 with a byte order mark, so Excel shows the Chinese text.
+Parquet needs pyarrow (``pip install pyarrow``); without it the default is
+CSV only.
+"""
+
+import argparse
+import csv
+import sys
+import time
+from contextlib import ExitStack
+from dataclasses import fields
+from importlib.metadata import PackageNotFoundError, version
+from operator import attrgetter
+from pathlib import Path
+
+from .metadata import Milestone, Risk, Term, extract_meta
+from .modelcache import load_document
+from .output import atomic_path
+from .projects import PROJECT_ROOT, find_documents
+
+BATCH_ROWS = 10_000
+KEY_COLUMNS = ('project', 'code', 'seq')
+
+# Table name -> ProjectMeta attribute holding its rows (the same name) and row type
+TABLES = {
+    'milestones': Milestone,
+    'risks': Risk,
+    'terms': Term,
+}
+FORMATS = ('csv', 'parquet')
+
+
+def columns(table):
+    """Column names of an exported table."""
+    return KEY_COLUMNS + tuple(f.name for f in fields(TABLES[table]))
+
+
+def parquet_available():
+    try:
+        version('pyarrow')
+    except PackageNotFoundError:
+        return False
+    return True
+
+
+def parse_export_formats(value):
+    """'csv', 'parquet' or 'csv,parquet' -> tuple of format names."""
+    formats = tuple(dict.fromkeys(f.strip() for f in value.split(',') if f.strip()))
+    unknown = [f for f in formats if f not in FORMATS]
+    if unknown or not formats:
+        raise argparse.ArgumentTypeError(
+            f"unknown format: {', '.join(unknown) or value!r} (choose from {', '.join(FORMATS)})")
+    return formats
+
+
+class CsvTable:
+    """One CSV file with a header row."""
+
+    def __init__(self, path, names):
+        self.file = open(path, 'w', encoding='utf-8-sig', newline='')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(names)
+
+    def write(self, rows):
+        self.writer.writerows(rows)
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetTable:
+    """One Parquet file; every write() becomes a row group."""
+
+    def __init__(self, path, names):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.pa = pa
+        self.schema = pa.schema([(name, pa.int32() if name == 'seq' else pa.string()) for name in names])
+        self.writer = pq.ParquetWriter(str(path), self.schema, compression='zstd')
+
+    def write(self, rows):
+        arrays = [self.pa.array(values, type=column.type) for values, column in zip(zip(*rows), self.schema)]
+        self.writer.write_table(self.pa.Table.from_arrays(arrays, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+WRITERS = {'csv': CsvTable, 'parquet': ParquetTable}
+
+
+def export(root=PROJECT_ROOT, out_dir=None, formats=('csv',), batch_rows=BATCH_ROWS):
+    """Write the tables of every project under root to out_dir; returns counts and failures."""
+    out_dir = Path(out_dir or Path(root) / 'export' / 'data')
+    getters = {table: attrgetter(*(f.name for f in fields(row_type))) for table, row_type in TABLES.items()}
+    stats = {'projects': 0, **{table: 0 for table in TABLES}, 'failed': []}
+
+    with ExitStack() as stack:
+        writers = {table: [] for table in TABLES}
+        for table in TABLES:
+            for fmt in formats:
+                # Entered before the writer's close(), so it is closed before the rename
+                tmp = stack.enter_context(atomic_path(out_dir / f'{table}.{fmt}'))
+                writer = WRITERS[fmt](tmp, columns(table))
+                stack.callback(writer.close)
+                writers[table].append(writer)
+
+        pending = {table: [] for table in TABLES}
+
+        def flush(table):
+            for writer in writers[table]:
+                writer.write(pending[table])
+            stats[table] += len(pending[table])
+            pending[table] = []
+
+        for project_dir, _, source in find_documents(root, ('00_meta',)):
+            try:
+                meta = extract_meta(load_document(source), project_dir.name)
+            except (OSError, UnicodeDecodeError) as e:
+                stats['failed'].append(f"{source}: {type(e).__name__}: {e}")
+                continue
+            stats['projects'] += 1
+            code = meta.get('code')
+            for table, getter in getters.items():
+                rows = pending[table]
+                rows.extend((meta.project, code, seq) + getter(item)
+                            for seq, item in enumerate(getattr(meta, table)))
+                if len(rows) >= batch_rows:
+                    flush(table)
+
+        for table in TABLES:
+            if pending[table]:
+                flush(table)
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Export the milestone, risk and glossary tables of every project's 00_meta as CSV/Parquet")
+    parser.add_argument("--root", default=str(PROJECT_ROOT), help="Project root (default: project/)")
+    parser.add_argument("-o", "--output-dir", help="Output directory (default: <root>/export/data)")
+    parser.add_argument("--format", type=parse_export_formats,
+                        help="csv, parquet or csv,parquet (default: both when pyarrow is installed, else csv)")
+    parser.add_argument("--batch-rows", type=int, default=BATCH_ROWS, metavar="N",
+                        help=f"Rows buffered per table between writes (default: {BATCH_ROWS})")
+    args = parser.parse_args(argv)
+
+    formats = args.format or (FORMATS if parquet_available() else ('csv',))
+    if 'parquet' in formats and not parquet_available():
+        parser.error("Parquet export needs pyarrow (pip install pyarrow)")
+    if args.batch_rows < 1:
+        parser.error("--batch-rows must be at least 1")
+
+    if next(find_documents(args.root, ('00_meta',)), None) is None:
+        parser.error(f"no project 00_meta documents under {args.root}")
+
+    start = time.perf_counter()
+    stats = export(args.root, args.output_dir, formats, args.batch_rows)
+    for message in stats['failed']:
+        print(f"Warning: skipped {message}", file=sys.stderr)
+    out_dir = Path(args.output_dir or Path(args.root) / 'export' / 'data')
+    counts = ', '.join(f"{stats[table]} {table}" for table in TABLES)
+    print(f"Exported {stats['projects']} projects ({counts}) as {'/'.join(formats)} to {out_dir} "
+          f"in {time.perf_counter() - start:.2f} s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
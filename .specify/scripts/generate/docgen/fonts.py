@@ -0,0 +1,241 @@
+"""CJK font resolution and one-time registration for the PDF generator.
+
+Fonts are looked up by file name in the configured font directories instead
+of hardcoded macOS paths, so Linux build hosts pick up an installed CJK font
+rather than silently falling back to Helvetica (which has no Chinese glyphs).
+
+Parsing a large TrueType file (Arial Unicode is ~23 MB) costs far more than
+rendering a 00_meta document, so the parsed face is pickled to
+``<CACHE_DIR>/fonts/`` (keyed by the file's path, size and mtime and the
+reportlab version) and reused by later processes; should the cached face
+not work with the installed reportlab, the font is parsed as usual.
+Font directories are walked once per process. reportlab embeds only
+the glyphs a document actually uses (TrueType subsetting), which keeps the
+PDFs small regardless of font size.
+
+Configuration (environment):
+
+- ``DOCGEN_FONT`` / ``DOCGEN_FONT_BOLD``: explicit font files
+- ``DOCGEN_FONT_DIRS``: extra search directories (``os.pathsep`` separated),
+  searched before the system defaults
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+from fnmatch import fnmatch
+from functools import lru_cache
+from pathlib import Path
+from weakref import WeakKeyDictionary
+
+from .projects import CACHE_DIR
+
+FONT_CACHE_DIR = CACHE_DIR / 'fonts'
+
+DEFAULT_FONT_DIRS = [
+    '~/.fonts',
+    '~/.local/share/fonts',
+    '/usr/share/fonts',
+    '/usr/local/share/fonts',
+    '/System/Library/Fonts/Supplemental',
+    '/System/Library/Fonts',
+    '/Library/Fonts',
+    'C:/Windows/Fonts',
+]
+
+# (regular, bold) file names in order of preference. Only TrueType-outline
+# fonts work with reportlab; the CFF-based Noto Sans CJK .otf/.ttc builds are
+# rejected by its parser, so the TrueType Noto Sans TC release is listed instead.
+FONT_FILES = [
+    ('Arial Unicode.ttf', None),
+    ('NotoSansTC-Regular.ttf', 'NotoSansTC-Bold.ttf'),
+    ('NotoSansTC-VariableFont_wght.ttf', None),
+    ('msjh.ttc', 'msjhbd.ttc'),
+    ('wqy-zenhei.ttc', None),
+    ('wqy-microhei.ttc', None),
+    ('uming.ttc', None),
+    ('DroidSansFallbackFull.ttf', None),
+]
+
+REGULAR_NAME = 'DocgenCJK'
+BOLD_NAME = 'DocgenCJK-Bold'
+FALLBACK_FAMILY = 'Microsoft JhengHei'  # font name used by DOCX/HTML when none resolves
+
+_registered = None
+
+
+def font_dirs():
+    extra = [d for d in os.environ.get('DOCGEN_FONT_DIRS', '').split(os.pathsep) if d]
+    return [Path(d).expanduser() for d in extra + DEFAULT_FONT_DIRS]
+
+
+@lru_cache(maxsize=None)
+def _index_fonts(dirs):
+    """Map font file name -> first path found, walking each directory once per process."""
+    wanted = {name for pair in FONT_FILES for name in pair if name}
+    found = {}
+    for directory in dirs:
+        if not directory.is_dir():
+            continue
+        for root, _, files in os.walk(directory):
+            for name in wanted.intersection(files):
+                found.setdefault(name, os.path.join(root, name))
+    return found
+
+
+def find_fonts():
+    """Return [(regular_path, bold_path_or_None)] candidates, best first."""
+    candidates = []
+    if os.environ.get('DOCGEN_FONT'):
+        candidates.append((os.environ['DOCGEN_FONT'], os.environ.get('DOCGEN_FONT_BOLD') or None))
+    found = _index_fonts(tuple(font_dirs()))
+    for regular, bold in FONT_FILES:
+        if regular in found:
+            candidates.append((found[regular], found.get(bold)))
+    return candidates
+
+
+def font_files():
+    """Files that decide the PDF output (for the build manifest fingerprint)."""
+    candidates = find_fonts()
+    return [p for p in candidates[0] if p] if candidates else []
+
+
+def _pdf_scale(units_per_em):
+    if units_per_em == 1000:
+        return lambda x: x
+    mult = 1000 / units_per_em
+    return lambda x: x * mult
+
+
+def _cache_path(path):
+    import reportlab
+    st = os.stat(path)
+    key = f'{os.path.abspath(path)}:{st.st_size}:{st.st_mtime_ns}:{reportlab.Version}'
+    return FONT_CACHE_DIR / (hashlib.sha256(key.encode()).hexdigest()[:32] + '.pickle')
+
+
+def _load_face(path):
+    """Parse a TrueType face, reusing the pickled parse from a previous run."""
+    from reportlab.pdfbase.ttfonts import TTFontFace
+
+    cache = _cache_path(path)
+    try:
+        with open(cache, 'rb') as f:
+            state = pickle.load(f)
+        face = TTFontFace.__new__(TTFontFace)
+        face.__dict__.update(state)
+        face._pdfScale = _pdf_scale(face.unitsPerEm)
+        return face
+    except Exception:
+        pass
+
+    face = TTFontFace(path)
+    state = {k: v for k, v in face.__dict__.items() if k != '_pdfScale'}  # lambdas don't pickle
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache.with_suffix(f'.tmp{os.getpid()}')
+        with open(tmp, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache)
+    except OSError:
+        pass  # cache is an optimisation only
+    return face
+
+
+def _make_font(name, path):
+    """Equivalent of ``TTFont(name, path)`` with the face coming from the cache.
+
+    The font is assembled from reportlab internals, so any failure (e.g. a
+    reportlab release that changed them) falls back to ``TTFont(name, path)``.
+    """
+    from reportlab import rl_config
+    from reportlab.pdfbase import ttfonts
+    from reportlab.pdfbase.ttfonts import TTEncoding, TTFont
+
+    try:
+        font = TTFont.__new__(TTFont)
+        font.fontName = name
+        font.face = _load_face(path)
+        font.encoding = TTEncoding()
+        font.state = WeakKeyDictionary()
+        font._asciiReadable = rl_config.ttfAsciiReadable
+        font.shapable = not any(fnmatch(name, g) for g in getattr(ttfonts, 'unShapedFontGlob', ()))
+        font.stringWidth('中A', 10)  # fail here rather than at render time
+        return font
+    except Exception:
+        return TTFont(name, path)
+
+
+def register_cjk_fonts():
+    """Register the best available CJK font once per process.
+
+    Returns (regular_name, bold_name); falls back to Helvetica with a warning
+    when no usable CJK font is installed.
+    """
+    global _registered
+    if _registered:
+        return _registered
+
+    from reportlab.pdfbase import pdfmetrics
+
+    for regular, bold in find_fonts():
+        try:
+            pdfmetrics.registerFont(_make_font(REGULAR_NAME, regular))
+        except Exception as e:
+            print(f"Warning: cannot use font {regular}: {e}", file=sys.stderr)
+            continue
+        bold_name = REGULAR_NAME
+        if bold:
+            try:
+                pdfmetrics.registerFont(_make_font(BOLD_NAME, bold))
+                bold_name = BOLD_NAME
+            except Exception as e:
+                print(f"Warning: cannot use font {bold}: {e}", file=sys.stderr)
+        pdfmetrics.registerFontFamily(REGULAR_NAME, normal=REGULAR_NAME, bold=bold_name,
+                                      italic=REGULAR_NAME, boldItalic=bold_name)
+        _registered = (REGULAR_NAME, bold_name)
+        return _registered
+
+    print("Warning: no CJK font found (set DOCGEN_FONT or DOCGEN_FONT_DIRS); "
+          "falling back to Helvetica, Chinese text will not render", file=sys.stderr)
+    _registered = ('Helvetica', 'Helvetica-Bold')
+    return _registered
+
+
+@lru_cache(maxsize=1)
+def font_coverage():
+    """Characters the PDF font (regular and bold) can draw, or None without a CJK font.
+
+    Characters outside it come out as empty boxes in the PDF. Read from the
+    cached face, so it costs no font parsing after the first run.
+    """
+    for regular, bold in find_fonts():
+        try:
+            covered = set(_load_face(regular).charToGlyph)
+        except Exception:
+            continue
+        if bold:
+            try:
+                covered &= set(_load_face(bold).charToGlyph)
+            except Exception:
+                pass  # register_cjk_fonts() uses the regular face for bold too
+        return frozenset(map(chr, covered))
+    return None
+
+
+@lru_cache(maxsize=1)
+def font_family():
+    """Family name of the resolved CJK font, for outputs that name a font instead of embedding it.
+
+    DOCX and HTML reference the font the PDF embeds, so a reader who has it
+    installed sees the same typeface; Microsoft JhengHei otherwise.
+    """
+    for regular, _ in find_fonts():
+        try:
+            from PIL import ImageFont
+            return ImageFont.truetype(regular, 10).getname()[0]
+        except (ImportError, OSError):
+            continue
+    return FALLBACK_FAMILY
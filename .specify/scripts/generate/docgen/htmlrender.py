@@ -0,0 +1,181 @@
+"""HTML backend: document model -> one self-contained HTML page.
+
+``render_html(doc, out)`` is the library entry point; ``render(source,
+output)`` and ``init_worker()`` are what the batch driver runs per job and
+per worker process. The page needs nothing beside itself: the stylesheet is
+inline (colours and sizes from ``docgen/theme.py``, the font the PDF
+embeds from ``docgen/fonts.py``) and Mermaid diagrams are embedded as
+base64 PNGs from the shared diagram cache. Standard library only.
+
+The page is written section by section, so a very large document is never
+held in memory as one string.
+"""
+
+import base64
+import re
+from functools import lru_cache
+from html import escape
+
+from .fonts import font_family
+from .mermaid import image_size, render_diagrams
+from .model import BulletList, CodeBlock, Paragraph, Table
+from .modelcache import load_document
+from .output import is_stream, open_output
+from .parser import strip_inline
+from .profiling import end_section, phase, section as profile_section
+from .theme import DOCUMENT_FONT_SIZES, PALETTE, heading_style
+
+BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+
+# Markdown heading level -> HTML element ("#" is the page title)
+HEADING_TAGS = {'h1': 'h2', 'h2': 'h3', 'h3': 'h4'}
+
+
+@lru_cache(maxsize=1)
+def stylesheet():
+    """Inline CSS for the theme, built once per process."""
+    sizes, color = DOCUMENT_FONT_SIZES, PALETTE
+    return f"""
+body {{ font-family: "{font_family()}", "Microsoft JhengHei", "PingFang TC", sans-serif;
+       font-size: {sizes['body']}pt; line-height: 1.4; color: #{color['text']};
+       max-width: 50em; margin: 2em auto; padding: 0 1em; }}
+h1.title {{ font-size: {sizes['title']}pt; color: #{color['primary']}; text-align: center; margin-bottom: .2em; }}
+p.subtitle {{ font-size: {sizes['h1']}pt; color: #{color['primary']}; text-align: center; font-weight: bold; }}
+p.info {{ text-align: center; }}
+h2 {{ font-size: {sizes['h1']}pt; color: #{color['primary']}; margin-top: 2em;
+     border-top: 1px solid #{color['grid']}; padding-top: 1em; }}
+h3 {{ font-size: {sizes['h2']}pt; color: #{color['secondary']}; }}
+h4 {{ font-size: {sizes['h3']}pt; color: #{color['accent']}; }}
+table {{ border-collapse: collapse; width: 100%; margin: .5em 0 1em; font-size: {sizes['cell']}pt; }}
+th, td {{ border: 1px solid #{color['grid']}; padding: 4px 6px; text-align: left; vertical-align: middle; }}
+thead th, th.key {{ background: #{color['header_fill']}; }}
+thead th {{ text-align: center; }}
+th.key {{ width: 30%; }}
+pre {{ font-size: {sizes['code']}pt; background: #{color['background']}; padding: .5em; overflow-x: auto; }}
+img.diagram {{ display: block; max-width: 100%; height: auto; margin: .5em auto 1em; }}
+"""
+
+
+def to_html(text):
+    """Inline Markdown as HTML: "**bold**" spans, line breaks kept, everything else escaped."""
+    text = BOLD_RE.sub(lambda m: '\0b' + m.group(1) + '\0/b', text)
+    text = escape(strip_inline(text), quote=False)
+    return text.replace('\0b', '<strong>').replace('\0/b', '</strong>').replace('\n', '<br>')
+
+
+@lru_cache(maxsize=64)
+def diagram_html(path):
+    """<img> for a cached Mermaid PNG; shared by every document that uses the diagram."""
+    width, height = image_size(path)
+    data = base64.b64encode(path.read_bytes()).decode('ascii')
+    return f'<img class="diagram" width="{width}" height="{height}" alt="" src="data:image/png;base64,{data}">'
+
+
+def table_html(headers, rows):
+    """<table> with a header row (omitted when the header is blank)."""
+    ncols = max([len(headers)] + [len(row) for row in rows])
+    parts = ['<table>']
+    if any(cell.strip() for cell in headers):
+        parts.append('<thead><tr>' + ''.join(f'<th>{to_html(c)}</th>' for c in headers) + '</tr></thead>')
+    parts.append('<tbody>')
+    for row in rows:
+        cells = list(row) + [''] * (ncols - len(row))
+        parts.append('<tr>' + ''.join(f'<td>{to_html(c)}</td>' for c in cells) + '</tr>')
+    parts.append('</tbody></table>')
+    return '\n'.join(parts)
+
+
+def list_html(items):
+    """Nested <ul>/<ol> for list items with levels."""
+    parts, open_tags = [], []
+    for item in items:
+        tag = 'ol' if item.ordered else 'ul'
+        while len(open_tags) > item.level + 1:
+            parts.append(f'</li></{open_tags.pop()}>')
+        if len(open_tags) == item.level + 1:
+            parts.append('</li>')
+        while len(open_tags) < item.level + 1:
+            parts.append(f'<{tag}>')
+            open_tags.append(tag)
+        parts.append(f'<li>{to_html(item.text)}')
+    while open_tags:
+        parts.append(f'</li></{open_tags.pop()}>')
+    return ''.join(parts)
+
+
+def block_html(block, diagrams):
+    """HTML for one document block ('' for diagrams that could not be rendered)."""
+    if isinstance(block, Paragraph):
+        if block.is_label():
+            return f"<h4>{escape(strip_inline(block.text).rstrip(':：').strip())}</h4>"
+        return f'<p>{to_html(block.text)}</p>'
+
+    if isinstance(block, BulletList):
+        rows = block.key_value_rows()
+        if rows:
+            return '<table class="kv"><tbody>\n' + '\n'.join(
+                f'<tr><th class="key">{to_html(k)}</th><td>{to_html(v)}</td></tr>' for k, v in rows
+            ) + '\n</tbody></table>'
+        return list_html(block.items)
+
+    if isinstance(block, Table):
+        return table_html(block.headers, block.rows)
+
+    if isinstance(block, CodeBlock) and block.language != 'mermaid':
+        return f'<pre><code>{escape(block.source)}</code></pre>'
+
+    if isinstance(block, CodeBlock) and diagrams.get(block.source):
+        return diagram_html(diagrams[block.source])
+    return ''
+
+
+def page_chunks(doc):
+    """Yield the page as strings: head and title, then one chunk per section."""
+    with phase('diagrams'):
+        diagrams = render_diagrams(doc.code_blocks('mermaid'))
+
+    title = strip_inline(doc.lookup('專案名稱')) or doc.subtitle or doc.title
+    subtitle = f"{doc.subtitle} ({doc.doc_type})" if doc.subtitle else doc.doc_type
+    info = [f"<strong>{escape(key)}:</strong> {escape(doc.meta[key])}"
+            for key in ('建立日期', '文件版本') if doc.meta.get(key)]
+    yield (f'<!DOCTYPE html>\n<html lang="zh-Hant">\n<head>\n<meta charset="utf-8">\n'
+           f'<meta name="viewport" content="width=device-width, initial-scale=1">\n'
+           f'<title>{escape(title)} - {escape(subtitle)}</title>\n<style>{stylesheet()}</style>\n</head>\n<body>\n'
+           f'<h1 class="title">{escape(title)}</h1>\n<p class="subtitle">{escape(subtitle)}</p>\n'
+           + (f'<p class="info">{" | ".join(info)}</p>\n' if info else ''))
+
+    for section in doc.sections:
+        profile_section(section.title or doc.title)
+        parts = []
+        if section.title:
+            tag = HEADING_TAGS[heading_style(section.level)]
+            parts.append(f'<{tag}>{escape(section.title)}</{tag}>')
+        parts.extend(block_html(block, diagrams) for block in section.blocks)
+        yield '\n'.join(part for part in parts if part) + '\n'
+    end_section()
+    yield '</body>\n</html>\n'
+
+
+def init_worker():
+    """Per-process warm-up: the stylesheet (and the font lookup behind it)."""
+    with phase('styles'):
+        stylesheet()
+
+
+def render_html(doc, out):
+    """Render a parsed Document as HTML to out: a path (replaced atomically), '-' for stdout or a binary stream."""
+    with phase('write'), open_output(out) as target:
+        if is_stream(target):
+            for chunk in page_chunks(doc):
+                target.write(chunk.encode('utf-8'))
+        else:
+            with open(target, 'w', encoding='utf-8') as f:
+                f.writelines(page_chunks(doc))
+    return out
+
+
+def render(source, output):
+    """Parse one Markdown document and write it as HTML (batch job entry point)."""
+    with phase('parse'):
+        model = load_document(source)
+    return render_html(model, output)
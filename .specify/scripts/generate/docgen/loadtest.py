@@ -0,0 +1,114 @@
+"""Load-test client for the render service (``docgen/server.py``).
+
+    python3 -m docgen.loadtest --url http://127.0.0.1:8765 \\
+        --path /render/pdf/001-RISK-AML/00_meta --path /render/pptx/001-RISK-AML/00_meta \\
+        --requests 500 --concurrency 16
+
+Each of ``--concurrency`` threads keeps one HTTP/1.1 connection open and
+issues requests for the given paths round-robin (or POSTs ``--markdown``
+files). The summary gives throughput, latency percentiles and how requests
+were served (cache hit, miss, coalesced); ``--out`` also writes it as JSON.
+"""
+
+import argparse
+import http.client
+import itertools
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from .cli import BACKENDS
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def run(url, requests, total, concurrency):
+    """Issue ``total`` requests from ``concurrency`` connections; return the summary."""
+    parts = urlsplit(url)
+    counter = itertools.count()
+    lock = threading.Lock()
+    latencies, statuses, cache, sizes = [], Counter(), Counter(), []
+
+    def worker():
+        conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=300)
+        while True:
+            n = next(counter)
+            if n >= total:
+                break
+            method, path, body = requests[n % len(requests)]
+            start = time.perf_counter()
+            try:
+                conn.request(method, path, body=body)
+                response = conn.getresponse()
+                payload = response.read()
+                status, served = response.status, response.getheader('X-Docgen-Cache', '-')
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=300)
+                status, served, payload = type(e).__name__, '-', b''
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+                statuses[str(status)] += 1
+                cache[served] += 1
+                sizes.append(len(payload))
+        conn.close()
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+
+    return {
+        'requests': total,
+        'concurrency': concurrency,
+        'seconds': round(wall, 3),
+        'requests_per_second': round(total / wall, 1) if wall else 0.0,
+        'latency_ms': {name: round(percentile(latencies, pct) * 1000, 1)
+                       for name, pct in (('p50', 50), ('p90', 90), ('p99', 99), ('max', 100))},
+        'status': dict(statuses),
+        'cache': dict(cache),
+        'bytes': sum(sizes),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the docgen render service")
+    parser.add_argument("--url", default="http://127.0.0.1:8765", help="Service base URL")
+    parser.add_argument("--path", action="append", default=[],
+                        help="GET path to request, e.g. /render/pdf/001-NAME/00_meta (repeatable)")
+    parser.add_argument("--markdown", action="append", default=[], metavar="FILE",
+                        help="Markdown file to POST to /render/<--format> (repeatable)")
+    parser.add_argument("--format", default="pdf", choices=tuple(BACKENDS), help="Format for --markdown")
+    parser.add_argument("-n", "--requests", type=int, default=200, help="Total requests (default: 200)")
+    parser.add_argument("-c", "--concurrency", type=int, default=8, help="Parallel connections (default: 8)")
+    parser.add_argument("--out", metavar="PATH", help="Write the summary as JSON")
+    args = parser.parse_args(argv)
+
+    requests = [('GET', path, None) for path in args.path]
+    requests += [('POST', f'/render/{args.format}', Path(f).read_bytes()) for f in args.markdown]
+    if not requests:
+        parser.error("give at least one --path or --markdown")
+
+    summary = run(args.url.rstrip('/'), requests, args.requests, max(1, args.concurrency))
+    print(json.dumps(summary, indent=2))
+    if args.out:
+        Path(args.out).write_text(json.dumps(summary, indent=2), encoding='utf-8')
+    failed = sum(count for status, count in summary['status'].items() if status != '200')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
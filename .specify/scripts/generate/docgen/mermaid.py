@@ -0,0 +1,273 @@
+"""Content-addressed Mermaid diagram images for the PDF and PPTX backends.
+
+Every diagram is stored as ``<CACHE_DIR>/mermaid/<sha256>.png``, keyed by
+its source text and the renderer code, so the boilerplate diagrams repeated
+across hundreds of projects render once and are then shared by every
+project, format and run.
+
+Cache misses go to one long-lived Node process per generator process
+(``.specify/scripts/utils/mermaid_server.js``, wrapping the existing
+``mermaid_renderer.js``); a worker forked from a process that already
+started one starts its own. A document's misses are sent together and
+rendered concurrently. The Node process is local, but the renderer it
+wraps is the mermaid.ink client: every miss sends the diagram source to
+https://mermaid.ink, and offline every miss fails. Cache hits need
+neither Node nor the network.
+
+When Node is missing or a diagram fails to render, the document is still
+produced without it, and ``batch.warn`` marks the job so the next run
+tries again. Within a run the failure is recorded next to the cache
+(``<sha256>.failed``, with the run id), so the other worker processes of
+the run do not retry the diagram either. A run is started with
+``new_run()`` (each batch, each ``--watch`` rebuild, each render-service
+request) and its id is handed to worker processes, which call
+``join_run(run)``; a diagram that failed for a transient reason is tried
+again in the next run.
+
+A renderer that does not answer within ``DOCGEN_MERMAID_TIMEOUT`` seconds
+(default 60) is killed; its diagrams count as failed and the next miss
+starts a new one.
+
+``DOCGEN_MERMAID=off`` disables rendering misses (quietly); already cached
+images are still used.
+"""
+
+import atexit
+import hashlib
+import itertools
+import json
+import os
+import queue
+import shutil
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+
+from . import batch
+from .projects import CACHE_DIR, REPO_ROOT
+
+MERMAID_CACHE_DIR = CACHE_DIR / 'mermaid'
+UTILS_DIR = REPO_ROOT / '.specify' / 'scripts' / 'utils'
+SERVER_SCRIPT = UTILS_DIR / 'mermaid_server.js'
+
+TIMEOUT_ENV_VAR = 'DOCGEN_MERMAID_TIMEOUT'
+DEFAULT_TIMEOUT = 60  # seconds without an answer from the renderer
+
+_renderer_digest = None
+_server = None
+_failed = {}  # key -> error, so a broken diagram is not retried within a run
+_run = None   # id of the current run, see new_run()
+
+
+def _renderer_version():
+    global _renderer_digest
+    if _renderer_digest is None:
+        h = hashlib.sha256()
+        for name in ('mermaid_renderer.js', 'mermaid_server.js'):
+            try:
+                h.update((UTILS_DIR / name).read_bytes())
+            except OSError:
+                h.update(b'missing')
+        _renderer_digest = h.hexdigest()
+    return _renderer_digest
+
+
+def diagram_key(code):
+    h = hashlib.sha256(_renderer_version().encode())
+    h.update(code.strip().encode('utf-8'))
+    return h.hexdigest()
+
+
+def cached_path(code):
+    return MERMAID_CACHE_DIR / f'{diagram_key(code)}.png'
+
+
+def response_timeout():
+    try:
+        return float(os.environ.get(TIMEOUT_ENV_VAR) or DEFAULT_TIMEOUT)
+    except ValueError:
+        return DEFAULT_TIMEOUT
+
+
+class RendererServer:
+    """The Node render process; started on the first miss, reused until exit."""
+
+    def __init__(self):
+        node = os.environ.get('DOCGEN_NODE') or shutil.which('node')
+        if not node:
+            raise RuntimeError('node not found (set DOCGEN_NODE)')
+        self.pid = os.getpid()  # a forked child must not share the pipes
+        self._ids = itertools.count(1)
+        self._proc = subprocess.Popen(
+            [node, str(SERVER_SCRIPT)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=None if os.environ.get('MERMAID_DEBUG') else subprocess.DEVNULL,
+            text=True, encoding='utf-8', bufsize=1,
+        )
+        # Responses are read on a thread so waiting for one can time out
+        self._lines = queue.Queue()
+        threading.Thread(target=self._read, daemon=True).start()
+        atexit.register(self.close)
+
+    def _read(self):
+        for line in self._proc.stdout:
+            self._lines.put(line)
+        self._lines.put('')
+
+    def alive(self):
+        return self.pid == os.getpid() and self._proc.poll() is None
+
+    def render(self, requests):
+        """Render {output_path: code}; returns {output_path: error or None}."""
+        ids = {}
+        for output, code in requests.items():
+            request_id = next(self._ids)
+            ids[request_id] = output
+            self._proc.stdin.write(json.dumps({'id': request_id, 'code': code, 'output': str(output)}) + '\n')
+        self._proc.stdin.flush()
+
+        results = {}
+        timeout = response_timeout()
+        while len(results) < len(ids):
+            try:
+                line = self._lines.get(timeout=timeout)
+            except queue.Empty:
+                self.kill()
+                raise RuntimeError(f'mermaid renderer did not answer within {timeout:g} s') from None
+            if not line:
+                raise RuntimeError('mermaid renderer exited')
+            response = json.loads(line)
+            if response.get('id') in ids:
+                results[ids[response['id']]] = None if response.get('ok') else response.get('error', 'failed')
+        return results
+
+    def kill(self):
+        if self.pid == os.getpid():
+            self._proc.kill()
+            self._proc.wait()
+
+    def close(self):
+        if self.alive():
+            self._proc.stdin.close()
+            try:
+                self._proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+
+
+def _get_server():
+    global _server
+    if _server is None or not _server.alive():
+        _server = RendererServer()
+    return _server
+
+
+def new_run():
+    """Start a new run and return its id: diagrams that failed before are tried again."""
+    global _run
+    _failed.clear()
+    _run = f'{os.getpid()}-{time.time_ns()}'
+    return _run
+
+
+def join_run(run):
+    """Take part in another process's run (call in its worker processes)."""
+    global _run
+    if run != _run:
+        _failed.clear()
+        _run = run
+
+
+@dataclass(frozen=True)
+class JoinRun:
+    """Picklable worker initializer: ``join_run(run)``."""
+    run: str
+
+    def __call__(self):
+        join_run(self.run)
+
+
+def current_run():
+    """Id of the current run (a new one if none was started)."""
+    return _run or new_run()
+
+
+def _failure_marker(key):
+    return MERMAID_CACHE_DIR / f'{key}.failed'
+
+
+def _failure(key):
+    """Error of a diagram that already failed in this run (in any of its processes), or None."""
+    if key in _failed:
+        return _failed[key]
+    try:
+        run, _, error = _failure_marker(key).read_text(encoding='utf-8').partition('\n')
+    except OSError:
+        return None
+    if run != current_run():
+        return None
+    _failed[key] = error
+    return error
+
+
+def _record_failure(key, error):
+    _failed[key] = error
+    marker = _failure_marker(key)
+    tmp = marker.with_name(f'{marker.name}.tmp{os.getpid()}')
+    try:
+        tmp.write_text(f'{current_run()}\n{error}', encoding='utf-8')
+        os.replace(tmp, marker)
+    except OSError:
+        pass  # the other processes retry it, nothing worse
+
+
+def render_diagrams(codes):
+    """Return {code: png_path or None} for Mermaid sources, rendering misses."""
+    paths = {code: cached_path(code) for code in dict.fromkeys(codes)}
+    missing = {code: path for code, path in paths.items()
+               if not path.exists() and _failure(path.stem) is None}
+
+    if missing and os.environ.get('DOCGEN_MERMAID', '').lower() not in ('0', 'off', 'no'):
+        MERMAID_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        temps = {path.with_name(f'{path.stem}.tmp{os.getpid()}.png'): (code, path)
+                 for code, path in missing.items()}
+        try:
+            errors = _get_server().render({tmp: code for tmp, (code, _) in temps.items()})
+        except (OSError, RuntimeError, ValueError) as e:
+            errors = {tmp: str(e) for tmp in temps}
+        for tmp, (code, path) in temps.items():
+            if errors.get(tmp) is None and tmp.exists() and tmp.stat().st_size:
+                os.replace(tmp, path)
+                _failure_marker(path.stem).unlink(missing_ok=True)
+            else:
+                _record_failure(path.stem, errors.get(tmp) or 'empty image')
+                tmp.unlink(missing_ok=True)
+
+    result = {}
+    for code, path in paths.items():
+        if path.exists():
+            result[code] = path
+        else:
+            result[code] = None
+            error = _failure(path.stem)
+            if error is not None:
+                first_line = (code.strip().splitlines() or [''])[0]
+                batch.warn(f"Mermaid diagram not rendered ({error}): {first_line[:60]}")
+    return result
+
+
+def image_size(path):
+    """(width, height) in pixels."""
+    from PIL import Image
+    with Image.open(path) as image:
+        return image.size
+
+
+def fit(size, max_width, max_height, max_scale=None):
+    """Scale (width, height) to fit the box, keeping the aspect ratio."""
+    width, height = size
+    scale = min(max_width / width, max_height / height)
+    if max_scale is not None:
+        scale = min(scale, max_scale)
+    return width * scale, height * scale
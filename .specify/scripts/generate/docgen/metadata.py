@@ -0,0 +1,176 @@
+"""Structured fields of a 00_meta document.
+
+Pulls what the generators otherwise only print — project identity
+(``專案代號``, ``發起單位``, ``優先等級`` …), milestones, the high-level risk
+table and the glossary — out of a parsed ``Document``:
+
+- identity and budget fields are ``- **key**: value`` list items;
+- milestones come from the ``里程碑 | 預定日期 | 狀態 | 備註`` table and/or
+  the ``**里程碑日期**:`` list that follows it in the template;
+- risks come from the ``風險 ID | 風險描述 | 機率 | 影響 …`` table;
+- terms come from the ``名詞 | 全名 | 說明`` table.
+
+Template placeholders (``[姓名]``, ``YYYY-MM-DD``) are read as empty values.
+Columns are found by header name, so reordered or extra columns are fine.
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .model import BulletList, Paragraph, Table
+from .parser import strip_inline
+
+DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+PRIORITY_LEVEL_RE = re.compile(r'P\d')
+PLACEHOLDER_RE = re.compile(r'^\[[^\]]*\]$|^Y{4}-M{2}-D{2}$')
+
+# Attribute name -> "**key**" of the list item it is read from
+IDENTITY_FIELDS = {
+    'code': '專案代號',
+    'name': '專案名稱',
+    'name_en': '專案英文名稱',
+    'short_name': '專案簡稱',
+    'sponsor': '發起單位',
+    'project_type': '專案類型',
+    'nature': '專案性質',
+    'priority': '優先等級',
+    'budget': '總預算',
+}
+# Attribute name -> Document.meta key (lines above the first "##")
+DOCUMENT_FIELDS = {
+    'created': '建立日期',
+    'updated': '最後更新',
+    'version': '文件版本',
+}
+GO_LIVE = '上線'
+
+
+@dataclass(slots=True)
+class Milestone:
+    name: str
+    date: str = ''    # ISO date, '' when missing or a placeholder
+    status: str = ''
+    note: str = ''
+
+
+@dataclass(slots=True)
+class Risk:
+    risk_id: str
+    description: str = ''
+    probability: str = ''  # 機率: 高 / 中 / 低
+    impact: str = ''       # 影響: 高 / 中 / 低
+    level: str = ''        # 風險等級
+    strategy: str = ''
+    owner: str = ''
+
+
+@dataclass(slots=True)
+class Term:
+    term: str
+    full_name: str = ''
+    description: str = ''
+
+
+@dataclass(slots=True)
+class ProjectMeta:
+    project: str             # project directory name, e.g. "001-RISK-AML"
+    source: str
+    fields: dict = field(default_factory=dict)   # every "**key**: value" item, first wins
+    milestones: list = field(default_factory=list)
+    risks: list = field(default_factory=list)
+    terms: list = field(default_factory=list)
+
+    def get(self, name):
+        """Identity or document field by attribute name (see IDENTITY_FIELDS)."""
+        return self.fields.get(IDENTITY_FIELDS.get(name) or DOCUMENT_FIELDS.get(name, name), '')
+
+    @property
+    def priority_level(self):
+        """"P0" for "P0-Critical", '' when unset."""
+        match = PRIORITY_LEVEL_RE.search(self.get('priority'))
+        return match.group(0) if match else ''
+
+    @property
+    def go_live(self):
+        """Date of the first dated go-live (上線) milestone, or ''."""
+        for milestone in self.milestones:
+            if GO_LIVE in milestone.name and milestone.date:
+                return milestone.date
+        return ''
+
+
+def clean(value):
+    """Visible text of a cell or list value; placeholders become ''."""
+    value = strip_inline(value).strip()
+    return '' if PLACEHOLDER_RE.match(value) else value
+
+
+def iso_date(value):
+    match = DATE_RE.search(value)
+    return match.group(0) if match else ''
+
+
+def _columns(table, *names):
+    """Index of the first header containing each name (None if absent)."""
+    headers = [strip_inline(h).strip() for h in table.headers]
+    return [next((i for i, h in enumerate(headers) if name in h), None) for name in names]
+
+
+def _cells(table, indexes):
+    for row in table.rows:
+        yield [clean(row[i]) if i is not None and i < len(row) else '' for i in indexes]
+
+
+def _project_name(source):
+    path = Path(source)
+    # project/###-NAME/meta/00_meta.md
+    return path.parent.parent.name if path.parent.name == 'meta' else path.stem
+
+
+def extract_meta(doc, project=None):
+    """``ProjectMeta`` for a parsed 00_meta ``Document``."""
+    meta = ProjectMeta(project or _project_name(doc.source), str(doc.source))
+    for key in DOCUMENT_FIELDS.values():
+        if doc.meta.get(key):
+            meta.fields[key] = clean(doc.meta[key])
+
+    milestones = {}
+    for section in doc.sections:
+        label = ''
+        for block in section.blocks:
+            if isinstance(block, BulletList):
+                for key, value in block.key_values():
+                    key = strip_inline(key)
+                    if key not in meta.fields:
+                        meta.fields[key] = clean(value)
+                    if '里程碑' in label:
+                        milestone = milestones.setdefault(key, Milestone(key))
+                        milestone.date = milestone.date or iso_date(clean(value))
+            elif isinstance(block, Table):
+                _read_table(block, meta, milestones)
+            label = block.text if isinstance(block, Paragraph) and block.is_label() else ''
+
+    meta.milestones = list(milestones.values())
+    return meta
+
+
+def _read_table(table, meta, milestones):
+    name, date, status, note = _columns(table, '里程碑', '日期', '狀態', '備註')
+    if name is not None and date is not None:
+        for name, date, status, note in _cells(table, (name, date, status, note)):
+            if name:
+                milestone = milestones.setdefault(name, Milestone(name))
+                milestone.date = milestone.date or iso_date(date)
+                milestone.status = milestone.status or status
+                milestone.note = milestone.note or note
+        return
+
+    columns = _columns(table, 'ID', '描述', '機率', '影響', '等級', '策略', '負責人')
+    if columns[0] is not None and columns[2] is not None and columns[3] is not None:
+        meta.risks.extend(Risk(*cells) for cells in _cells(table, columns) if cells[0])
+        return
+
+    columns = _columns(table, '名詞', '全名', '說明')
+    if columns[0] is not None:
+        meta.terms.extend(Term(*cells) for cells in _cells(table, columns) if cells[0])
@@ -0,0 +1,244 @@
+"""SQLite index of every project's 00_meta fields.
+
+    python3 -m docgen.metaindex                                   # update, list projects
+    python3 -m docgen.metaindex --priority P0 --go-live-before 2026-06
+    python3 -m docgen.metaindex --sql "SELECT project, date FROM milestones WHERE date < '2026-03'"
+
+The index (``<CACHE_DIR>/meta-index.sqlite``) holds one row per project
+(identity, priority, go-live date), every ``**key**: value`` field, the
+milestones and the high-level risks, as extracted by ``docgen/metadata.py``.
+``update()`` is incremental: a file whose size and mtime are unchanged is
+not opened, one whose content hash is unchanged (touched, checked out again)
+is not parsed, and projects that disappeared are dropped. Changes to the
+extraction code rebuild the index.
+
+Other tools query it directly::
+
+    from docgen.metaindex import MetaIndex
+
+    with MetaIndex() as index:
+        index.update()
+        rows = index.projects(priority='P0', go_live_before='2026-06')
+"""
+
+import argparse
+import hashlib
+import json
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+from .metadata import IDENTITY_FIELDS, extract_meta
+from .modelcache import load_document
+from .projects import CACHE_DIR, PROJECT_ROOT, find_documents
+
+INDEX_PATH = CACHE_DIR / 'meta-index.sqlite'
+SCHEMA_VERSION = 1
+
+_PACKAGE_DIR = Path(__file__).resolve().parent
+
+PROJECT_COLUMNS = list(IDENTITY_FIELDS) + ['priority_level', 'go_live', 'created', 'updated', 'version']
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS info (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY, project TEXT NOT NULL,
+    size INTEGER, mtime_ns INTEGER, sha256 TEXT
+);
+CREATE TABLE IF NOT EXISTS projects (
+    project TEXT PRIMARY KEY, source TEXT, {', '.join(f'{c} TEXT' for c in PROJECT_COLUMNS)}
+);
+CREATE TABLE IF NOT EXISTS fields (
+    project TEXT, key TEXT, value TEXT, PRIMARY KEY (project, key)
+);
+CREATE TABLE IF NOT EXISTS milestones (
+    project TEXT, seq INTEGER, name TEXT, date TEXT, status TEXT, note TEXT,
+    PRIMARY KEY (project, seq)
+);
+CREATE TABLE IF NOT EXISTS risks (
+    project TEXT, seq INTEGER, risk_id TEXT, description TEXT, probability TEXT,
+    impact TEXT, level TEXT, strategy TEXT, owner TEXT,
+    PRIMARY KEY (project, seq)
+);
+CREATE INDEX IF NOT EXISTS projects_priority ON projects (priority_level, go_live);
+CREATE INDEX IF NOT EXISTS projects_go_live ON projects (go_live);
+CREATE INDEX IF NOT EXISTS milestones_date ON milestones (date);
+CREATE INDEX IF NOT EXISTS fields_key ON fields (key, value);
+"""
+
+PROJECT_TABLES = ('projects', 'fields', 'milestones', 'risks')
+
+
+def _extractor_digest():
+    """Hash of the code that decides what ends up in the index."""
+    h = hashlib.sha256(str(SCHEMA_VERSION).encode())
+    for name in ('metadata.py', 'model.py', 'parser.py'):
+        h.update((_PACKAGE_DIR / name).read_bytes())
+    return h.hexdigest()
+
+
+class MetaIndex:
+    """Connection to the metadata index; usable as a context manager."""
+
+    def __init__(self, path=INDEX_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(self.path)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute('PRAGMA journal_mode=WAL')  # readers are not blocked by update()
+        self.db.executescript(SCHEMA)
+
+        digest = _extractor_digest()
+        row = self.db.execute("SELECT value FROM info WHERE key = 'extractor'").fetchone()
+        if row is None or row['value'] != digest:
+            with self.db:
+                for table in PROJECT_TABLES + ('files',):
+                    self.db.execute(f'DELETE FROM {table}')
+                self.db.execute("INSERT OR REPLACE INTO info VALUES ('extractor', ?)", (digest,))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.db.close()
+
+    def update(self, root=PROJECT_ROOT):
+        """Bring the index in line with the 00_meta files under root; returns counts."""
+        known = {row['path']: row for row in self.db.execute('SELECT * FROM files')}
+        stats = {'projects': 0, 'parsed': 0, 'touched': 0, 'unchanged': 0, 'removed': 0}
+        seen, indexed = set(), set()
+
+        with self.db:
+            for project_dir, _, source in find_documents(root, ('00_meta',)):
+                path = str(source.resolve())
+                seen.add(path)
+                indexed.add(project_dir.name)
+                stats['projects'] += 1
+                st = source.stat()
+                row = known.get(path)
+                if row is not None and row['size'] == st.st_size and row['mtime_ns'] == st.st_mtime_ns:
+                    stats['unchanged'] += 1
+                    continue
+
+                data = source.read_bytes()
+                digest = hashlib.sha256(data).hexdigest()
+                if row is not None and row['sha256'] == digest and row['project'] == project_dir.name:
+                    stats['touched'] += 1
+                else:
+                    if row is not None:
+                        self._delete_project(row['project'])
+                    self._insert(extract_meta(load_document(source), project_dir.name))
+                    stats['parsed'] += 1
+                self.db.execute('INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)',
+                                (path, project_dir.name, st.st_size, st.st_mtime_ns, digest))
+
+            for path, row in known.items():
+                if path not in seen:
+                    if row['project'] not in indexed:  # not moved to a path indexed above
+                        self._delete_project(row['project'])
+                    self.db.execute('DELETE FROM files WHERE path = ?', (path,))
+                    stats['removed'] += 1
+        return stats
+
+    def _delete_project(self, project):
+        for table in PROJECT_TABLES:
+            self.db.execute(f'DELETE FROM {table} WHERE project = ?', (project,))
+
+    def _insert(self, meta):
+        # The project may still have rows from another path (a moved or copied root)
+        self._delete_project(meta.project)
+        values = [meta.get(name) for name in IDENTITY_FIELDS]
+        values += [meta.priority_level, meta.go_live, meta.get('created'), meta.get('updated'), meta.get('version')]
+        self.db.execute(f'INSERT OR REPLACE INTO projects VALUES ({", ".join("?" * (len(values) + 2))})',
+                        [meta.project, meta.source] + values)
+        self.db.executemany('INSERT OR REPLACE INTO fields VALUES (?, ?, ?)',
+                            [(meta.project, key, value) for key, value in meta.fields.items()])
+        self.db.executemany('INSERT INTO milestones VALUES (?, ?, ?, ?, ?, ?)',
+                            [(meta.project, n, m.name, m.date, m.status, m.note)
+                             for n, m in enumerate(meta.milestones)])
+        self.db.executemany('INSERT INTO risks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                            [(meta.project, n, r.risk_id, r.description, r.probability, r.impact,
+                              r.level, r.strategy, r.owner) for n, r in enumerate(meta.risks)])
+
+    def query(self, sql, params=()):
+        return self.db.execute(sql, params).fetchall()
+
+    def projects(self, priority=None, go_live_before=None, go_live_after=None, sponsor=None):
+        """Project rows filtered by priority level ("P0"), go-live date and sponsor.
+
+        Dates compare as ISO strings, so ``go_live_before='2026-06'`` means
+        going live in May 2026 or earlier.
+        """
+        where, params = [], []
+        if priority:
+            where.append('priority_level = ?')
+            params.append(priority.upper()[:2])
+        if go_live_before:
+            where.append("go_live != '' AND go_live < ?")
+            params.append(go_live_before)
+        if go_live_after:
+            where.append('go_live >= ?')
+            params.append(go_live_after)
+        if sponsor:
+            where.append('sponsor LIKE ?')
+            params.append(f'%{sponsor}%')
+        sql = 'SELECT * FROM projects' + (f' WHERE {" AND ".join(where)}' if where else '')
+        return self.query(sql + ' ORDER BY go_live, project', params)
+
+
+def _print_rows(rows, as_json):
+    rows = [dict(row) for row in rows]
+    if as_json:
+        print(json.dumps(rows, ensure_ascii=False, indent=2))
+        return
+    if not rows:
+        return
+    columns = list(rows[0])
+    if columns[:2] == ['project', 'source']:
+        columns = ['project', 'code', 'priority', 'go_live', 'sponsor', 'name']
+    print('\t'.join(columns))
+    for row in rows:
+        print('\t'.join(str(row[c]) if row[c] is not None else '' for c in columns))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Index 00_meta fields of every project in SQLite and query them")
+    parser.add_argument("--root", default=str(PROJECT_ROOT), help="Project root (default: project/)")
+    parser.add_argument("--db", default=str(INDEX_PATH), help=f"Index file (default: {INDEX_PATH})")
+    parser.add_argument("--no-update", action="store_true", help="Query the index as it is")
+    parser.add_argument("--priority", help="Priority level, e.g. P0")
+    parser.add_argument("--go-live-before", metavar="DATE", help="ISO date or prefix, e.g. 2026-06")
+    parser.add_argument("--go-live-after", metavar="DATE", help="ISO date or prefix (inclusive)")
+    parser.add_argument("--sponsor", help="Substring of 發起單位")
+    parser.add_argument("--sql", help="Run a read-only SQL query instead of the project filter")
+    parser.add_argument("--json", action="store_true", help="Print rows as JSON")
+    args = parser.parse_args(argv)
+
+    with MetaIndex(args.db) as index:
+        if not args.no_update:
+            start = time.perf_counter()
+            stats = index.update(args.root)
+            print(f"Indexed {stats['projects']} projects: {stats['parsed']} parsed, {stats['touched']} touched, "
+                  f"{stats['unchanged']} unchanged, {stats['removed']} removed "
+                  f"({(time.perf_counter() - start) * 1000:.0f} ms)", file=sys.stderr)
+        start = time.perf_counter()
+        if args.sql:
+            index.db.execute('PRAGMA query_only = ON')
+            try:
+                rows = index.query(args.sql)
+            except sqlite3.Error as e:
+                parser.exit(2, f"{parser.prog}: error: {e}\n")
+        else:
+            rows = index.projects(args.priority, args.go_live_before, args.go_live_after, args.sponsor)
+        elapsed = (time.perf_counter() - start) * 1000
+        _print_rows(rows, args.json)
+        print(f"{len(rows)} row(s) in {elapsed:.1f} ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""Document model produced by the Markdown parser.
+
+A document is a flat list of sections (one per ``##``/``###``/``####``
+heading, in source order). Each section holds the blocks that appear between
+its heading and the next one. Inline Markdown (``**bold**``, `` `code` ``) is
+kept as written; renderers decide how to present it.
+
+The classes use ``__slots__`` (``dataclass(slots=True)``, Python 3.10+): a
+large document holds tens of thousands of blocks and list items, and the
+model is pickled to the parse cache (``docgen/modelcache.py``) that both
+backends read from.
+"""
+
+import re
+from dataclasses import dataclass, field
+
+# "- **專案代號**: RISK-AML-MDL-001" style list items
+KEY_VALUE_RE = re.compile(r'^\*\*(.+?)\*\*\s*[:：]\s*(.*)$')
+
+
+@dataclass(slots=True)
+class Paragraph:
+    text: str
+
+    def is_label(self):
+        """True for bold lead-in lines such as "**量化效益**:" """
+        return self.text.startswith('**') and self.text.rstrip().endswith((':', '：'))
+
+
+@dataclass(slots=True)
+class ListItem:
+    text: str
+    level: int = 0
+    ordered: bool = False
+
+
+@dataclass(slots=True)
+class BulletList:
+    items: list = field(default_factory=list)
+
+    def key_values(self):
+        """Return [(key, value)] for top-level "**Key**: value" items."""
+        pairs = []
+        for item in self.items:
+            if item.level:
+                continue
+            match = KEY_VALUE_RE.match(item.text)
+            if match:
+                pairs.append((match.group(1).strip(), match.group(2).strip()))
+        return pairs
+
+    def key_value_rows(self):
+        """[[key, value]] when every top-level item is "**key**: value", else None.
+
+        Nested items are folded into the value of the item above as "• …"
+        lines, so the whole list can be shown as a two-column table.
+        """
+        rows = []
+        for item in self.items:
+            if item.level == 0:
+                match = KEY_VALUE_RE.match(item.text)
+                if not match:
+                    return None
+                rows.append([match.group(1), match.group(2)])
+            elif rows:
+                rows[-1][1] += f"\n• {item.text}"
+        return rows
+
+
+@dataclass(slots=True)
+class Table:
+    headers: list
+    rows: list = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class CodeBlock:
+    language: str
+    source: str
+
+
+@dataclass(slots=True)
+class Section:
+    title: str
+    level: int
+    blocks: list = field(default_factory=list)
+    parent: str = ''  # title of the enclosing "##" section, if any
+
+    def is_empty(self):
+        return not self.blocks
+
+
+@dataclass(slots=True)
+class Document:
+    title: str
+    meta: dict = field(default_factory=dict)
+    sections: list = field(default_factory=list)
+    source: str = ''
+
+    @property
+    def doc_type(self):
+        """Document type prefix, e.g. "00_meta" for "# 00_meta - 專案基本資料"."""
+        return self.title.split(' - ', 1)[0].strip()
+
+    @property
+    def subtitle(self):
+        parts = self.title.split(' - ', 1)
+        return parts[1].strip() if len(parts) > 1 else ''
+
+    def lookup(self, key, default=''):
+        """Look up the first "**key**: value" list item anywhere in the document."""
+        for section in self.sections:
+            for block in section.blocks:
+                if isinstance(block, BulletList):
+                    for k, v in block.key_values():
+                        if k == key:
+                            return v
+        return default
+
+    def code_blocks(self, language):
+        """Sources of every fenced block in ``language`` (e.g. "mermaid"), in order."""
+        return [block.source for section in self.sections for block in section.blocks
+                if isinstance(block, CodeBlock) and block.language == language]
+
+    def section(self, title):
+        for section in self.sections:
+            if section.title == title:
+                return section
+        return None
@@ -0,0 +1,100 @@
+"""Parse cache: Markdown source -> pickled ``Document``.
+
+Rendering a project as PDF and PPTX (separate processes, or separate runs)
+parses its Markdown once: the model is stored under
+``<CACHE_DIR>/models/<key>.pickle``, keyed by the SHA-256 of the source bytes
+and of the parser/model code. Theme or layout changes do not touch the key,
+so re-renders after them skip parsing entirely. Within one process the most
+recent models are also kept in memory.
+"""
+
+import copy
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+from pathlib import Path
+
+from .parser import parse_markdown
+from .projects import CACHE_DIR
+
+MODEL_CACHE_DIR = CACHE_DIR / 'models'
+MEMORY_ENTRIES = 32
+
+_PACKAGE_DIR = Path(__file__).resolve().parent
+_parser_digest = None
+_memory = OrderedDict()
+
+
+def _code_digest():
+    """Hash of the code that decides what a parse produces."""
+    global _parser_digest
+    if _parser_digest is None:
+        h = hashlib.sha256()
+        for name in ('model.py', 'parser.py'):
+            h.update((_PACKAGE_DIR / name).read_bytes())
+        _parser_digest = h.hexdigest()
+    return _parser_digest
+
+
+def cache_key(data):
+    """Cache key for Markdown source bytes."""
+    h = hashlib.sha256(_code_digest().encode())
+    h.update(data)
+    return h.hexdigest()
+
+
+def _remember(key, doc):
+    _memory[key] = doc
+    _memory.move_to_end(key)
+    while len(_memory) > MEMORY_ENTRIES:
+        _memory.popitem(last=False)
+
+
+def _at(doc, path):
+    """doc as read from path: identical files share one model but not its source."""
+    if doc.source == path:
+        return doc
+    doc = copy.copy(doc)  # the sections stay shared
+    doc.source = path
+    return doc
+
+
+def load_document(path):
+    """``parse_file(path)``, served from the parse cache when the source is unchanged.
+
+    The returned model is shared with other callers in this process; treat
+    it as read-only. Its ``source`` is always ``path``, also when another
+    file with the same content was loaded first.
+    """
+    path = Path(path)
+    data = path.read_bytes()
+    key = cache_key(data)
+
+    doc = _memory.get(key)
+    if doc is not None:
+        _memory.move_to_end(key)
+        return _at(doc, str(path))
+
+    cache = MODEL_CACHE_DIR / f'{key}.pickle'
+    try:
+        with open(cache, 'rb') as f:
+            doc = pickle.load(f)
+    except Exception:
+        doc = None
+    if doc is not None:
+        doc = _at(doc, str(path))  # same content may live at another path
+        _remember(key, doc)
+        return doc
+
+    doc = parse_markdown(data.decode('utf-8'), source=path)
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache.with_suffix(f'.tmp{os.getpid()}')
+        with open(tmp, 'wb') as f:
+            pickle.dump(doc, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache)
+    except OSError:
+        pass  # cache is an optimisation only
+    _remember(key, doc)
+    return doc
@@ -0,0 +1,54 @@
+"""Output targets shared by the PDF and PPTX backends.
+
+``render_pdf``/``render_pptx`` accept any of:
+
+- a path: the document is written to a temporary file in the same
+  directory and renamed over the target once complete, so readers (an
+  upload step, a parallel batch, ``--watch``) never see a half-written file
+  and a failed render leaves the previous output in place;
+- ``'-'``: the document is written to standard output;
+- a writable binary stream (``io.BytesIO``, an HTTP response, a pipe),
+  written as-is without touching the disk.
+"""
+
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+STDOUT = '-'
+
+
+def is_stream(out):
+    return hasattr(out, 'write')
+
+
+def is_stdout(out):
+    return isinstance(out, (str, Path)) and str(out) == STDOUT
+
+
+@contextmanager
+def atomic_path(path):
+    """Yield a temporary path next to ``path``; it replaces ``path`` if the block succeeds."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f'.{path.name}.tmp{os.getpid()}-{threading.get_ident()}')
+    try:
+        yield tmp
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+@contextmanager
+def open_output(out):
+    """Yield what a backend should save to for ``out``: a stream or a temporary path."""
+    if is_stream(out):
+        yield out
+    elif is_stdout(out):
+        yield sys.stdout.buffer
+        sys.stdout.buffer.flush()
+    else:
+        with atomic_path(out) as tmp:
+            yield tmp
@@ -0,0 +1,160 @@
+"""Markdown parser for the Bank Profile documents (00_meta … 90_audit).
+
+Follows the section layout of ``.specify/templates/NN_*-template.md``:
+
+- ``# NN_name - 標題`` is the document title
+- ``**建立日期**: …`` lines before the first ``##`` become ``Document.meta``
+- every ``##`` … ``######`` heading opens a new ``Section``
+- lists, pipe tables, fenced code (Mermaid) and plain lines become blocks
+- HTML comments (template guidance) and horizontal rules are dropped
+"""
+
+import re
+from pathlib import Path
+
+from .model import KEY_VALUE_RE, BulletList, CodeBlock, Document, ListItem, Paragraph, Section, Table
+
+HEADING_RE = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+LIST_RE = re.compile(r'^(\s*)([-*+]|\d+[.)])\s+(.*)$')
+CHECKBOX_RE = re.compile(r'^\[[ xX]\]\s*')
+HR_RE = re.compile(r'^\s*([-*_])(\s*\1){2,}\s*$')
+TABLE_SEPARATOR_RE = re.compile(r'^\|?\s*:?-{2,}:?\s*(\|\s*:?-{2,}:?\s*)*\|?\s*$')
+BR_RE = re.compile(r'<br\s*/?>', re.IGNORECASE)
+
+INLINE_PATTERNS = [
+    (re.compile(r'\[([^\]]+)\]\([^)]*\)'), r'\1'),     # [text](link)
+    (re.compile(r'`([^`]+)`'), r'\1'),                  # `code`
+    (re.compile(r'\*\*\*(.+?)\*\*\*'), r'\1'),          # ***bold italic***
+    (re.compile(r'\*\*(.+?)\*\*'), r'\1'),              # **bold**
+    (re.compile(r'(?<![\w*])\*(?!\s)([^*]+?)\*'), r'\1'),  # *italic*, not bullets
+    (re.compile(r'(?<!\w)__(.+?)__(?!\w)'), r'\1'),     # __bold__
+]
+
+
+def strip_inline(text):
+    """Remove inline Markdown markup, keeping the visible text."""
+    for pattern, repl in INLINE_PATTERNS:
+        text = pattern.sub(repl, text)
+    return text
+
+
+def _clean(text):
+    return BR_RE.sub('\n', text.strip())
+
+
+def _split_row(line):
+    line = line.strip()
+    if line.startswith('|'):
+        line = line[1:]
+    if line.endswith('|') and not line.endswith('\\|'):
+        line = line[:-1]
+    cells = re.split(r'(?<!\\)\|', line)
+    return [_clean(cell.replace('\\|', '|')) for cell in cells]
+
+
+def parse_markdown(text, source=''):
+    """Parse Markdown text into a ``Document``."""
+    doc = Document(title='', source=str(source))
+    section = None       # current Section (None until the first "##")
+    h2_title = ''
+    block = None         # open BulletList / Table, extended line by line
+    code = None          # [language, lines] while inside a fenced block
+    in_comment = False
+
+    def add_block(new_block):
+        nonlocal section
+        if section is None:
+            # Content before the first "##" (other than metadata) gets an untitled section
+            section = Section(title='', level=2)
+            doc.sections.append(section)
+        section.blocks.append(new_block)
+
+    for raw in text.splitlines():
+        line = raw.rstrip()
+        stripped = line.strip()
+
+        if code is not None:
+            if stripped.startswith('```'):
+                add_block(CodeBlock(language=code[0], source='\n'.join(code[1])))
+                code = None
+            else:
+                code[1].append(line)
+            continue
+
+        if in_comment:
+            if '-->' in stripped:
+                in_comment = False
+            continue
+        if stripped.startswith('<!--'):
+            in_comment = '-->' not in stripped
+            continue
+
+        if stripped.startswith('```'):
+            block = None
+            code = [stripped[3:].strip(), []]
+            continue
+
+        if not stripped:
+            block = None
+            continue
+
+        heading = HEADING_RE.match(stripped)
+        if heading:
+            block = None
+            level = len(heading.group(1))
+            title = strip_inline(heading.group(2))
+            if level == 1:
+                if not doc.title:
+                    doc.title = title
+                continue
+            if level == 2:
+                h2_title = title
+            section = Section(title=title, level=level, parent='' if level == 2 else h2_title)
+            doc.sections.append(section)
+            continue
+
+        if HR_RE.match(stripped):
+            block = None
+            continue
+
+        if stripped.startswith('|'):
+            if TABLE_SEPARATOR_RE.match(stripped):
+                continue
+            cells = _split_row(stripped)
+            if isinstance(block, Table):
+                block.rows.append(cells)
+            else:
+                block = Table(headers=cells)
+                add_block(block)
+            continue
+
+        item = LIST_RE.match(line)
+        if item and not HR_RE.match(stripped):
+            indent = len(item.group(1).expandtabs(4))
+            body = CHECKBOX_RE.sub('', item.group(3))
+            list_item = ListItem(text=_clean(body), level=indent // 2, ordered=item.group(2)[0].isdigit())
+            if not isinstance(block, BulletList):
+                block = BulletList()
+                add_block(block)
+            block.items.append(list_item)
+            continue
+
+        block = None
+        if section is None:
+            meta = KEY_VALUE_RE.match(stripped)
+            if meta:
+                doc.meta[meta.group(1).strip()] = meta.group(2).strip()
+                continue
+        add_block(Paragraph(text=_clean(stripped)))
+
+    if code is not None:
+        # Unterminated fence: keep what we have rather than dropping it
+        add_block(CodeBlock(language=code[0], source='\n'.join(code[1])))
+
+    return doc
+
+
+def parse_file(path):
+    """Parse a Markdown file into a ``Document``."""
+    path = Path(path)
+    return parse_markdown(path.read_text(encoding='utf-8'), source=path)
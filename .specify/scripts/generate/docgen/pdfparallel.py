@@ -0,0 +1,172 @@
+"""Render one large PDF on several cores: split at ``##`` sections, merged.
+
+Every level-2 section already starts on a new page, so runs of sections lay
+out independently. ``render_pdf_parallel`` cuts the document into one
+contiguous part per worker, balanced by rows and list items, builds each
+part as its own PDF in a process pool and merges them in order with pypdf:
+
+- the front matter (title page, table of contents and anything before the
+  first ``##``) is built last, once the page maps of the parts are known,
+  so its ToC prints merged page numbers (``docgen/pdftoc.py``);
+- each part's bookmarks (one per ``##``/``###`` heading) are imported with
+  their page numbers shifted to the merged document, and the ToC entries
+  are linked to the pages they name after merging;
+- identical objects the parts share are written once. Each part embeds its
+  own subset of the CJK font, which is why the parts are as few as the
+  workers rather than one per section.
+
+Enable with ``--section-jobs N`` (``DOCGEN_SECTION_JOBS``; 0 = one per CPU
+core). pypdf is optional: without it, or for documents with a single
+section, the document is rendered serially as usual.
+"""
+
+import atexit
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .model import Document
+from .output import open_output
+
+ENV_VAR = 'DOCGEN_SECTION_JOBS'
+
+_pool = None
+_pool_size = 0
+_warned = False
+
+
+def section_jobs():
+    """Worker count requested for intra-document rendering (1 = off)."""
+    try:
+        jobs = int(os.environ.get(ENV_VAR) or 1)
+    except ValueError:
+        return 1
+    return jobs if jobs > 0 else os.cpu_count() or 1
+
+
+def split_document(doc, count):
+    """Split doc at "##" sections: the front matter and at most ``count`` parts of similar size.
+
+    Returns ``(front, parts)``: ``front`` holds the sections before the
+    first "##" and ``parts`` is a list of ``(first, part)``, contiguous runs
+    of sections where ``first`` is the index of the part's first section in
+    ``doc.sections``. The title page heading is not in ``front``; it is
+    looked up in the whole document.
+    """
+    groups = [[]]
+    for section in doc.sections:
+        if section.level == 2:
+            groups.append([])
+        groups[-1].append(section)
+    preamble, groups = groups[0], groups[1:]
+
+    sizes = [_size(group) for group in groups]
+    target = sum(sizes) / max(1, min(count, len(groups)))
+    parts, current, used = [], [], 0
+    for group, size in zip(groups, sizes):
+        if current and used + size / 2 > target and len(parts) < count - 1:
+            parts.append(current)
+            current, used = [], 0
+        current.extend(group)
+        used += size
+    if current:
+        parts.append(current)
+
+    front = Document(doc.title, doc.meta, preamble, doc.source)
+    first = len(preamble)
+    split = []
+    for sections in parts:
+        split.append((first, Document(doc.title, doc.meta, sections, doc.source)))
+        first += len(sections)
+    return front, split
+
+
+def _size(sections):
+    """Rough layout work for a run of sections (rows, list items, blocks)."""
+    size = 0
+    for section in sections:
+        for block in section.blocks:
+            size += len(getattr(block, 'rows', None) or getattr(block, 'items', None) or ()) + 1
+    return size
+
+
+def _get_pool(jobs):
+    global _pool, _pool_size
+    if _pool is None or _pool_size != jobs:
+        if _pool is not None:
+            _pool.shutdown()
+        from .pdfrender import init_worker
+        _pool = ProcessPoolExecutor(max_workers=jobs, initializer=init_worker)
+        _pool_size = jobs
+        atexit.register(_pool.shutdown)
+    return _pool
+
+
+def _render_part(part, path, first, mermaid_run):
+    """Build a part without title page; returns its page map and page count."""
+    from .mermaid import join_run
+    from .pdfrender import build_pdf
+    join_run(mermaid_run)  # diagrams that failed in this run stay left out
+    built = build_pdf(part, path, title_page=False, first_section=first)
+    return built.page_map, built.page_count
+
+
+def _pypdf():
+    global _warned
+    try:
+        import pypdf
+        return pypdf
+    except ImportError:
+        if not _warned:
+            print("Warning: --section-jobs needs pypdf (pip install pypdf); rendering serially",
+                  file=sys.stderr)
+            _warned = True
+        return None
+
+
+def render_pdf_parallel(doc, out, jobs):
+    """``render_pdf(doc, out)`` with the ``##`` sections built in ``jobs`` processes."""
+    from .mermaid import current_run, render_diagrams
+    from .pdfrender import build_pdf, render_pdf, title_page_heading
+    from .pdftoc import Contents
+
+    front, parts = split_document(doc, jobs)
+    pypdf = _pypdf() if len(parts) > 1 else None
+    if pypdf is None:
+        return render_pdf(doc, out)
+    from pypdf.annotations import Link
+
+    # Diagrams go to the shared cache first so the parts do not race to render them
+    render_diagrams(doc.code_blocks('mermaid'))
+
+    with tempfile.TemporaryDirectory(prefix='docgen-parts-') as tmp:
+        paths = [Path(tmp) / f'part{n:04d}.pdf' for n in range(len(parts))]
+        pool = _get_pool(len(parts))
+        futures = [pool.submit(_render_part, part, path, first, current_run())
+                   for (first, part), path in zip(parts, paths)]
+
+        # Headings of the parts, as pages counted from the end of the front matter
+        offsets, before = {}, 0
+        for future in futures:
+            page_map, pages = future.result()
+            offsets.update((key, before + page) for key, page in page_map.items())
+            before += pages
+
+        contents = Contents.from_sections(doc.sections, offsets)
+        front_path = Path(tmp) / 'front.pdf'
+        build_pdf(front, front_path, contents=contents, title=title_page_heading(doc))
+
+        writer = pypdf.PdfWriter()
+        for path in [front_path] + paths:
+            writer.append(str(path), import_outline=True)  # bookmarks shift to merged page numbers
+        for key, page, rect in contents.rects:
+            if key in contents.pages:
+                writer.add_annotation(page - 1, Link(
+                    rect=rect, target_page_index=contents.pages[key] - 1, border=[0, 0, 0]))
+        writer.add_metadata(pypdf.PdfReader(front_path).metadata or {})
+        writer.compress_identical_objects(remove_identicals=True, remove_orphans=True)
+        with open_output(out) as target:
+            writer.write(target)
+    return out
@@ -0,0 +1,210 @@
+"""PDF backend: document model -> reportlab platypus story.
+
+``render_pdf(doc, out)`` is the library entry point; ``render(source,
+output)`` and ``init_worker()`` are what the batch driver runs per job and
+per worker process. reportlab is imported here only, so PPTX-only runs and
+``--help`` never load it.
+"""
+import re
+from xml.sax.saxutils import escape
+
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import inch
+from reportlab.platypus import Image, Paragraph, Spacer, PageBreak, Table, Preformatted
+
+from .fonts import register_cjk_fonts
+from .mermaid import fit, image_size, render_diagrams
+from .model import BulletList, CodeBlock
+from .model import Paragraph as MdParagraph, Table as MdTable
+from .modelcache import load_document
+from .output import is_stream, open_output
+from .pdfparallel import render_pdf_parallel, section_jobs
+from .parser import strip_inline
+from .pdfstream import StreamingDocTemplate, StreamingTable
+from .pdftoc import LEVELS as OUTLINE_LEVELS, Contents, section_key
+from .profiling import end_section, phase, section as profile_section
+from .reproducible import enabled as reproducible
+from .theme import pdf_styles
+
+chinese_font = 'Helvetica'
+chinese_font_bold = 'Helvetica-Bold'
+styles = None  # docgen.theme.PdfStyles, set by init_worker()
+
+DIAGRAM_MAX_HEIGHT = 8*inch  # leaves room for the section heading on an A4 page
+
+def register_fonts():
+    """Register the CJK font once per process (resolution and caching in docgen/fonts.py)"""
+    global chinese_font, chinese_font_bold
+    chinese_font, chinese_font_bold = register_cjk_fonts()
+
+def init_worker():
+    """Per-process warm-up: fonts and styles are set up once, not per document"""
+    global styles
+    with phase('fonts'):
+        register_fonts()
+    with phase('styles'):
+        styles = pdf_styles(chinese_font, chinese_font_bold)
+
+BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+
+def to_markup(text):
+    """Convert inline Markdown to reportlab paragraph markup"""
+    text = BOLD_RE.sub(lambda m: '\0b' + m.group(1) + '\0/b', text)
+    text = escape(strip_inline(text))
+    return text.replace('\0b', '<b>').replace('\0/b', '</b>').replace('\n', '<br/>')
+
+def column_widths(rows, total_width):
+    """Split total_width across columns in proportion to their longest cell"""
+    def text_width(value):
+        longest = max((len(line) + sum(1 for ch in line if ord(ch) > 0x2E80)
+                       for line in str(value).split('\n')), default=0)
+        return min(max(longest, 4), 40)
+
+    ncols = max(len(row) for row in rows)
+    weights = [max(text_width(row[i]) if i < len(row) else 0 for row in rows) for i in range(ncols)]
+    total = sum(weights) or 1
+    return [total_width * w / total for w in weights]
+
+def kv_table(rows, width):
+    """Two-column key/value table (key column shaded)"""
+    data = [[Paragraph(to_markup(k), styles.header_cell), Paragraph(to_markup(v), styles.cell)]
+            for k, v in rows]
+    key_width = min(2*inch, width * 0.3)
+    table = Table(data, colWidths=[key_width, width - key_width])
+    table.setStyle(styles.table('key_column', font_size=10, padding=8))
+    return table
+
+def grid_table(headers, rows, width):
+    """Table with a shaded header row (plain grid when the header is blank).
+
+    Cells are created page by page (docgen/pdfstream.py), so a table with
+    thousands of rows never holds more than a page of Paragraphs.
+    """
+    ncols = max([len(headers)] + [len(row) for row in rows])
+    has_header = any(cell.strip() for cell in headers)
+    body = rows if has_header else (rows or [['']])
+
+    def make_row(row, style=styles.cell):
+        return [Paragraph(to_markup(c), style) for c in list(row) + [''] * (ncols - len(row))]
+
+    widths = column_widths(([headers] if has_header else []) + body, width)
+    header = make_row(headers, styles.header_cell) if has_header else None
+    return StreamingTable(body, make_row, widths, styles.table('header_row' if has_header else 'grid'),
+                          header=header)
+
+def diagram_image(path, width):
+    """Mermaid PNG scaled down to the frame (never enlarged)"""
+    w, h = fit(image_size(path), width, DIAGRAM_MAX_HEIGHT, max_scale=1)
+    return Image(str(path), width=w, height=h)
+
+def block_flowables(block, width, diagrams=None):
+    """Flowables for one document block (diagrams: Mermaid source -> PNG path)"""
+    if isinstance(block, MdParagraph):
+        if block.is_label():
+            label = strip_inline(block.text).rstrip(':：').strip()
+            return [Paragraph(escape(label), styles.h3)]
+        return [Paragraph(to_markup(block.text), styles.normal)]
+
+    if isinstance(block, BulletList):
+        rows = block.key_value_rows()
+        if rows:
+            return [kv_table(rows, width), Spacer(1, 0.2*inch)]
+        return [Paragraph("• " + to_markup(item.text), styles.nested_bullet if item.level else styles.bullet)
+                for item in block.items]
+
+    if isinstance(block, MdTable):
+        return [grid_table(block.headers, block.rows, width), Spacer(1, 0.2*inch)]
+
+    if isinstance(block, CodeBlock) and block.language != 'mermaid':
+        return [Preformatted(block.source, styles.code), Spacer(1, 0.1*inch)]
+
+    if isinstance(block, CodeBlock) and diagrams and diagrams.get(block.source):
+        return [diagram_image(diagrams[block.source], width), Spacer(1, 0.2*inch)]
+
+    # Diagrams that could not be rendered are left out
+    return []
+
+def title_page_heading(doc):
+    """Heading of the title page: the project name, else the document title"""
+    return strip_inline(doc.lookup('專案名稱')) or doc.subtitle or doc.title
+
+def build_story(doc, width, title_page=True, first_section=0, contents=None, title=None):
+    """Yield the flowable story for a parsed document, section by section.
+
+    A generator rather than a list: StreamingDocTemplate pulls flowables
+    only as layout reaches them, so memory stays flat on very large documents.
+    Without title_page (a later part of a split document, see pdfparallel.py)
+    the story starts directly with the first section; first_section is the
+    index of that section in the whole document, which names its bookmark.
+    contents (docgen/pdftoc.py) goes on its own page after the title.
+    title overrides the title page heading, which is otherwise looked up in
+    doc (the front matter of a split document lacks the sections holding it).
+    """
+    with phase('diagrams'):
+        diagrams = render_diagrams(doc.code_blocks('mermaid'))
+
+    if title_page:
+        yield Paragraph(escape(title or title_page_heading(doc)), styles.title)
+        yield Paragraph(escape(f"{doc.subtitle} ({doc.doc_type})" if doc.subtitle else doc.doc_type), styles.title)
+        yield Spacer(1, 0.3*inch)
+        info = [f"<b>{escape(key)}:</b> {escape(doc.meta[key])}" for key in ('建立日期', '文件版本') if doc.meta.get(key)]
+        if info:
+            yield Paragraph(" | ".join(info), styles.normal)
+        if contents:
+            yield PageBreak()
+            yield from contents.flowables(styles, escape)
+
+    # Each "##" section starts on a new page, like the hand-written layout.
+    # With --profile, a section's span runs until the layout pulls the next
+    # section's first flowable (up to pdfstream.LOOKAHEAD flowables early).
+    for n, section in enumerate(doc.sections):
+        profile_section(section.title or doc.title)
+        if section.level == 2 and (title_page or n):
+            yield PageBreak()
+        if section.title:
+            heading = Paragraph(escape(section.title), styles.heading(section.level))
+            if section.level in OUTLINE_LEVELS:
+                # PDF bookmark and ToC target (pdfstream.StreamingDocTemplate)
+                heading.outline_title = section.title
+                heading.outline_level = OUTLINE_LEVELS[section.level]
+                heading.outline_key = section_key(first_section + n)
+            yield heading
+        for block in section.blocks:
+            yield from block_flowables(block, width, diagrams)
+    end_section()
+
+def build_pdf(model, target, title_page=True, first_section=0, contents=None, title=None):
+    """Lay out model and write it to target (a path or binary stream); returns the StreamingDocTemplate"""
+    if styles is None:
+        init_worker()
+    doc = StreamingDocTemplate(
+        target if is_stream(target) else str(target),
+        pagesize=A4,
+        rightMargin=72, leftMargin=72,
+        topMargin=72, bottomMargin=72,
+        invariant=1 if reproducible() else None  # fixed dates, content-derived ID
+    )
+    doc.contents = contents
+    with phase('layout'):
+        doc.build(build_story(model, doc.width, title_page, first_section, contents, title))
+    return doc
+
+def render_pdf(model, out, toc=True):
+    """Render a parsed Document as PDF to out: a path (replaced atomically), '-' for stdout or a binary stream
+
+    With toc, a table of contents of the "##"/"###" sections follows the
+    title page; its entries link to the sections, as do the PDF bookmarks.
+    """
+    contents = Contents.from_sections(model.sections) if toc else None
+    with open_output(out) as target:
+        build_pdf(model, target, contents=contents)
+    return out
+
+def render(source, output):
+    """Parse one Markdown document and build it as PDF (batch job entry point)"""
+    with phase('parse'):
+        model = load_document(source)
+    jobs = section_jobs()
+    if jobs > 1:
+        return render_pdf_parallel(model, output, jobs)
+    return render_pdf(model, output)
@@ -0,0 +1,178 @@
+"""Bounded-memory PDF building for very large documents.
+
+``SimpleDocTemplate.build`` wants the whole story as a list, and a long
+Markdown table becomes one ``Table`` holding a ``Paragraph`` per cell for
+every row before the first page is laid out. For the 10,000-row audit logs
+and risk registers that some projects carry this dominates peak memory, and
+reportlab's repeated re-splitting of the remainder makes layout quadratic in
+the row count.
+
+Two pieces keep the working set to roughly one page:
+
+- ``StreamingDocTemplate.build`` accepts any iterable of flowables (a
+  generator per section) and pulls from it only as far as platypus looks
+  ahead.
+- ``StreamingTable`` turns source rows into cells one page at a time and
+  emits an ordinary ``Table`` per page, with the header row repeated.
+
+Finished pages are compressed into the canvas as they are laid out
+(``pageCompression``), so the output itself is the only part that grows with
+the document.
+"""
+
+from itertools import islice
+
+from reportlab.platypus import SimpleDocTemplate, Table
+from reportlab.platypus.flowables import Flowable
+
+from .profiling import phase
+
+# Flowables pulled ahead of the one being laid out. platypus inspects the
+# queue for keepWithNext chains, so this must exceed the longest such chain.
+LOOKAHEAD = 16
+
+# Rows measured per step while filling a page
+MEASURE_BATCH = 32
+
+
+class FlowableQueue(list):
+    """List view of a flowable iterator, filled on demand.
+
+    ``BaseDocTemplate.build`` only ever reads from the front, inserts split
+    remainders at the front and loops ``while len(flowables)``, so topping
+    the buffer up whenever its length is asked for is enough.
+    """
+
+    def __init__(self, flowables, lookahead=LOOKAHEAD):
+        super().__init__()
+        self._source = iter(flowables)
+        self._lookahead = lookahead
+
+    def __len__(self):
+        missing = self._lookahead - super().__len__()
+        if missing > 0 and self._source is not None:
+            before = super().__len__()
+            self.extend(islice(self._source, missing))
+            if super().__len__() - before < missing:
+                self._source = None
+        return super().__len__()
+
+
+class StreamingDocTemplate(SimpleDocTemplate):
+    """SimpleDocTemplate whose build() consumes flowables lazily.
+
+    A flowable with an ``outline_title`` attribute (and optional
+    ``outline_level``, default 0, and ``outline_key``) becomes a PDF
+    bookmark to the page it is drawn on; ``page_map`` records that page per
+    key and ``page_count`` is set when the build ends. ``contents`` (a
+    ``docgen.pdftoc.Contents``) gets its page numbers from ``page_map`` once
+    layout is done.
+    """
+
+    contents = None
+
+    def build(self, flowables, *args, **kwargs):
+        if not isinstance(flowables, list):
+            flowables = FlowableQueue(flowables)
+        self._outline_keys = 0
+        self._outline_level = -1
+        self.page_map = {}
+        return super().build(flowables, *args, **kwargs)
+
+    def afterFlowable(self, flowable):
+        title = getattr(flowable, 'outline_title', None)
+        if title:
+            self._outline_keys += 1
+            key = getattr(flowable, 'outline_key', None) or f'outline{self._outline_keys}'
+            # An outline level may only go one deeper than the previous entry
+            level = min(getattr(flowable, 'outline_level', 0), self._outline_level + 1)
+            self._outline_level = level
+            self.canv.bookmarkPage(key)
+            self.canv.addOutlineEntry(title, key, level=level)
+            self.page_map[key] = self.page
+
+    def _endBuild(self):
+        # Page content is already laid out; this serialises and writes the file
+        with phase('write'):
+            self._doSave = 0
+            super()._endBuild()
+            self.page_count = self.canv.getPageNumber() - 1
+            if self.contents:
+                self.contents.finish(self.canv, self.page_map, self.page_count)
+            self.canv.save()
+
+
+class StreamingTable(Flowable):
+    """Table laid out one page at a time from a row iterator.
+
+    ``make_row(raw)`` turns a source row into a list of cell flowables and
+    is only called for rows about to be placed, so at most a page of cells
+    exists at once. ``header`` (a list of cells, or None) is repeated at the
+    top of every page piece, like ``Table(repeatRows=1)``.
+    """
+
+    def __init__(self, rows, make_row, col_widths, style, header=None, _pending=None):
+        super().__init__()
+        self._rows = iter(rows)
+        self._make_row = make_row
+        self._col_widths = list(col_widths)
+        self._style = style
+        self._header = header
+        self._header_height = self._measure([header])[0] if header else 0
+        self._pending = _pending if _pending is not None else []  # [(cells, height)]
+        self._fits = 0
+        self._table = None
+
+    def _measure(self, rows):
+        """Exact row heights, as the final Table will compute them."""
+        probe = Table(rows, colWidths=self._col_widths)
+        probe.setStyle(self._style)
+        probe.wrap(sum(self._col_widths), 1e9)
+        return probe._rowHeights
+
+    def _measure_more(self):
+        batch = [self._make_row(raw) for raw in islice(self._rows, MEASURE_BATCH)]
+        if not batch:
+            return False
+        self._pending.extend(zip(batch, self._measure(batch)))
+        return True
+
+    def _piece(self, count):
+        rows = ([self._header] if self._header else []) + [cells for cells, _ in self._pending[:count]]
+        table = Table(rows, colWidths=self._col_widths, repeatRows=1 if self._header else 0)
+        table.setStyle(self._style)
+        return table
+
+    def wrap(self, availWidth, availHeight):
+        self.width = sum(self._col_widths)
+        height = self._header_height
+        index = 0
+        while True:
+            if index == len(self._pending) and not self._measure_more():
+                break
+            row_height = self._pending[index][1]
+            if height + row_height > availHeight:
+                # More rows than fit: report the measured overflow so the
+                # frame asks for a split
+                self._fits = index
+                self._table = None
+                self.height = height + row_height
+                return self.width, self.height
+            height += row_height
+            index += 1
+
+        self._fits = index
+        self._table = self._piece(index)
+        self.width, self.height = self._table.wrap(availWidth, availHeight)
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        self.wrap(availWidth, availHeight)
+        if not self._fits:
+            return []
+        rest = StreamingTable(self._rows, self._make_row, self._col_widths, self._style,
+                              header=self._header, _pending=self._pending[self._fits:])
+        return [self._piece(self._fits), rest]
+
+    def draw(self):
+        self._table.drawOn(self.canv, 0, 0)
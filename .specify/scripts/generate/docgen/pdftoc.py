@@ -0,0 +1,120 @@
+"""Table of contents for the PDF backend, laid out in a single pass.
+
+reportlab's ``TableOfContents`` settles its page numbers with
+``multiBuild``, which lays the whole story out two or three times. Here the
+contents are laid out once, before their page numbers are known:
+
+- every entry draws its page number as a reference to a form XObject (a
+  PDF page may use a form that is only defined later in the file);
+- the layout records the page each ``##``/``###`` heading lands on
+  (``StreamingDocTemplate.page_map``);
+- when layout is done, ``Contents.finish`` defines each form with the real
+  number. An entry's height does not depend on its number, so nothing
+  moves and no second pass is needed.
+
+Entries link to the heading bookmarks, which also make up the PDF outline.
+A document built in parts (``docgen/pdfparallel.py``) builds its front
+matter last, from the page maps of the parts; the entries then record where
+they were drawn (``Contents.rects``) and the links are added after merging.
+"""
+
+from reportlab.lib.units import inch
+from reportlab.platypus import Paragraph
+from reportlab.platypus.flowables import Flowable
+
+TITLE = '目錄'
+LEVELS = {2: 0, 3: 1}  # Markdown heading level -> ToC and outline level
+NUMBER_WIDTH = 0.6*inch
+
+
+def section_key(index):
+    """Bookmark name of the section at ``index`` in ``Document.sections``."""
+    return f'sec{index}'
+
+
+def _form_name(key):
+    return f'tocpage-{key}'
+
+
+class ContentsEntry(Flowable):
+    """One ToC line: the title, and a page number filled in after layout."""
+
+    def __init__(self, contents, key, paragraph):
+        super().__init__()
+        self.contents = contents
+        self.key = key
+        self.paragraph = paragraph
+
+    def wrap(self, availWidth, availHeight):
+        _, height = self.paragraph.wrap(availWidth - NUMBER_WIDTH, availHeight)
+        self.width, self.height = availWidth, height
+        return self.width, self.height
+
+    def getSpaceBefore(self):
+        return self.paragraph.getSpaceBefore()
+
+    def getSpaceAfter(self):
+        return self.paragraph.getSpaceAfter()
+
+    def draw(self):
+        canv = self.canv
+        self.paragraph.drawOn(canv, 0, 0)
+        # The number shares the baseline of the title's first line
+        canv.saveState()
+        canv.translate(self.width - NUMBER_WIDTH, self.height - self.paragraph.style.fontSize)
+        canv.doForm(_form_name(self.key))
+        canv.restoreState()
+        if self.contents.links:
+            canv.linkRect('', self.key, (0, 0, self.width, self.height), relative=1, thickness=0)
+        else:
+            x0, y0 = canv.absolutePosition(0, 0)
+            x1, y1 = canv.absolutePosition(self.width, self.height)
+            self.contents.rects.append((self.key, canv.getPageNumber(), (x0, y0, x1, y1)))
+
+
+class Contents:
+    """ToC entries ``(key, level, title)`` and, after ``finish``, their pages.
+
+    Without ``offsets`` every heading is in the same build and each entry
+    links to its bookmark. With ``offsets`` (key -> page counted from the
+    end of this PDF) the headings of those keys are in parts appended after
+    it; entries are not linked but their rectangles are kept in ``rects``.
+    """
+
+    def __init__(self, entries, offsets=None):
+        self.entries = list(entries)
+        self.offsets = offsets
+        self.links = offsets is None
+        self.rects = []    # (key, page, (x0, y0, x1, y1)), when not linked
+        self.pages = {}    # key -> page number printed in the ToC
+        self._styles = None
+
+    @classmethod
+    def from_sections(cls, sections, offsets=None):
+        """Entries for the ``##``/``###`` sections of ``Document.sections``."""
+        return cls([(section_key(n), LEVELS[section.level], section.title)
+                    for n, section in enumerate(sections) if section.title and section.level in LEVELS],
+                   offsets)
+
+    def __bool__(self):
+        return bool(self.entries)
+
+    def flowables(self, styles, markup):
+        """Yield the ToC heading and one entry per section (``markup`` escapes titles)."""
+        self._styles = styles.toc
+        yield Paragraph(TITLE, styles.h1)
+        for key, level, title in self.entries:
+            yield ContentsEntry(self, key, Paragraph(markup(title), styles.toc[level]))
+
+    def finish(self, canv, page_map, pages):
+        """Define the page-number forms; ``page_map`` is complete and this PDF has ``pages`` pages."""
+        for key, level, _ in self.entries:
+            if key in page_map:
+                self.pages[key] = page_map[key]
+            elif self.offsets and key in self.offsets:
+                self.pages[key] = pages + self.offsets[key]
+            style = self._styles[level]
+            canv.beginForm(_form_name(key))
+            canv.setFont(style.fontName, style.fontSize)
+            canv.drawRightString(NUMBER_WIDTH, 0, str(self.pages.get(key, '')))
+            canv.endForm()
@@ -0,0 +1,161 @@
+"""Portfolio roll-up across every project's 00_meta, as PDF and/or PPTX.
+
+    python3 -m docgen.portfolio pdf,pptx              # -> project/export/portfolio.{pdf,pptx}
+    python3 -m docgen.portfolio pdf --root /path/to/project -o /tmp
+
+One pass over the projects collects, per project, only what the report
+shows (``docgen/metadata.py``): identity, priority, go-live date, dated
+milestones and the 機率/影響 of each high-level risk. Parsed documents are
+dropped as soon as they are read (the parse cache keeps at most a handful),
+so memory grows with the report's rows, not with the source documents.
+
+The roll-up is expressed as an ordinary ``Document`` and rendered by the
+normal backends, so the big tables get the same pagination as project
+documents: ``StreamingTable`` page by page in the PDF, ``add_table_slide``
+with "(續)" continuation slides in the PPTX.
+"""
+
+import argparse
+import sys
+import time
+from collections import Counter
+from datetime import date
+from importlib import import_module
+from pathlib import Path
+
+from . import reproducible
+from .cli import BACKENDS, parse_formats
+from .metadata import extract_meta
+from .model import BulletList, Document, ListItem, Section, Table
+from .modelcache import load_document
+from .projects import PROJECT_ROOT, find_documents
+
+LEVELS = ('高', '中', '低')
+OTHER = '其他'
+PRIORITY_LABELS = {'P0': 'P0-Critical', 'P1': 'P1-High', 'P2': 'P2-Medium', 'P3': 'P3-Low', '': '未設定'}
+UNSCHEDULED = '未排定'
+
+
+class Portfolio:
+    """Running aggregates over the projects added so far."""
+
+    def __init__(self):
+        self.projects = []      # (project, code, name, priority, sponsor, go_live, risks)
+        self.milestones = []    # (date, project, milestone, status)
+        self.priorities = Counter()
+        self.risk_matrix = Counter()  # (probability, impact) -> count
+        self.go_live_months = Counter()
+        self.failed = []
+
+    def add(self, meta):
+        level = meta.priority_level
+        self.priorities[level] += 1
+        go_live = meta.go_live
+        self.go_live_months[go_live[:7] or UNSCHEDULED] += 1
+        self.projects.append((meta.project, meta.get('code'), meta.get('name'),
+                              PRIORITY_LABELS.get(level, level), meta.get('sponsor'), go_live, len(meta.risks)))
+        self.milestones.extend((m.date, meta.project, m.name, m.status) for m in meta.milestones if m.date)
+        for risk in meta.risks:
+            probability = risk.probability if risk.probability in LEVELS else OTHER
+            impact = risk.impact if risk.impact in LEVELS else OTHER
+            self.risk_matrix[probability, impact] += 1
+
+
+def collect(root=PROJECT_ROOT):
+    """Read every project's 00_meta once and aggregate it."""
+    portfolio = Portfolio()
+    for project_dir, _, source in find_documents(root, ('00_meta',)):
+        try:
+            portfolio.add(extract_meta(load_document(source), project_dir.name))
+        except (OSError, UnicodeDecodeError) as e:
+            portfolio.failed.append(f"{source}: {type(e).__name__}: {e}")
+    return portfolio
+
+
+def _percent(count, total):
+    return f"{count / total:.0%}" if total else '-'
+
+
+def portfolio_document(portfolio, today=None):
+    """The roll-up as a ``Document`` with one section per view."""
+    total = len(portfolio.projects)
+    risks = sum(portfolio.risk_matrix.values())
+    scheduled = total - portfolio.go_live_months.get(UNSCHEDULED, 0)
+    doc = Document('Portfolio - 專案組合總覽', meta={'建立日期': (today or date.today()).isoformat()})
+
+    summary = Section('總覽', 2, [BulletList([
+        ListItem(f"**專案數**: {total}"),
+        ListItem(f"**已排定上線日期**: {scheduled}"),
+        ListItem(f"**高階風險**: {risks}"),
+        ListItem(f"**里程碑**: {len(portfolio.milestones)}"),
+    ])])
+    doc.sections.append(summary)
+
+    rows = [[PRIORITY_LABELS[level], str(portfolio.priorities[level]), _percent(portfolio.priorities[level], total)]
+            for level in PRIORITY_LABELS if portfolio.priorities[level]]
+    rows += [[level, str(count), _percent(count, total)]
+             for level, count in sorted(portfolio.priorities.items()) if level not in PRIORITY_LABELS]
+    doc.sections.append(Section('優先等級分布', 2, [Table(['優先等級', '專案數', '比例'], rows)]))
+
+    probabilities = LEVELS + ((OTHER,) if any(p == OTHER for p, _ in portfolio.risk_matrix) else ())
+    impacts = LEVELS + ((OTHER,) if any(i == OTHER for _, i in portfolio.risk_matrix) else ())
+    matrix = [[f"機率 {p}"] + [str(portfolio.risk_matrix[p, i]) for i in impacts]
+              + [str(sum(portfolio.risk_matrix[p, i] for i in impacts))] for p in probabilities]
+    matrix.append(['合計'] + [str(sum(portfolio.risk_matrix[p, i] for p in probabilities)) for i in impacts]
+                  + [str(risks)])
+    doc.sections.append(Section('風險矩陣（機率 × 影響）', 2, [
+        Table(['機率＼影響'] + [f"影響 {i}" for i in impacts] + ['合計'], matrix),
+    ]))
+
+    months = sorted(m for m in portfolio.go_live_months if m != UNSCHEDULED)
+    if UNSCHEDULED in portfolio.go_live_months:
+        months.append(UNSCHEDULED)
+    doc.sections.append(Section('上線時程', 2, [
+        Table(['上線月份', '專案數'], [[month, str(portfolio.go_live_months[month])] for month in months]),
+    ]))
+
+    portfolio.milestones.sort()
+    doc.sections.append(Section('里程碑時程', 2, [
+        Table(['日期', '專案', '里程碑', '狀態'], [list(row) for row in portfolio.milestones]),
+    ]))
+
+    projects = sorted(portfolio.projects, key=lambda p: (p[5] or '9999', p[0]))
+    doc.sections.append(Section('專案一覽', 2, [
+        Table(['專案', '專案代號', '專案名稱', '優先等級', '發起單位', '上線日期', '風險數'],
+              [[p[0], p[1], p[2], p[3], p[4], p[5] or UNSCHEDULED, str(p[6])] for p in projects]),
+    ]))
+    return doc
+
+
+def render(doc, fmt, out):
+    module = import_module(f'{__package__}.{BACKENDS[fmt].module}')
+    return getattr(module, f'render_{fmt}')(doc, out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Roll up every project's 00_meta into one portfolio report")
+    parser.add_argument("format", type=parse_formats, help="Output format(s): pdf, pptx, docx, html or a combination such as pdf,pptx")
+    parser.add_argument("--root", default=str(PROJECT_ROOT), help="Project root (default: project/)")
+    parser.add_argument("-o", "--output-dir", help="Output directory (default: <root>/export)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    portfolio = collect(args.root)
+    for message in portfolio.failed:
+        print(f"Warning: skipped {message}", file=sys.stderr)
+    if not portfolio.projects:
+        parser.error(f"no project 00_meta documents under {args.root}")
+    doc = portfolio_document(portfolio, today=reproducible.timestamp().date() if reproducible.enabled() else None)
+    print(f"Collected {len(portfolio.projects)} projects in {time.perf_counter() - start:.2f} s")
+
+    out_dir = Path(args.output_dir or Path(args.root) / 'export')
+    for fmt in args.format:
+        start = time.perf_counter()
+        out = render(doc, fmt, out_dir / f'portfolio.{fmt}')
+        print(f"Portfolio {BACKENDS[fmt].label} generated successfully: {out} "
+              f"({time.perf_counter() - start:.2f} s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
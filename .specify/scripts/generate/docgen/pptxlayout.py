@@ -0,0 +1,111 @@
+"""Themed slide master and layouts for the PPTX generator.
+
+The slide chrome (white background, title bar, title and subtitle fonts and
+colours) lives on the slide master and two layouts instead of being drawn
+as shapes on every slide. Slides only fill the title placeholders, so a
+100-slide deck no longer carries 200 full-slide rectangles.
+
+The themed template is built once per process from python-pptx's default
+template, with the layouts the generator does not use removed, and every
+presentation is opened from the saved bytes.
+"""
+
+from functools import lru_cache
+from io import BytesIO
+
+from .theme import PALETTE, PPTX_FONT_SIZES, pptx_color
+
+TITLE_LAYOUT = 'Title Slide'
+CONTENT_LAYOUT = 'Title Only'
+
+SLIDE_WIDTH_IN = 10
+SLIDE_HEIGHT_IN = 7.5
+TITLE_BAR_HEIGHT_IN = 0.9
+
+
+def _text_style(font_size, color, bold=False, align='l', anchor='ctr'):
+    """<a:bodyPr>/<a:lstStyle> for a layout placeholder's first level."""
+    bold_attr = ' b="1"' if bold else ''
+    return (
+        f'<a:bodyPr xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" anchor="{anchor}">'
+        '<a:noAutofit/></a:bodyPr>',
+        f'<a:lstStyle xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
+        f'<a:lvl1pPr algn="{align}"><a:defRPr sz="{font_size * 100}"{bold_attr}>'
+        f'<a:solidFill><a:srgbClr val="{PALETTE[color]}"/></a:solidFill></a:defRPr></a:lvl1pPr>'
+        '</a:lstStyle>',
+    )
+
+
+def _style_placeholder(placeholder, box, font_size, color, bold=False, align='l', anchor='ctr'):
+    from pptx.oxml import parse_xml
+    from pptx.util import Inches
+
+    placeholder.left, placeholder.top, placeholder.width, placeholder.height = (Inches(v) for v in box)
+    body_pr, lst_style = (parse_xml(xml) for xml in _text_style(font_size, color, bold, align, anchor))
+    tx_body = placeholder._element.txBody
+    tx_body.replace(tx_body.bodyPr, body_pr)
+    tx_body.replace(tx_body.find(lst_style.tag), lst_style)
+
+
+def _add_title_bar(layout):
+    """Primary-coloured bar across the top, behind the title placeholder."""
+    from pptx.oxml.shapes.autoshape import CT_Shape
+    from pptx.shapes.autoshape import Shape
+    from pptx.util import Inches
+
+    sp_tree = layout.shapes._spTree
+    sp = CT_Shape.new_autoshape_sp(
+        sp_tree.max_shape_id + 1, 'Title Bar', 'rect', 0, 0, Inches(SLIDE_WIDTH_IN), Inches(TITLE_BAR_HEIGHT_IN))
+    sp_tree.insert(2, sp)  # after nvGrpSpPr/grpSpPr, i.e. at the back
+    bar = Shape(sp, None)
+    bar.fill.solid()
+    bar.fill.fore_color.rgb = pptx_color('primary')
+    bar.line.fill.background()
+
+
+@lru_cache(maxsize=None)
+def themed_template():
+    """Bytes of the themed .pptx template (built once per process)."""
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    prs = Presentation()
+    prs.slide_width = Inches(SLIDE_WIDTH_IN)
+    prs.slide_height = Inches(SLIDE_HEIGHT_IN)
+
+    master = prs.slide_master
+    master.background.fill.solid()
+    master.background.fill.fore_color.rgb = pptx_color('white')
+
+    layouts = {layout.name: layout for layout in master.slide_layouts}
+    title_layout, content_layout = layouts[TITLE_LAYOUT], layouts[CONTENT_LAYOUT]
+
+    placeholders = {p.placeholder_format.idx: p for p in title_layout.placeholders}
+    _style_placeholder(placeholders[0], (1, 2.5, 8, 1.5), PPTX_FONT_SIZES['title'], 'primary',
+                       bold=True, align='ctr', anchor='b')
+    _style_placeholder(placeholders[1], (1, 4.2, 8, 1), PPTX_FONT_SIZES['subtitle'], 'secondary',
+                       align='ctr', anchor='t')
+
+    _add_title_bar(content_layout)
+    placeholders = {p.placeholder_format.idx: p for p in content_layout.placeholders}
+    _style_placeholder(placeholders[0], (0.5, 0.15, 9, 0.6), PPTX_FONT_SIZES['slide_title'], 'white',
+                       bold=True)
+
+    for layout in list(master.slide_layouts):
+        if layout.name not in (TITLE_LAYOUT, CONTENT_LAYOUT):
+            master.slide_layouts.remove(layout)
+
+    buffer = BytesIO()
+    prs.save(buffer)
+    return buffer.getvalue()
+
+
+def new_presentation():
+    """Empty presentation using the themed master and layouts."""
+    from pptx import Presentation
+    return Presentation(BytesIO(themed_template()))
+
+
+def get_layout(prs, name):
+    """Slide layout by name (TITLE_LAYOUT or CONTENT_LAYOUT)."""
+    return next(l for l in prs.slide_layouts if l.name == name)
@@ -0,0 +1,221 @@
+"""PPTX backend: document model -> slides (python-pptx).
+
+``render_pptx(doc, out)`` is the library entry point; ``render(source,
+output)`` is the per-job function used by the batch driver. python-pptx is
+imported here only, so PDF-only runs never load it.
+"""
+
+from pptx.util import Inches, Pt
+
+from .mermaid import fit, image_size, render_diagrams
+from .model import BulletList, CodeBlock, Paragraph, Table
+from .modelcache import load_document
+from .output import open_output
+from .parser import strip_inline
+from .pptxlayout import CONTENT_LAYOUT, TITLE_LAYOUT, get_layout, new_presentation, themed_template
+from .pptxtable import fill_table, paginate
+from .pptxtext import fit_paragraphs
+from .profiling import end_section, phase, section as profile_section
+from .reproducible import save_package
+from .theme import PPTX_FONT_SIZES, pptx_color
+
+# Color scheme (Banking/Professional theme, shared with the PDF generator)
+COLOR_PRIMARY = pptx_color('primary')  # Dark Blue #2E5090
+COLOR_SECONDARY = pptx_color('secondary')  # Medium Blue #4472C4
+COLOR_ACCENT = pptx_color('accent')  # Light Blue #5B9BD5
+COLOR_TEXT = pptx_color('text')  # Dark Gray #333333
+COLOR_BG = pptx_color('background')  # Light Gray Background
+COLOR_WHITE = pptx_color('white')
+COLOR_HEADER_FILL = pptx_color('header_fill')  # Light blue
+
+# Table area below the title bar; longer tables continue on the next slide
+TABLE_WIDTH = Inches(9)
+TABLE_MAX_HEIGHT = Inches(5.5)
+CONTINUED = " (續)"
+
+# Diagram area (left, top, width, height) below the title bar
+DIAGRAM_AREA = (Inches(0.5), Inches(1.2), Inches(9), Inches(6))
+
+# Bullet text box (left, top, width, height), its default insets, and the
+# smallest body size used before bullets continue on another slide
+TEXT_BOX = (Inches(0.7), Inches(1.3), Inches(8.6), Inches(5.7))
+TEXT_INSET_X = Inches(0.1)
+TEXT_INSET_Y = Inches(0.05)
+PARAGRAPH_SPACING = 6  # pt before and after each bullet
+BODY_MIN_SIZE = 12
+
+def add_title_slide(prs, title, subtitle):
+    """Add a title slide (fonts and placement come from the themed layout)"""
+    slide = prs.slides.add_slide(get_layout(prs, TITLE_LAYOUT))
+    slide.shapes.title.text = title
+    slide.placeholders[1].text = subtitle
+    return slide
+
+def add_titled_slide(prs, title):
+    """Add a slide on the title-bar layout (background and bar are on the master)"""
+    slide = prs.slides.add_slide(get_layout(prs, CONTENT_LAYOUT))
+    slide.shapes.title.text = title
+    return slide
+
+def add_content_slide(prs, title, bullets):
+    """Add bullets on one slide, shrinking the font or continuing on "… (續)" slides
+
+    Bullets are measured against the text box (docgen/pptxtext.py): the body
+    size shrinks in 1 pt steps down to BODY_MIN_SIZE if that makes them fit,
+    otherwise they are split across slides at the normal size.
+    """
+    left, top, width, height = TEXT_BOX
+    size, pages = fit_paragraphs(
+        bullets, width - 2 * TEXT_INSET_X, height - 2 * TEXT_INSET_Y,
+        PPTX_FONT_SIZES['body'], BODY_MIN_SIZE, spacing_pt=2 * PARAGRAPH_SPACING
+    )
+
+    slides = []
+    for n, page in enumerate(pages):
+        slide = add_titled_slide(prs, title if n == 0 else f"{title}{CONTINUED}")
+        text_frame = slide.shapes.add_textbox(left, top, width, height).text_frame
+        text_frame.word_wrap = True
+
+        for i, bullet in enumerate(page):
+            if i > 0:
+                p = text_frame.add_paragraph()
+            else:
+                p = text_frame.paragraphs[0]
+            p.text = bullet
+            p.level = 0
+            p.font.size = Pt(size)
+            p.font.color.rgb = COLOR_TEXT
+            p.space_before = Pt(PARAGRAPH_SPACING)
+            p.space_after = Pt(PARAGRAPH_SPACING)
+        slides.append(slide)
+    return slides
+
+def add_table_slide(prs, title, headers, rows):
+    """Add a table, continued on further slides with the header repeated
+
+    Row heights are estimated from the text so each slide holds what fits in
+    the table area; continuation slides are titled "… (續)".
+    """
+    with phase('table', rows=len(rows)):
+        return _add_table_slides(prs, title, headers, rows)
+
+def _add_table_slides(prs, title, headers, rows):
+    ncols = max([len(headers)] + [len(row) for row in rows])
+    headers = list(headers) + [''] * (ncols - len(headers))
+    rows = [list(row) + [''] * (ncols - len(row)) for row in rows]
+    col_widths = [int(TABLE_WIDTH / ncols)] * ncols
+    header_height, pages = paginate(
+        headers, rows, col_widths, TABLE_MAX_HEIGHT,
+        PPTX_FONT_SIZES['table_header'], PPTX_FONT_SIZES['table_body']
+    )
+
+    slides = []
+    for n, page in enumerate(pages):
+        slide = add_titled_slide(prs, title if n == 0 else f"{title}{CONTINUED}")
+        height = header_height + sum(h for _, h in page)
+        table = slide.shapes.add_table(
+            1, ncols,
+            Inches(0.5), Inches(1.5),
+            TABLE_WIDTH, height
+        ).table
+        fill_table(table, headers, header_height, page,
+                   PPTX_FONT_SIZES['table_header'], PPTX_FONT_SIZES['table_body'])
+        slides.append(slide)
+    return slides
+
+def add_diagram_slide(prs, title, image_path):
+    """Add a slide with a Mermaid diagram scaled to the content area and centred"""
+    slide = add_titled_slide(prs, title)
+    width, height = fit(image_size(image_path), DIAGRAM_AREA[2], DIAGRAM_AREA[3])
+    left = DIAGRAM_AREA[0] + (DIAGRAM_AREA[2] - width) / 2
+    top = DIAGRAM_AREA[1] + (DIAGRAM_AREA[3] - height) / 2
+    slide.shapes.add_picture(str(image_path), int(left), int(top), int(width), int(height))
+    return slide
+
+def section_title(section):
+    """Slide title for a section: "專案範圍 - 範圍內 (In Scope)" for sub-sections"""
+    if section.level > 2 and section.parent:
+        return f"{section.parent} - {section.title}"
+    return section.title
+
+def block_lines(block, nested=False):
+    """Flatten a paragraph or list block into slide bullet lines
+
+    Items listed under a "**label**:" line are indented one level.
+    """
+    if isinstance(block, Paragraph):
+        return [strip_inline(block.text)]
+    lines = []
+    for item in block.items:
+        text = strip_inline(item.text)
+        level = item.level + (1 if nested else 0)
+        lines.append(f"{'  ' * level}• {text}" if level else text)
+    return lines
+
+def build_presentation(doc):
+    """Build a presentation from a parsed document model"""
+    prs = new_presentation()
+
+    # Slide 1: Title
+    title = strip_inline(doc.lookup('專案名稱')) or doc.subtitle or doc.title
+    subtitle = f"{doc.subtitle} ({doc.doc_type})" if doc.subtitle else doc.doc_type
+    if doc.meta.get('建立日期'):
+        subtitle += f" | {doc.meta['建立日期']}"
+    add_title_slide(prs, title, subtitle)
+    with phase('diagrams'):
+        diagrams = render_diagrams(doc.code_blocks('mermaid'))
+
+    # One content slide per run of text blocks, one slide per table or diagram
+    for section in doc.sections:
+        title = section_title(section)
+        profile_section(title)
+        bullets = []
+        nested = False
+        for block in section.blocks:
+            if isinstance(block, Table):
+                if bullets:
+                    add_content_slide(prs, title, bullets)
+                    bullets = []
+                nested = False
+                add_table_slide(
+                    prs, title,
+                    [strip_inline(h) for h in block.headers],
+                    [[strip_inline(c) for c in row] for row in block.rows]
+                )
+            elif isinstance(block, (Paragraph, BulletList)):
+                if isinstance(block, Paragraph):
+                    if bullets and block.is_label():
+                        bullets.append("")
+                    nested = block.is_label()
+                bullets.extend(block_lines(block, nested))
+            elif isinstance(block, CodeBlock) and block.language == 'mermaid' and diagrams.get(block.source):
+                if bullets:
+                    add_content_slide(prs, title, bullets)
+                    bullets = []
+                nested = False
+                add_diagram_slide(prs, title, diagrams[block.source])
+            # Other code blocks (ASCII diagrams) and unrendered diagrams are skipped
+        if bullets:
+            add_content_slide(prs, title, bullets)
+    end_section()
+
+    return prs
+
+def init_worker():
+    """Per-process warm-up: build the themed slide template once"""
+    with phase('template'):
+        themed_template()
+
+def render_pptx(doc, out):
+    """Render a parsed Document as PPTX to out: a path (replaced atomically), '-' for stdout or a binary stream"""
+    with phase('build'):
+        prs = build_presentation(doc)
+    with phase('save'), open_output(out) as target:
+        save_package(prs, target)
+    return out
+
+def render(source, output):
+    """Parse one Markdown document and save it as PPTX (batch job entry point)"""
+    with phase('parse'):
+        model = load_document(source)
+    return render_pptx(model, output)
@@ -0,0 +1,92 @@
+"""Table measurement, pagination and cell formatting for the PPTX generator.
+
+python-pptx tables do not grow or split on their own: a 300-row risk
+register placed in one 9×5.5 inch table simply runs off the slide. Row
+heights are measured here from the text (``docgen/pptxtext.py``), rows
+are grouped into slide-sized pages, and each page is written as
+DrawingML in one pass rather than through per-cell
+``text_frame.paragraphs[0].font`` lookups, which dominate the cost on large
+tables.
+"""
+
+from xml.sax.saxutils import escape
+
+from .pptxtext import EMU_PER_PT, LINE_SPACING, count_lines
+from .theme import PALETTE
+
+EMU_PER_INCH = 914400
+
+# python-pptx / PowerPoint default cell margins
+CELL_MARGIN_X = 0.1 * EMU_PER_INCH
+CELL_MARGIN_Y = 0.05 * EMU_PER_INCH
+
+_NS = 'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
+
+
+def text_lines(text, width_emu, font_size):
+    """Number of wrapped lines ``text`` needs in a box ``width_emu`` wide."""
+    return count_lines(text, width_emu / EMU_PER_PT, font_size)
+
+
+def row_height(cells, col_widths, font_size):
+    """Estimated rendered height (EMU) of one table row."""
+    lines = max((text_lines(text, width - 2 * CELL_MARGIN_X, font_size)
+                 for text, width in zip(cells, col_widths)), default=1)
+    return int(lines * font_size * LINE_SPACING * EMU_PER_PT + 2 * CELL_MARGIN_Y)
+
+
+def paginate(headers, rows, col_widths, max_height, header_size, body_size):
+    """Split rows into pages that fit under a repeated header row.
+
+    Returns (header_height, [[(row, height), ...], ...]). A single row taller
+    than a page gets a page of its own.
+    """
+    header_height = row_height(headers, col_widths, header_size)
+    budget = max_height - header_height
+    pages, page, used = [], [], 0
+    for row in rows:
+        height = row_height(row, col_widths, body_size)
+        if page and used + height > budget:
+            pages.append(page)
+            page, used = [], 0
+        page.append((row, height))
+        used += height
+    if page or not pages:
+        pages.append(page)
+    return header_height, pages
+
+
+def _cell_xml(text, font_size, color, bold=False, fill=None):
+    bold_attr = ' b="1"' if bold else ''
+    run_props = (f'<a:rPr lang="zh-TW" sz="{font_size * 100}"{bold_attr} dirty="0">'
+                 f'<a:solidFill><a:srgbClr val="{color}"/></a:solidFill></a:rPr>')
+    paragraphs = ''.join(
+        f'<a:p><a:r>{run_props}<a:t>{escape(line)}</a:t></a:r></a:p>' if line else
+        f'<a:p><a:endParaRPr sz="{font_size * 100}"/></a:p>'
+        for line in str(text).split('\n')
+    )
+    cell_props = f'<a:tcPr><a:solidFill><a:srgbClr val="{fill}"/></a:solidFill></a:tcPr>' if fill else '<a:tcPr/>'
+    return f'<a:tc><a:txBody><a:bodyPr/><a:lstStyle/>{paragraphs}</a:txBody>{cell_props}</a:tc>'
+
+
+def _row_xml(cells, height, font_size, bold=False, fill=None):
+    color = PALETTE['text']
+    return f'<a:tr h="{height}">' + ''.join(
+        _cell_xml(text, font_size, color, bold, fill) for text in cells) + '</a:tr>'
+
+
+def fill_table(table, headers, header_height, page, header_size, body_size):
+    """Replace the rows of a python-pptx table with one header row and ``page``.
+
+    ``page`` is a list of (cells, height) from ``paginate``; every cell gets
+    the theme font size and colour on its runs, the header the shaded fill.
+    """
+    from pptx.oxml import parse_xml
+
+    tbl = table._tbl
+    for tr in tbl.findall('{http://schemas.openxmlformats.org/drawingml/2006/main}tr'):
+        tbl.remove(tr)
+    xml = _row_xml(headers, header_height, header_size, bold=True, fill=PALETTE['header_fill'])
+    xml += ''.join(_row_xml(cells, height, body_size) for cells, height in page)
+    for tr in list(parse_xml(f'<a:tbl {_NS}>{xml}</a:tbl>')):
+        tbl.append(tr)
@@ -0,0 +1,150 @@
+"""Text measurement and fitting for the PPTX generator.
+
+python-pptx writes text without laying it out, so a long bullet list just
+runs off the bottom of its textbox. Here text is measured before it is
+placed: advance widths come from the CJK font that ``docgen/fonts.py``
+resolves (read with Pillow's FreeType binding), lines are wrapped greedily
+(CJK characters break anywhere, Latin text at spaces), and a paragraph's
+height follows from its line count, the line spacing and the paragraph
+spacing.
+
+Widths are kept in one table per (font, size), filled the first time each
+character is seen, so the cost per string is a dict lookup per character
+however many bullets a batch lays out. Without a usable font file the
+tables fall back to a per-character estimate (CJK one em, Latin about half).
+"""
+
+import re
+from functools import lru_cache
+
+EMU_PER_PT = 12700
+LINE_SPACING = 1.2
+
+# Latin words (with trailing spaces) stay together; CJK characters and
+# fullwidth forms are break opportunities on their own.
+_CJK = '\u2e80-\u9fff\uac00-\ud7af\uf900-\ufaff\ufe30-\ufe4f\uff00-\uffef'
+TOKEN_RE = re.compile(f'[{_CJK}]|[^\\s{_CJK}]+\\s*|\\s+')
+
+# Measure at a multiple of the target size so hinting does not round every advance
+_OVERSAMPLE = 16
+_UNMAPPED = '\U000ffffd'  # private use: no font maps it, so it measures as .notdef
+
+
+def char_width(ch):
+    """Approximate advance of one character in em (used when no font is available)."""
+    code = ord(ch)
+    if code >= 0x2E80 or 0xFF00 <= code <= 0xFFEF:
+        return 1.0
+    if ch in 'il.,:;|!\'` ':
+        return 0.3
+    if ch.isupper() or ch in 'mwMW@%':
+        return 0.7
+    return 0.55
+
+
+@lru_cache(maxsize=1)
+def measure_font():
+    """Path of the font used for measuring, or None."""
+    from .fonts import find_fonts
+    candidates = find_fonts()
+    return candidates[0][0] if candidates else None
+
+
+class GlyphWidths(dict):
+    """Character -> advance width in points for one font at one size."""
+
+    def __init__(self, font_path, size):
+        super().__init__()
+        self.size = size
+        self._face = None
+        if font_path:
+            try:
+                from PIL import ImageFont
+                self._face = ImageFont.truetype(font_path, size * _OVERSAMPLE)
+                self._notdef = self._face.getlength(_UNMAPPED)
+            except (ImportError, OSError):
+                self._face = None
+
+    def __missing__(self, ch):
+        width = None
+        if self._face is not None:
+            width = self._face.getlength(ch)
+            # A glyph the font lacks measures as .notdef; PowerPoint will
+            # substitute another font, so estimate it instead
+            width = width / _OVERSAMPLE if width != self._notdef or ch.isascii() else None
+        if width is None:
+            width = char_width(ch) * self.size
+        self[ch] = width
+        return width
+
+
+@lru_cache(maxsize=None)
+def glyph_widths(size, font_path=None):
+    """Shared width table for ``size`` points (in the measuring font by default)."""
+    return GlyphWidths(font_path or measure_font(), size)
+
+
+def count_lines(text, width_pt, size):
+    """Number of lines ``text`` wraps to in a column ``width_pt`` points wide."""
+    widths = glyph_widths(size)
+    width_pt = max(width_pt, size)
+    lines = 0
+    for paragraph in str(text).split('\n'):
+        count, used = 1, 0.0
+        for token in TOKEN_RE.findall(paragraph):
+            advance = sum(widths[ch] for ch in token)
+            if used and used + advance > width_pt:
+                if token.isspace():
+                    continue  # a break swallows the space
+                count += 1
+                used = 0.0
+            if advance > width_pt:  # a word longer than the line is broken anywhere
+                count += int(advance // width_pt)
+                advance %= width_pt
+            used += advance
+        lines += count
+    return lines
+
+
+def paragraph_height(text, width_emu, size, spacing_pt=0):
+    """Rendered height (EMU) of one paragraph, including its spacing."""
+    lines = count_lines(text, width_emu / EMU_PER_PT, size)
+    return int((lines * size * LINE_SPACING + spacing_pt) * EMU_PER_PT)
+
+
+def _fits(paragraphs, width_emu, height_emu, size, spacing_pt):
+    used = 0
+    for paragraph in paragraphs:
+        used += paragraph_height(paragraph, width_emu, size, spacing_pt)
+        if used > height_emu:
+            return False  # stop measuring a list that is already too long
+    return True
+
+
+def fit_paragraphs(paragraphs, width_emu, height_emu, size, min_size, spacing_pt=0):
+    """Choose a font size and split paragraphs into boxes of the given size.
+
+    Tries ``size`` down to ``min_size`` (1 pt steps) for a size at which
+    everything fits in one box. If none does, the paragraphs are split
+    into several boxes at ``size``; a paragraph taller than a box gets a box of
+    its own. Returns (font_size, [[paragraph, ...], ...]).
+    """
+    for candidate in range(size, min_size - 1, -1):
+        if _fits(paragraphs, width_emu, height_emu, candidate, spacing_pt):
+            return candidate, [list(paragraphs)]
+
+    pages, page, used = [], [], 0
+    for paragraph in paragraphs:
+        if not page and not paragraph.strip():
+            continue  # no blank separator at the top of a continuation
+        height = paragraph_height(paragraph, width_emu, size, spacing_pt)
+        if page and used + height > height_emu:
+            pages.append(page)
+            page, used = [], 0
+            if not paragraph.strip():
+                continue
+        page.append(paragraph)
+        used += height
+    if page or not pages:
+        pages.append(page)
+    return size, pages
@@ -0,0 +1,186 @@
+"""Opt-in per-phase profiling (``--profile``).
+
+When ``DOCGEN_PROFILE`` is set (the CLI sets it, so pool workers inherit
+it), every rendered document records:
+
+- spans for its phases: parse, diagrams, layout/write (PDF), build,
+  table and save (PPTX), and one span per document section;
+- per span, the wall time and the tracemalloc net and peak traced memory;
+- the output file size.
+
+Worker start-up (font registration, style and template construction) is
+recorded as process-level spans and attached to the first document the
+process renders. Profiles travel back to the parent in
+``JobResult.profile``, which writes ``<dir>/<fmt>-profile.json`` and a
+Chrome trace (``<dir>/<fmt>-trace.json``, open in chrome://tracing or
+Perfetto) and prints the slowest documents.
+
+With profiling off, ``phase()`` and ``section()`` cost one global lookup.
+"""
+
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+ENV_VAR = 'DOCGEN_PROFILE'
+
+_active = None   # Profiler for the job running in this process
+_pending = []    # process-level spans (worker init) not yet attached to a job
+
+
+def enabled():
+    return bool(os.environ.get(ENV_VAR))
+
+
+def _now_us():
+    return time.perf_counter_ns() / 1000
+
+
+class Profiler:
+    """Collects trace events for one document."""
+
+    def __init__(self):
+        self.events = []
+        self._peaks = []  # running peak of child spans, one per open span
+        self._section = None
+
+    @contextmanager
+    def phase(self, name, cat='phase', **args):
+        start = _now_us()
+        current, peak_before = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        self._peaks.append(0)
+        try:
+            yield
+        finally:
+            after, peak = tracemalloc.get_traced_memory()
+            peak = max(peak, self._peaks.pop())
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], peak)
+            args.update(alloc_kb=round((after - current) / 1024, 1), peak_kb=round(peak / 1024, 1))
+            self.events.append({'name': name, 'cat': cat, 'ph': 'X', 'ts': start,
+                                'dur': _now_us() - start, 'pid': os.getpid(), 'tid': 0, 'args': args})
+
+    def section(self, title):
+        """Close the previous section span and open one for ``title``."""
+        self.end_section()
+        span = self.phase(title, cat='section')
+        span.__enter__()
+        self._section = span
+
+    def end_section(self):
+        if self._section is not None:
+            span, self._section = self._section, None
+            span.__exit__(None, None, None)
+
+
+@contextmanager
+def phase(name, cat='phase', **args):
+    """Time a phase of the current job (or of worker start-up)."""
+    if _active is not None:
+        with _active.phase(name, cat, **args):
+            yield
+    elif enabled():
+        start = _now_us()
+        try:
+            yield
+        finally:
+            _pending.append({'name': name, 'cat': 'init', 'ph': 'X', 'ts': start, 'dur': _now_us() - start,
+                             'pid': os.getpid(), 'tid': 0, 'args': args})
+    else:
+        yield
+
+
+def section(title):
+    """Mark the start of a document section (spans run until the next one)."""
+    if _active is not None:
+        _active.section(title)
+
+
+def end_section():
+    """Close the open section span, if any."""
+    if _active is not None:
+        _active.end_section()
+
+
+def start_job(source):
+    """Begin profiling one document; returns a token for finish_job (None when off)."""
+    global _active
+    if not enabled():
+        return None
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    _active = Profiler()
+    span = _active.phase(Path(source).name, cat='document', source=str(source))
+    span.__enter__()
+    return _active, span
+
+
+def finish_job(token, output):
+    """End the document span; returns the profile dict for JobResult."""
+    global _active
+    if token is None:
+        return None
+    profiler, span = token
+    profiler.end_section()
+    try:
+        output_bytes = Path(output).stat().st_size
+    except OSError:
+        output_bytes = 0
+    span.__exit__(None, None, None)
+    document = profiler.events[-1]
+    document['args']['output_bytes'] = output_bytes
+    events = _pending + profiler.events
+    _pending.clear()
+    _active = None
+    return {'seconds': document['dur'] / 1e6, 'output_bytes': output_bytes, 'events': events}
+
+
+def _phase_totals(events, cat):
+    totals = {}
+    for event in events:
+        if event['cat'] == cat:
+            totals[event['name']] = totals.get(event['name'], 0) + event['dur'] / 1e6
+    return totals
+
+
+def write_reports(results, ext, directory, top=10):
+    """Write <ext>-profile.json and <ext>-trace.json; print the slowest documents."""
+    profiled = [r for r in results if r.profile]
+    if not profiled:
+        return
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    documents = []
+    for result in profiled:
+        events = result.profile['events']
+        documents.append({
+            'source': result.source,
+            'output': result.output,
+            'seconds': round(result.profile['seconds'], 4),
+            'output_bytes': result.profile['output_bytes'],
+            'phases': {k: round(v, 4) for k, v in _phase_totals(events, 'phase').items()},
+            'init': {k: round(v, 4) for k, v in _phase_totals(events, 'init').items()},
+            'sections': [{'title': e['name'], 'seconds': round(e['dur'] / 1e6, 4),
+                          'alloc_kb': e['args']['alloc_kb'], 'peak_kb': e['args']['peak_kb']}
+                         for e in events if e['cat'] == 'section'],
+            'peak_kb': next((e['args']['peak_kb'] for e in events if e['cat'] == 'document'), 0),
+        })
+    documents.sort(key=lambda d: d['seconds'], reverse=True)
+
+    (directory / f'{ext}-profile.json').write_text(
+        json.dumps({'documents': documents}, ensure_ascii=False, indent=2), encoding='utf-8')
+    trace = [event for result in profiled for event in result.profile['events']]
+    (directory / f'{ext}-trace.json').write_text(
+        json.dumps({'traceEvents': trace, 'displayTimeUnit': 'ms'}, ensure_ascii=False), encoding='utf-8')
+
+    print(f"\nSlowest {ext.upper()} documents (profile: {directory / f'{ext}-profile.json'}):")
+    for doc in documents[:top]:
+        phases = ', '.join(f"{name} {seconds * 1000:.0f}ms"
+                           for name, seconds in sorted(doc['phases'].items(), key=lambda kv: -kv[1])[:3])
+        print(f"  {doc['seconds'] * 1000:8.0f} ms  {doc['output_bytes'] / 1024:8.1f} KB  "
+              f"{doc['peak_kb'] / 1024:6.1f} MB peak  {doc['source']}  [{phases}]")
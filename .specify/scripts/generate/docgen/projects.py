@@ -0,0 +1,89 @@
+"""Locate Bank Profile projects and their documents.
+
+Layout (see ARCHITECTURE.md)::
+
+    project/###-NAME/
+    ├── meta/00_meta.md
+    ├── business/10_business.md
+    ├── process/20_system_flow.md … 50_software_arch.md
+    ├── law/60_law.md
+    ├── infosec/70_infosec.md
+    ├── nfr/80_nfr.md
+    ├── audit/90_audit.md
+    └── export/            # generated PDF/PPTX/DOCX
+"""
+
+import os
+import re
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+PROJECT_ROOT = REPO_ROOT / 'project'
+TEMPLATE_DIR = REPO_ROOT / '.specify' / 'templates'
+# Build manifests, parsed font metrics and other generator caches
+CACHE_DIR = Path(os.environ.get('DOCGEN_CACHE_DIR') or REPO_ROOT / '.temp' / 'docgen')
+
+# Document type -> sub-directory inside a project
+DOC_TYPES = {
+    '00_meta': 'meta',
+    '10_business': 'business',
+    '20_system_flow': 'process',
+    '30_network_arch': 'process',
+    '40_hardware_arch': 'process',
+    '50_software_arch': 'process',
+    '60_law': 'law',
+    '70_infosec': 'infosec',
+    '80_nfr': 'nfr',
+    '90_audit': 'audit',
+}
+
+PROJECT_DIR_RE = re.compile(r'^\d{3}-')
+
+
+def find_projects(root=PROJECT_ROOT):
+    """Return project directories (``###-NAME``) under root, sorted by name."""
+    root = Path(root)
+    if not root.is_dir():
+        return []
+    return sorted(p for p in root.iterdir() if p.is_dir() and PROJECT_DIR_RE.match(p.name))
+
+
+def document_path(project_dir, doc_type):
+    return Path(project_dir) / DOC_TYPES[doc_type] / f'{doc_type}.md'
+
+
+def template_path(doc_type):
+    return TEMPLATE_DIR / f'{doc_type}-template.md'
+
+
+def export_path(project_dir, doc_type, ext):
+    return Path(project_dir) / 'export' / f'{doc_type}.{ext}'
+
+
+def find_documents(root=PROJECT_ROOT, doc_types=('00_meta',)):
+    """Yield (project_dir, doc_type, source_path) for every existing document."""
+    for project_dir in find_projects(root):
+        for doc_type in doc_types:
+            source = document_path(project_dir, doc_type)
+            if source.is_file():
+                yield project_dir, doc_type, source
+
+
+def default_output(source, ext):
+    """Output path for a source document: the project's export/ dir when the
+    source sits in the standard layout, otherwise next to the source."""
+    source = Path(source)
+    if DOC_TYPES.get(source.stem) == source.parent.name:
+        return export_path(source.parent.parent, source.stem, ext)
+    return source.with_suffix(f'.{ext}')
+
+
+def parse_doc_types(value):
+    """Parse a --docs value ("00_meta,10_business" or "all")."""
+    if value == 'all':
+        return tuple(DOC_TYPES)
+    doc_types = tuple(v.strip() for v in value.split(',') if v.strip())
+    unknown = [d for d in doc_types if d not in DOC_TYPES]
+    if unknown:
+        raise ValueError(f"unknown document type(s): {', '.join(unknown)}")
+    return doc_types
@@ -0,0 +1,89 @@
+"""Reproducible output: identical input -> identical bytes.
+
+Enabled by ``--reproducible`` (``DOCGEN_REPRODUCIBLE``, inherited by worker
+processes) or by the standard ``SOURCE_DATE_EPOCH``. Every timestamp an
+output carries is then ``SOURCE_DATE_EPOCH``, or 2000-01-01T00:00:00Z
+(reportlab's invariant date) when only the flag is given:
+
+- PDF: reportlab's invariant mode fixes the creation/modification dates
+  and derives the document ID from the content instead of the clock;
+- PPTX/DOCX: the core properties (created, modified, revision) are stamped
+  and the zip is rewritten with fixed entry dates and attributes,
+  ``[Content_Types].xml`` first and the other entries sorted by name;
+- HTML carries no timestamps and is always reproducible.
+
+Outputs of the same input can then be compared by hash, so an artifact
+store can dedupe them and uploads can skip unchanged documents.
+"""
+
+import io
+import os
+import zipfile
+from datetime import datetime, timezone
+
+ENV_VAR = 'DOCGEN_REPRODUCIBLE'
+DEFAULT_EPOCH = 946684800  # 2000-01-01T00:00:00Z
+CONTENT_TYPES = '[Content_Types].xml'
+ZIP_MIN_DATE = (1980, 1, 1, 0, 0, 0)
+
+
+def enabled():
+    return bool(os.environ.get(ENV_VAR) or os.environ.get('SOURCE_DATE_EPOCH', '').strip())
+
+
+def epoch():
+    """Timestamp (seconds) written into outputs in reproducible mode."""
+    try:
+        return int(os.environ.get('SOURCE_DATE_EPOCH', '').strip())
+    except ValueError:
+        return DEFAULT_EPOCH
+
+
+def timestamp():
+    """``epoch()`` as a naive UTC datetime (what python-pptx/python-docx expect)."""
+    return datetime.fromtimestamp(epoch(), timezone.utc).replace(tzinfo=None)
+
+
+def fingerprint():
+    """Part of the build-manifest key: outputs differ between the modes."""
+    return f'reproducible:{epoch()}' if enabled() else 'timestamped'
+
+
+def stamp_core_properties(properties):
+    """Fix the dates and revision of an OPC package's core properties."""
+    when = timestamp()
+    properties.created = when
+    properties.modified = when
+    properties.revision = 1
+
+
+def _entry_order(name):
+    return (name != CONTENT_TYPES, name)
+
+
+def rewrite_zip(data, target):
+    """Copy zip ``data`` to ``target`` (path or binary stream) with normalized entries."""
+    date_time = max(timestamp().timetuple()[:6], ZIP_MIN_DATE)
+    with zipfile.ZipFile(io.BytesIO(data)) as source, \
+            zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED) as out:
+        for name in sorted(source.namelist(), key=_entry_order):
+            info = zipfile.ZipInfo(name, date_time)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.create_system = 3          # the same on every build host
+            info.external_attr = 0o644 << 16
+            out.writestr(info, source.read(name))
+
+
+def save_package(package, target):
+    """``package.save(target)`` for a python-pptx Presentation or python-docx Document.
+
+    In reproducible mode the core properties are stamped and the zip is
+    normalized; otherwise the package is saved as is.
+    """
+    if not enabled():
+        package.save(target)
+        return
+    stamp_core_properties(package.core_properties)
+    buffer = io.BytesIO()
+    package.save(buffer)
+    rewrite_zip(buffer.getvalue(), target)
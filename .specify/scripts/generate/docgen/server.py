@@ -0,0 +1,292 @@
+"""Local HTTP render service with warm backends and an LRU output cache.
+
+    python3 -m docgen.server --port 8765 --workers 4
+
+Endpoints (127.0.0.1 only by default):
+
+- ``GET /render/<pdf|pptx|docx|html>/<###-NAME>/<doc_type>``: render a project
+  document from the project root, e.g. ``/render/pdf/001-RISK-AML/00_meta``
+- ``POST /render/<pdf|pptx|docx|html>``: render the Markdown request body
+- ``GET /stats``: cache and request counters (JSON)
+- ``GET /health``
+
+Rendering runs in a process pool whose workers load fonts, styles and every
+installed backend once. Outputs are cached in memory under a SHA-256 of the
+format, the generator key and the Markdown bytes, bounded by ``--cache-mb`` and
+evicted least recently used first. Concurrent requests for the same key
+share one render. The ``X-Docgen-Cache`` response header says which path a
+request took (hit, miss, coalesced). An output rendered with warnings
+(``batch.warn``, e.g. a Mermaid diagram left out) is served with
+``X-Docgen-Warnings: <count>`` but not cached, so the next request renders
+it again.
+
+The service stays on this host: Mermaid diagrams missing from the diagram
+cache are not rendered, because the renderer (``docgen/mermaid.py``) sends
+their source to mermaid.ink. Diagrams already cached by a batch run are
+still drawn. ``--mermaid`` lets the workers render misses.
+
+Only the standard library is used: asyncio streams with a minimal
+HTTP/1.1 implementation (keep-alive, Content-Length bodies).
+"""
+
+import argparse
+import asyncio
+import hashlib
+import io
+import json
+import os
+import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
+from pathlib import Path
+from urllib.parse import quote, unquote, urlsplit
+
+from . import batch, mermaid
+from .cli import BACKENDS, LazyInit, generator_key, is_available
+from .parser import parse_markdown
+from .projects import DOC_TYPES, PROJECT_DIR_RE, PROJECT_ROOT, document_path
+
+MAX_BODY = 8 * 1024 * 1024
+
+CONTENT_TYPES = {
+    'pdf': 'application/pdf',
+    'pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'html': 'text/html; charset=utf-8',
+}
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+
+def _warm_worker(render_mermaid=False):
+    if not render_mermaid:
+        os.environ['DOCGEN_MERMAID'] = 'off'  # no diagram source leaves the host
+    for backend in BACKENDS.values():
+        if is_available(backend):
+            LazyInit(backend.module)()
+
+
+def render_bytes(fmt, text, source=''):
+    """Render Markdown text in this process; returns the output bytes and the job's warnings."""
+    module = import_module(f'{__package__}.{BACKENDS[fmt].module}')
+    batch._job_warnings.clear()
+    mermaid.new_run()  # a diagram that failed for an earlier request is tried again
+    doc = parse_markdown(text, source=source)
+    buffer = io.BytesIO()
+    getattr(module, f'render_{fmt}')(doc, buffer)
+    return buffer.getvalue(), list(batch._job_warnings)
+
+
+def content_disposition(name):
+    """Attachment header for a file name; non-ASCII names as RFC 6266 ``filename*``."""
+    fallback = ''.join(ch if ' ' <= ch < '\x7f' and ch not in '"\\' else '_' for ch in name)
+    if fallback == name:
+        return f'attachment; filename="{name}"'
+    return f'attachment; filename="{fallback}"; filename*=UTF-8\'\'{quote(name, safe="")}'
+
+
+class LRUCache:
+    """Byte-bounded least-recently-used cache of rendered outputs."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._items = OrderedDict()
+
+    def get(self, key):
+        data = self._items.get(key)
+        if data is not None:
+            self._items.move_to_end(key)
+        return data
+
+    def put(self, key, data):
+        if len(data) > self.max_bytes:
+            return
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.size -= len(old)
+        self._items[key] = data
+        self.size += len(data)
+        while self.size > self.max_bytes:
+            _, evicted = self._items.popitem(last=False)
+            self.size -= len(evicted)
+
+    def __len__(self):
+        return len(self._items)
+
+
+class RenderService:
+    def __init__(self, workers, cache_bytes, project_root=PROJECT_ROOT, render_mermaid=False):
+        self.project_root = Path(project_root)
+        self.pool = ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker,
+                                        initargs=(render_mermaid,))
+        self.cache = LRUCache(cache_bytes)
+        self.inflight = {}
+        self.keys = {fmt: generator_key(backend) for fmt, backend in BACKENDS.items() if is_available(backend)}
+        self.stats = {'requests': 0, 'hits': 0, 'misses': 0, 'coalesced': 0, 'errors': 0, 'warnings': 0}
+
+    def cache_key(self, fmt, data):
+        h = hashlib.sha256(f'{fmt}\0{self.keys[fmt]}\0'.encode())
+        h.update(data)
+        return h.hexdigest()
+
+    async def render(self, fmt, data, source=''):
+        """(output bytes, cache status, cache key, warnings) for Markdown bytes."""
+        key = self.cache_key(fmt, data)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.stats['hits'] += 1
+            return cached, 'hit', key, []
+
+        task = self.inflight.get(key)
+        if task is not None:
+            self.stats['coalesced'] += 1
+            output, warnings = await asyncio.shield(task)
+            return output, 'coalesced', key, warnings
+
+        self.stats['misses'] += 1
+        loop = asyncio.get_running_loop()
+        task = loop.run_in_executor(self.pool, render_bytes, fmt, data.decode('utf-8'), source)
+        self.inflight[key] = task
+        try:
+            output, warnings = await asyncio.shield(task)
+        finally:
+            self.inflight.pop(key, None)
+        if warnings:
+            # Degraded output: served, but rendered again next time
+            self.stats['warnings'] += 1
+            for message in warnings:
+                print(f"Warning: {source or 'request body'}: {message}", file=sys.stderr)
+        else:
+            self.cache.put(key, output)
+        return output, 'miss', key, warnings
+
+    def project_document(self, project, doc_type):
+        if not PROJECT_DIR_RE.match(project) or '/' in project or doc_type not in DOC_TYPES:
+            return None
+        path = document_path(self.project_root / project, doc_type)
+        return path if path.is_file() else None
+
+    async def dispatch(self, method, target, body):
+        """(status, content type, payload, extra headers) for one request."""
+        parts = [unquote(p) for p in urlsplit(target).path.split('/') if p]
+        if parts == ['health']:
+            return 200, 'text/plain', b'ok', {}
+        if parts == ['stats']:
+            payload = dict(self.stats, cached_documents=len(self.cache), cache_bytes=self.cache.size,
+                           cache_limit=self.cache.max_bytes, inflight=len(self.inflight))
+            return 200, 'application/json', json.dumps(payload).encode(), {}
+        if len(parts) < 2 or parts[0] != 'render' or parts[1] not in self.keys:
+            return 404, 'text/plain', b'not found', {}
+
+        fmt = parts[1]
+        if method == 'POST' and len(parts) == 2:
+            data, source, name = body, '', f'document.{fmt}'
+        elif method == 'GET' and len(parts) == 4:
+            path = self.project_document(parts[2], parts[3])
+            if path is None:
+                return 404, 'text/plain', b'no such project document', {}
+            data, source, name = path.read_bytes(), str(path), f'{parts[2]}-{parts[3]}.{fmt}'
+        else:
+            return 405 if len(parts) in (2, 4) else 404, 'text/plain', b'unsupported request', {}
+
+        try:
+            output, status, key, warnings = await self.render(fmt, data, source)
+        except UnicodeDecodeError:
+            return 400, 'text/plain', b'body must be UTF-8 Markdown', {}
+        except Exception as e:
+            self.stats['errors'] += 1
+            return 500, 'text/plain', f'{type(e).__name__}: {e}'.encode(), {}
+        headers = {
+            'X-Docgen-Cache': status,
+            'ETag': f'"{key[:32]}"',
+            'Content-Disposition': content_disposition(name),
+        }
+        if warnings:
+            headers['X-Docgen-Warnings'] = str(len(warnings))
+        return 200, CONTENT_TYPES[fmt], output, headers
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                    length = int(headers.get('content-length') or 0)
+                except ValueError:
+                    await self.respond(writer, 400, 'text/plain', b'malformed request', {}, keep_alive=False)
+                    break
+                if length > MAX_BODY:
+                    await self.respond(writer, 413, 'text/plain', b'body too large', {}, keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                self.stats['requests'] += 1
+                status, content_type, payload, extra = await self.dispatch(method, target, body)
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                await self.respond(writer, status, content_type, payload, extra, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, writer, status, content_type, payload, extra, keep_alive):
+        head = [f'HTTP/1.1 {status} {REASONS.get(status, "")}',
+                f'Content-Type: {content_type}',
+                f'Content-Length: {len(payload)}',
+                f'Connection: {"keep-alive" if keep_alive else "close"}']
+        head += [f'{name}: {value}' for name, value in extra.items()]
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + payload)
+        await writer.drain()
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+
+async def serve(host, port, workers, cache_bytes, project_root, render_mermaid=False):
+    service = RenderService(workers, cache_bytes, project_root, render_mermaid)
+    server = await asyncio.start_server(service.handle, host, port)
+    print(f"docgen render service on http://{host}:{port} "
+          f"({workers} workers, {cache_bytes // (1024 * 1024)} MB cache)", flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local PDF/PPTX render service")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port (default: 8765)")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="Render worker processes (default: one per CPU core)")
+    parser.add_argument("--cache-mb", type=int, default=256, help="Output cache size in MB (default: 256)")
+    parser.add_argument("--project-root", default=str(PROJECT_ROOT),
+                        help="Projects served by GET /render (default: project/)")
+    parser.add_argument("--mermaid", action="store_true",
+                        help="Render Mermaid diagrams missing from the cache (sends their source to mermaid.ink)")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, max(1, args.workers), args.cache_mb * 1024 * 1024,
+                          args.project_root, args.mermaid))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""Banking theme shared by the PDF, PPTX, DOCX and HTML generators.
+
+One palette and one set of font sizes (the Python counterpart of
+``PPTX_DESIGN``/``DOCX_DESIGN`` in ``shared/config.js``), plus a style
+registry that builds reportlab ``ParagraphStyle``/``TableStyle`` objects once
+per process and hands the same instances to every document in a batch.
+Changing a colour here changes it in every output.
+"""
+
+from functools import lru_cache
+
+# Banking/Professional theme (hex RGB)
+PALETTE = {
+    'primary': '2E5090',      # Dark Blue - titles, title bar
+    'secondary': '4472C4',    # Medium Blue - subtitles, h2
+    'accent': '5B9BD5',       # Light Blue - h3
+    'text': '333333',         # Dark Gray body text
+    'background': 'F5F5F5',   # Light Gray
+    'header_fill': 'D5E8F0',  # Table header / key column
+    'grid': 'CCCCCC',         # Table grid lines
+    'white': 'FFFFFF',
+    'black': '000000',
+}
+
+PPTX_FONT_SIZES = {
+    'title': 44,
+    'subtitle': 24,
+    'slide_title': 32,
+    'body': 16,
+    'table_header': 14,
+    'table_body': 12,
+}
+
+# Point sizes of the page-based outputs (PDF, DOCX, HTML)
+DOCUMENT_FONT_SIZES = {
+    'title': 24,
+    'h1': 18,
+    'h2': 14,
+    'h3': 12,
+    'body': 10,
+    'cell': 9,
+    'code': 8,
+}
+
+
+def heading_style(level):
+    """Style name for a Markdown heading level: "##" -> 'h1', "###" -> 'h2', deeper -> 'h3'."""
+    return {2: 'h1', 3: 'h2'}.get(level, 'h3')
+
+
+@lru_cache(maxsize=None)
+def pptx_color(name):
+    """python-pptx RGBColor for a palette entry."""
+    from pptx.dml.color import RGBColor
+    return RGBColor.from_string(PALETTE[name])
+
+
+@lru_cache(maxsize=None)
+def pdf_color(name):
+    """reportlab Color for a palette entry."""
+    from reportlab.lib import colors
+    return colors.HexColor('#' + PALETTE[name])
+
+
+class PdfStyles:
+    """Paragraph and table styles for one (regular, bold) font pair."""
+
+    def __init__(self, font, bold_font):
+        from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT
+        from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+
+        sizes = DOCUMENT_FONT_SIZES
+        self.font = font
+        self.bold_font = bold_font
+        self._tables = {}
+        base = getSampleStyleSheet()
+
+        self.title = ParagraphStyle(
+            'CustomTitle', parent=base['Heading1'], fontName=bold_font, fontSize=sizes['title'],
+            textColor=pdf_color('primary'), spaceAfter=20, alignment=TA_CENTER, leading=30)
+        self.h1 = ParagraphStyle(
+            'CustomHeading1', parent=base['Heading1'], fontName=bold_font, fontSize=sizes['h1'],
+            textColor=pdf_color('primary'), spaceAfter=12, spaceBefore=24, leading=22)
+        self.h2 = ParagraphStyle(
+            'CustomHeading2', parent=base['Heading2'], fontName=bold_font, fontSize=sizes['h2'],
+            textColor=pdf_color('secondary'), spaceAfter=10, spaceBefore=18, leading=18)
+        self.h3 = ParagraphStyle(
+            'CustomHeading3', parent=base['Heading3'], fontName=bold_font, fontSize=sizes['h3'],
+            textColor=pdf_color('accent'), spaceAfter=8, spaceBefore=12, leading=16)
+        self.normal = ParagraphStyle(
+            'CustomNormal', parent=base['Normal'], fontName=font, fontSize=sizes['body'], leading=14,
+            alignment=TA_JUSTIFY)
+        self.bullet = ParagraphStyle(
+            'CustomBullet', parent=self.normal, leftIndent=20, bulletIndent=10, spaceAfter=6)
+        self.nested_bullet = ParagraphStyle(
+            'CustomNestedBullet', parent=self.bullet, leftIndent=40, bulletIndent=30, spaceAfter=4)
+        self.code = ParagraphStyle(
+            'CustomCode', parent=self.normal, fontSize=sizes['code'], leading=10, alignment=TA_LEFT)
+        # Table cells are Paragraphs so long text wraps
+        self.cell = ParagraphStyle(
+            'CustomCell', parent=self.normal, fontSize=sizes['cell'], leading=12, alignment=TA_LEFT)
+        self.header_cell = ParagraphStyle(
+            'CustomHeaderCell', parent=self.cell, fontName=bold_font, alignment=TA_CENTER)
+        # Table of contents entries: "##" sections bold, "###" sections indented
+        self.toc = (
+            ParagraphStyle('CustomTOC1', parent=self.normal, fontName=bold_font, alignment=TA_LEFT,
+                           spaceBefore=6),
+            ParagraphStyle('CustomTOC2', parent=self.normal, alignment=TA_LEFT, leftIndent=16),
+        )
+
+    def heading(self, level):
+        """Style for a Markdown heading level ("##" = 2)."""
+        return getattr(self, heading_style(level))
+
+    def table(self, kind, font_size=9, padding=6, valign='MIDDLE'):
+        """Shared TableStyle: 'header_row', 'key_column' or 'grid'."""
+        key = (kind, font_size, padding, valign)
+        style = self._tables.get(key)
+        if style is None:
+            style = self._tables[key] = self._build_table(*key)
+        return style
+
+    def _build_table(self, kind, font_size, padding, valign):
+        from reportlab.lib import colors
+        from reportlab.platypus import TableStyle
+
+        commands = [
+            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+            ('FONTNAME', (0, 0), (-1, -1), self.font),
+            ('FONTSIZE', (0, 0), (-1, -1), font_size),
+            ('GRID', (0, 0), (-1, -1), 0.5, pdf_color('grid')),
+            ('VALIGN', (0, 0), (-1, -1), valign),
+            ('TOPPADDING', (0, 0), (-1, -1), padding),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), padding),
+        ]
+        if kind == 'header_row':
+            commands += [
+                ('BACKGROUND', (0, 0), (-1, 0), pdf_color('header_fill')),
+                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+                ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
+                ('FONTNAME', (0, 0), (-1, 0), self.bold_font),
+            ]
+        elif kind == 'key_column':
+            commands += [
+                ('BACKGROUND', (0, 0), (0, -1), pdf_color('header_fill')),
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('FONTNAME', (0, 0), (0, -1), self.bold_font),
+            ]
+        elif kind == 'grid':
+            commands.append(('ALIGN', (0, 0), (-1, -1), 'LEFT'))
+        else:
+            raise ValueError(f'unknown table style: {kind}')
+        return TableStyle(commands)
+
+
+@lru_cache(maxsize=None)
+def pdf_styles(font, bold_font):
+    """Style registry for a font pair, built once per process."""
+    return PdfStyles(font, bold_font)
@@ -0,0 +1,250 @@
+"""Check every project's spec documents before anything is rendered.
+
+    python3 -m docgen.validate                        # every document of every project under project/
+    python3 -m docgen.validate --docs 00_meta --json  # structured issues for CI
+    python3 -m docgen.validate project/001-NAME/meta/00_meta.md
+
+Broken inputs otherwise show up only after the render, as a reportlab
+exception or a garbled slide. Each document is compared with its template
+in ``.specify/templates`` (``<doc_type>-template.md``, parsed once):
+
+- ``missing-document``: a project without ``meta/00_meta.md``;
+- ``missing-section``: a ``##`` section of the template is absent (an
+  error in 00_meta, which the metadata index and portfolio read, a warning
+  elsewhere);
+- ``missing-field``: 00_meta has no 專案代號 or 專案名稱 (or only a placeholder);
+- ``ragged-row``: table rows with more or fewer cells than the header, so
+  columns shift or the PDF and PPTX tables get an extra unlabelled column;
+- ``table-columns`` (warning): a table of a template section lacks columns
+  that the template's table with the same first column has;
+- ``unsupported-glyph``: characters the PDF font (``docgen/fonts.py``) has
+  no glyph for, which the PDF draws as empty boxes;
+- ``no-cjk-font``: no CJK font is found at all, so the PDF would fall back
+  to Helvetica and draw every Chinese character as an empty box (skip the
+  glyph checks with ``--no-glyphs``).
+
+Documents are read through the parse cache (``docgen/modelcache.py``) and
+the font's character map comes from the cached font face, so hundreds of
+projects are checked in a fraction of a second. The exit status is 1 when
+there are errors (with ``--strict``, warnings too).
+"""
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from .fonts import find_fonts, font_coverage
+from .metadata import clean
+from .model import BulletList, CodeBlock, Paragraph, Table
+from .modelcache import load_document
+from .parser import strip_inline
+from .projects import (DOC_TYPES, PROJECT_ROOT, TEMPLATE_DIR, document_path, find_projects,
+                       parse_doc_types)
+
+ERROR = 'error'
+WARNING = 'warning'
+
+# Documents whose missing sections are errors: other tools read their fields
+STRICT_DOC_TYPES = ('00_meta',)
+REQUIRED_FIELDS = ('專案代號', '專案名稱')
+MAX_LISTED = 5  # rows or characters named in one message
+
+
+@dataclass(slots=True)
+class Issue:
+    source: str
+    severity: str   # ERROR or WARNING
+    code: str       # e.g. 'ragged-row'
+    message: str
+    section: str = ''
+
+    def __str__(self):
+        where = f' {self.section}:' if self.section else ''
+        return f'{self.source}: {self.severity} [{self.code}]{where} {self.message}'
+
+
+@dataclass(slots=True)
+class Schema:
+    sections: tuple  # "##" titles, in template order
+    tables: dict     # section title -> [table headers] in that section
+
+
+def _headers(table):
+    return _header_text(tuple(table.headers))
+
+
+@lru_cache(maxsize=4096)
+def _header_text(headers):
+    # Most tables repeat a template's header row, so each is stripped once
+    return [strip_inline(h).strip() for h in headers]
+
+
+@lru_cache(maxsize=None)
+def template_schema(doc_type):
+    """Sections and table shapes of ``<doc_type>-template.md`` (None without a template)."""
+    path = TEMPLATE_DIR / f'{doc_type}-template.md'
+    if not path.is_file():
+        return None
+    template = load_document(path)
+    tables = {}
+    for section in template.sections:
+        for block in section.blocks:
+            if isinstance(block, Table):
+                tables.setdefault(section.title, []).append(_headers(block))
+    return Schema(tuple(s.title for s in template.sections if s.level == 2 and s.title), tables)
+
+
+def _section_text(section):
+    """Everything the PDF draws with the document font (Mermaid sources are not)."""
+    parts = [section.title]
+    for block in section.blocks:
+        if isinstance(block, Paragraph):
+            parts.append(block.text)
+        elif isinstance(block, BulletList):
+            parts.extend(item.text for item in block.items)
+        elif isinstance(block, Table):
+            parts.extend(block.headers)
+            parts.extend(cell for row in block.rows for cell in row)
+        elif isinstance(block, CodeBlock) and block.language != 'mermaid':
+            parts.append(block.source)
+    return ''.join(parts)
+
+
+def _char_list(chars):
+    listed = ', '.join(f"'{ch}' U+{ord(ch):04X}" for ch in chars[:MAX_LISTED])
+    return listed + (f' and {len(chars) - MAX_LISTED} more' if len(chars) > MAX_LISTED else '')
+
+
+def check_glyphs(doc, coverage):
+    """Characters of doc outside ``coverage``, as one issue at the first section using them."""
+    texts = [('', doc.title + ''.join(doc.meta.values()))]
+    texts += [(section.title, _section_text(section)) for section in doc.sections]
+    missing = set(''.join(text for _, text in texts)) - coverage
+    missing = sorted(ch for ch in missing if ch.isprintable() and not ch.isspace())
+    if not missing:
+        return []
+    first = next(title for title, text in texts if any(ch in text for ch in missing))
+    return [Issue(doc.source, ERROR, 'unsupported-glyph',
+                  f'no glyph in the PDF font for {_char_list(missing)}', first)]
+
+
+def check_tables(doc, schema):
+    issues = []
+    for section in doc.sections:
+        expected = schema.tables.get(section.title, ()) if schema else ()
+        for block in section.blocks:
+            if not isinstance(block, Table):
+                continue
+            headers = _headers(block)
+            ncols = len(headers)
+            ragged = [(n, len(row)) for n, row in enumerate(block.rows, 1) if len(row) != ncols]
+            if ragged:
+                rows = ', '.join(f'row {n} has {count}' for n, count in ragged[:MAX_LISTED])
+                more = f' (+{len(ragged) - MAX_LISTED} more rows)' if len(ragged) > MAX_LISTED else ''
+                issues.append(Issue(doc.source, ERROR, 'ragged-row',
+                                    f'table "{" | ".join(headers)}" has {ncols} columns; {rows} cells{more}',
+                                    section.title))
+            for template_headers in expected:
+                if template_headers and headers and template_headers[0] == headers[0]:
+                    missing = [h for h in template_headers if h not in headers]
+                    if missing:
+                        issues.append(Issue(doc.source, WARNING, 'table-columns',
+                                            f'table "{headers[0]}" lacks template column(s) {", ".join(missing)}',
+                                            section.title))
+                    break
+    return issues
+
+
+def check_structure(doc, doc_type, schema):
+    issues = []
+    if schema:
+        present = {section.title for section in doc.sections if section.level == 2}
+        severity = ERROR if doc_type in STRICT_DOC_TYPES else WARNING
+        issues.extend(Issue(doc.source, severity, 'missing-section', f'template section "## {title}" is missing')
+                      for title in schema.sections if title not in present)
+    if doc_type == '00_meta':
+        issues.extend(Issue(doc.source, ERROR, 'missing-field', f'"**{key}**:" is missing or a placeholder')
+                      for key in REQUIRED_FIELDS if not clean(doc.lookup(key)))
+    return issues
+
+
+def validate_document(source, doc_type=None, coverage=None):
+    """Issues of one Markdown document; doc_type defaults to the file name ("00_meta")."""
+    source = Path(source)
+    doc_type = doc_type or source.stem
+    try:
+        doc = load_document(source)
+    except (OSError, UnicodeDecodeError) as e:
+        return [Issue(str(source), ERROR, 'unreadable', f'{type(e).__name__}: {e}')]
+    schema = template_schema(doc_type)
+    issues = check_structure(doc, doc_type, schema) + check_tables(doc, schema)
+    if coverage is not None:
+        issues += check_glyphs(doc, coverage)
+    return issues
+
+
+def validate_projects(root=PROJECT_ROOT, doc_types=tuple(DOC_TYPES), coverage=None):
+    """Issues of every project under root and the number of documents checked."""
+    issues, checked = [], 0
+    for project_dir in find_projects(root):
+        meta = document_path(project_dir, '00_meta')
+        if not meta.is_file():
+            issues.append(Issue(str(meta), ERROR, 'missing-document', 'the project has no 00_meta document'))
+        for doc_type in doc_types:
+            source = document_path(project_dir, doc_type)
+            if source.is_file():
+                issues.extend(validate_document(source, doc_type, coverage))
+                checked += 1
+    return issues, checked
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Check spec documents against the .specify/templates sections and table shapes before rendering")
+    parser.add_argument("sources", nargs="*", help="Markdown files to check (default: every project under --root)")
+    parser.add_argument("--root", default=str(PROJECT_ROOT), help="Project root (default: project/)")
+    parser.add_argument("--docs", default="all", help="Document types, e.g. 00_meta,10_business or all (default: all)")
+    parser.add_argument("--no-glyphs", action="store_true", help="Skip the font coverage check")
+    parser.add_argument("--strict", action="store_true", help="Fail on warnings too")
+    parser.add_argument("--json", action="store_true", help="Print issues as JSON")
+    args = parser.parse_args(argv)
+    try:
+        doc_types = parse_doc_types(args.docs)
+    except ValueError as e:
+        parser.error(str(e))
+
+    start = time.perf_counter()
+    coverage, issues = None, []
+    if not args.no_glyphs:
+        coverage = font_coverage()
+        if coverage is None:
+            issues.append(Issue('PDF font', ERROR, 'no-cjk-font',
+                                'no CJK font found (set DOCGEN_FONT or DOCGEN_FONT_DIRS); the PDF would use '
+                                'Helvetica and draw Chinese text as empty boxes, so glyphs were not checked'))
+    if args.sources:
+        issues += [issue for source in args.sources for issue in validate_document(source, coverage=coverage)]
+        checked = len(args.sources)
+    else:
+        project_issues, checked = validate_projects(args.root, doc_types, coverage)
+        issues += project_issues
+    elapsed = (time.perf_counter() - start) * 1000
+
+    if args.json:
+        print(json.dumps([asdict(issue) for issue in issues], ensure_ascii=False, indent=2))
+    else:
+        for issue in issues:
+            print(issue)
+    errors = sum(issue.severity == ERROR for issue in issues)
+    warnings = len(issues) - errors
+    font = f" against {Path(find_fonts()[0][0]).name}" if coverage is not None else ''
+    print(f"Checked {checked} document(s){font}: {errors} error(s), {warnings} warning(s) ({elapsed:.0f} ms)",
+          file=sys.stderr)
+    return 1 if errors or (args.strict and warnings) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,179 @@
+"""``--watch``: keep a warm process and re-render documents as they are edited.
+
+Fonts, styles, the slide template and the rendering backends are loaded
+once. File changes are collected until the tree has been quiet for the
+debounce interval, then only the jobs whose source changed are considered,
+and each format's build manifest decides which of those outputs are really
+stale (an editor touching a file without changing it renders nothing).
+
+Change notification uses watchdog (inotify on Linux, FSEvents on macOS)
+when it is installed and falls back to polling file mtimes otherwise.
+"""
+
+import copy
+import os
+import queue
+import sys
+import time
+from datetime import datetime
+
+from . import mermaid
+from .batch import collect_jobs, run_batch, run_formats
+
+POLL_INTERVAL = 0.25
+
+
+def _resolve(path):
+    return os.path.realpath(path)
+
+
+class PollingWatcher:
+    """Stats the watched files every ``interval`` seconds."""
+
+    def __init__(self, paths, interval=POLL_INTERVAL):
+        self._paths = paths
+        self._interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self):
+        snapshot = {}
+        for path in self._paths():
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            snapshot[path] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def wait(self, timeout=None):
+        """Changed paths, or an empty set if nothing changed within timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = self._interval if deadline is None else deadline - time.monotonic()
+            time.sleep(max(0.0, min(self._interval, remaining)))
+            snapshot = self._scan()
+            changed = {p for p, state in snapshot.items() if self._snapshot.get(p) != state}
+            self._snapshot = snapshot
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self):
+        pass
+
+
+class EventWatcher:
+    """watchdog observer feeding changed Markdown paths into a queue."""
+
+    def __init__(self, directories):
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+
+        events = self._events = queue.Queue()
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory:
+                    return
+                for path in (event.src_path, getattr(event, 'dest_path', '')):
+                    if path and path.endswith('.md'):
+                        events.put(_resolve(path))
+
+        self._observer = Observer()
+        for directory, recursive in directories:
+            self._observer.schedule(Handler(), str(directory), recursive=recursive)
+        self._observer.start()
+
+    def wait(self, timeout=None):
+        try:
+            changed = {self._events.get(timeout=timeout)}
+        except queue.Empty:
+            return set()
+        while True:
+            try:
+                changed.add(self._events.get_nowait())
+            except queue.Empty:
+                return changed
+
+    def close(self):
+        self._observer.stop()
+        self._observer.join()
+
+
+def _watched_directories(args):
+    """(directory, recursive) pairs covering --batch and the explicit sources."""
+    directories = {}
+    if args.batch:
+        directories[_resolve(args.batch)] = True
+    for source in args.sources:
+        directories.setdefault(os.path.dirname(_resolve(source)), False)
+    return sorted(directories.items())
+
+
+def _make_watcher(args, sources):
+    try:
+        return EventWatcher(_watched_directories(args))
+    except ImportError:
+        print("watchdog not installed; polling for changes "
+              f"every {POLL_INTERVAL}s (pip install watchdog for inotify)", file=sys.stderr)
+        return PollingWatcher(sources)
+
+
+def _debounced(watcher, debounce):
+    """Block until something changes, then until the tree is quiet for debounce seconds."""
+    changed = watcher.wait()
+    while True:
+        more = watcher.wait(timeout=debounce)
+        if not more:
+            return changed
+        changed |= more
+
+
+def watch(parser, args, targets, debounce=0.2):
+    """Build once, then rebuild on change until interrupted.
+
+    ``targets`` is a list of (backend, generator_key, render, initializer)
+    tuples, one per output format. The first pass is the same as without
+    ``--watch`` (including ``--report``); rebuilds only print their results.
+    """
+    for *_, initializer in targets:
+        if initializer:
+            initializer()  # warm this process even if the first pass runs in workers
+    if len(targets) > 1:
+        status = run_formats(parser, args, targets)
+    else:
+        backend, key, render, initializer = targets[0]
+        status = run_batch(parser, args, backend.ext, render, backend.label, key, initializer=initializer)
+
+    # Edits are rendered in this (warm) process, never in a fresh pool
+    cycle_args = copy.copy(args)
+    cycle_args.jobs = 1
+    cycle_args.report = None
+
+    def sources():
+        found = set()
+        for backend, *_ in targets:
+            jobs = collect_jobs(parser, args, backend.ext, allow_empty=True)
+            found.update(_resolve(source) for source, _ in jobs)
+        return found
+
+    watcher = _make_watcher(args, sources)
+    print(f"Watching for changes (debounce {debounce:.2f}s, Ctrl-C to stop)", flush=True)
+    try:
+        while True:
+            changed = _debounced(watcher, debounce)
+            start = time.perf_counter()
+            rendered = False
+            mermaid.new_run()  # diagrams that failed before are tried again
+            for backend, key, render, _ in targets:
+                jobs = collect_jobs(parser, cycle_args, backend.ext, allow_empty=True)
+                jobs = [(source, output) for source, output in jobs if _resolve(source) in changed]
+                if jobs:
+                    rendered = True
+                    run_batch(parser, cycle_args, backend.ext, render, backend.label, key, jobs=jobs)
+            if rendered:
+                print(f"[{datetime.now():%H:%M:%S}] {len(changed)} file(s) changed, "
+                      f"done in {(time.perf_counter() - start) * 1000:.0f} ms", flush=True)
+    except KeyboardInterrupt:
+        return status
+    finally:
+        watcher.close()
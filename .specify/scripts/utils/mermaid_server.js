@@ -0,0 +1,62 @@
+#!/usr/bin/env node
+/**
+ * Long-lived Mermaid render worker for the Python generators (docgen/mermaid.py).
+ *
+ * One process serves every cache miss of a generator run instead of one
+ * process per diagram. Requests and responses are JSON lines:
+ *
+ *   stdin:  {"id": 1, "code": "graph TD; A-->B", "output": "/abs/path/key.tmp123.png"}
+ *   stdout: {"id": 1, "ok": true} | {"id": 1, "ok": false, "error": "..."}
+ *
+ * Up to MERMAID_CONCURRENCY (default 4) diagrams render at once; responses
+ * arrive in completion order. Rendering itself is MermaidRenderer's.
+ */
+const path = require('path');
+const readline = require('readline');
+const MermaidRenderer = require('./mermaid_renderer');
+
+const concurrency = Math.max(1, parseInt(process.env.MERMAID_CONCURRENCY || '4', 10));
+
+// stdout carries the protocol; route the renderer's progress logging to stderr
+const write = process.stdout.write.bind(process.stdout);
+console.log = process.env.MERMAID_DEBUG ? (...args) => console.error(...args) : () => { };
+
+const renderers = new Map();
+function rendererFor(outputDir) {
+    if (!renderers.has(outputDir)) {
+        renderers.set(outputDir, new MermaidRenderer({ outputDir, imageFormat: 'png' }));
+    }
+    return renderers.get(outputDir);
+}
+
+const pending = [];
+let active = 0;
+
+function pump() {
+    while (active < concurrency && pending.length) {
+        const request = pending.shift();
+        active++;
+        rendererFor(path.dirname(request.output))
+            .renderToImage(request.code, path.basename(request.output))
+            .then(() => ({ id: request.id, ok: true }))
+            .catch((error) => ({ id: request.id, ok: false, error: error.message }))
+            .then((response) => {
+                write(JSON.stringify(response) + '\n');
+                active--;
+                pump();
+            });
+    }
+}
+
+readline.createInterface({ input: process.stdin }).on('line', (line) => {
+    if (!line.trim()) {
+        return;
+    }
+    try {
+        pending.push(JSON.parse(line));
+    } catch (error) {
+        write(JSON.stringify({ id: null, ok: false, error: `bad request: ${error.message}` }) + '\n');
+        return;
+    }
+    pump();
+});